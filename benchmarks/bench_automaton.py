@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+"""Per-step cost of Life on growing grids with the same small activity (a
+few blinkers): the usual iter_grid_2d sweep, the batched Automaton and the
+active-frontier FrontierAutomaton
+
+    $ python benchmarks/bench_automaton.py [steps]
+"""
+
+import sys
+import time
+
+from aochallenge import grid
+from aochallenge.grid.automaton import Automaton, FrontierAutomaton
+
+BLINKERS = 20
+
+
+def area(size: int) -> list[list[bool]]:
+    cells = [[False] * size for _ in range(size)]
+    for i in range(BLINKERS):
+        x, y = 5 + i * 7 % (size - 10), 5 + i * 11 % (size - 10)
+        for dx in range(3):
+            cells[y][x + dx] = True
+    return cells
+
+
+def naive_step(cells):
+    corner = grid.boundaries(cells)
+    new = grid.create_grid(cells, False)
+    for pos, alive in grid.iter_grid(cells):
+        count = sum(
+            grid.get_element(cells, n)
+            for n in grid.bounded_neighbors_full(pos, (0, 0), corner)
+        )
+        grid.set_element(new, pos, count == 3 or alive and count == 2)
+    return new
+
+
+def per_step(steps, func):
+    t0 = time.perf_counter()
+    for _ in range(steps):
+        func()
+    return (time.perf_counter() - t0) / steps * 1000
+
+
+def main(steps: int = 10) -> None:
+    print(f"{BLINKERS} blinkers, ms/step")
+    print(f"  {'size':>6} {'naive':>10} {'Automaton':>10} {'Frontier':>10}")
+    for size in (100, 200, 400, 800):
+        cells = area(size)
+        naive = per_step(1, lambda: naive_step(cells)) if size <= 200 else None
+        auto = Automaton(cells)
+        full = per_step(steps, auto.step)
+        frontier = FrontierAutomaton(cells)
+        frontier.step()  # the first step evaluates every cell
+        incremental = per_step(steps, frontier.step)
+        assert frontier.to_grid() == auto.step().to_grid()
+        naive_text = f"{naive:10.2f}" if naive is not None else f"{'-':>10}"
+        print(f"  {size:>6} {naive_text} {full:10.2f} {incremental:10.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
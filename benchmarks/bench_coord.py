@@ -0,0 +1,104 @@
+#!/usr/bin/python3
+"""Micro-benchmarks of Coord2D/Coord3D against the original implementation
+(isinstance chain and NamedTuple constructor on every operation)
+
+    $ python benchmarks/bench_coord.py
+"""
+
+from __future__ import annotations
+import timeit
+from typing import NamedTuple
+
+from aochallenge.grid import Coord2D, Coord3D
+
+
+class RefCoord2D(NamedTuple):
+    x: int
+    y: int
+
+    def __add__(self, other):
+        if isinstance(other, RefCoord2D):
+            return RefCoord2D(self.x + other.x, self.y + other.y)
+        if isinstance(other, tuple) and len(other) == 2:
+            return RefCoord2D(self.x + other[0], self.y + other[1])
+        if isinstance(other, int):
+            return RefCoord2D(self.x + other, self.y + other)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, RefCoord2D):
+            return RefCoord2D(self.x - other.x, self.y - other.y)
+        if isinstance(other, tuple) and len(other) == 2:
+            return RefCoord2D(self.x - other[0], self.y - other[1])
+        if isinstance(other, int):
+            return RefCoord2D(self.x - other, self.y - other)
+        return NotImplemented
+
+
+class RefCoord3D(NamedTuple):
+    x: int
+    y: int
+    z: int
+
+    def __add__(self, other):
+        if isinstance(other, RefCoord3D):
+            return RefCoord3D(self.x + other.x, self.y + other.y, self.z + other.z)
+        if isinstance(other, tuple) and len(other) == 3:
+            return RefCoord3D(self.x + other[0], self.y + other[1], self.z + other[2])
+        if isinstance(other, int):
+            return RefCoord3D(self.x + other, self.y + other, self.z + other)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, RefCoord3D):
+            return RefCoord3D(self.x - other.x, self.y - other.y, self.z - other.z)
+        if isinstance(other, tuple) and len(other) == 3:
+            return RefCoord3D(self.x - other[0], self.y - other[1], self.z - other[2])
+        if isinstance(other, int):
+            return RefCoord3D(self.x - other, self.y - other, self.z - other)
+        return NotImplemented
+
+
+CASES = {
+    "add coord": "a + b",
+    "add tuple": "a + t",
+    "add int": "a + 1",
+    "sub coord": "a - b",
+    "hash": "hash(a)",
+    "dict lookup": "d[a]",
+}
+
+
+def bench(cls, args, number):
+    namespace = {
+        "a": cls(*args),
+        "b": cls(*args),
+        "t": tuple(args),
+        "d": {cls(*args): 1},
+    }
+    return {
+        name: min(timeit.repeat(stmt, globals=namespace, number=number, repeat=5))
+        / number
+        * 1e9
+        for name, stmt in CASES.items()
+    }
+
+
+def main(number: int = 200_000) -> None:
+    for label, current, reference, args in (
+        ("2D", Coord2D, RefCoord2D, (3, 4)),
+        ("3D", Coord3D, RefCoord3D, (3, 4, 5)),
+    ):
+        new = bench(current, args, number)
+        old = bench(reference, args, number)
+        print(f"{label:<12} {'original':>10} {'current':>10} {'speedup':>8}")
+        for name in CASES:
+            print(
+                f"{name:<12} {old[name]:>8.1f}ns {new[name]:>8.1f}ns"
+                f" {old[name] / new[name]:>7.2f}x"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""Time of save_image on large grids, compared to setting the pixels one by
+one (the previous implementation)
+
+    $ python benchmarks/bench_image.py [max_size]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from aochallenge import grid, save_image
+
+COLORS = {".": 0x000000, "#": 0xFFFFFF, "O": 0xFF8000, "@": 0x2080FF}
+MANY_COLORS = {i: i * 0x010101 % 0x1000000 for i in range(1000)}
+
+
+def per_pixel(filename, cells, colors):
+    img = Image.new("RGB", grid.dimensions(cells))
+    px = img.load()
+    lut = {k: (c >> 16 & 0xFF, c >> 8 & 0xFF, c & 0xFF) for k, c in colors.items()}
+    for pos, v in grid.iter_grid(cells):
+        px[pos.x, pos.y] = lut[v]
+    img.save(filename)
+
+
+def timed(func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def main(max_size: int = 2000) -> None:
+    rng = random.Random(0)
+    filename = os.path.join(tempfile.mkdtemp(), "bench.png")
+    print("seconds")
+    print(f"  {'size':>6} {'per pixel':>10} {'palette':>10} {'rgb':>10} {'scale 4':>10}")
+    size = 250
+    while size <= max_size:
+        cells = ["".join(rng.choices(list(COLORS), k=size)) for _ in range(size)]
+        many = [rng.choices(range(1000), k=size) for _ in range(size)]
+        old = timed(per_pixel, filename, cells, COLORS)
+        palette = timed(save_image, filename, cells, COLORS)
+        rgb = timed(save_image, filename, many, MANY_COLORS)
+        scaled = timed(save_image, filename, cells, COLORS, 4) if size <= 1000 else None
+        scaled_text = f"{scaled:10.3f}" if scaled is not None else f"{'-':>10}"
+        print(f"  {size:>6} {old:10.3f} {palette:10.3f} {rgb:10.3f} {scaled_text}")
+        size *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""Throughput of load() on million-line integer CSVs, against the original
+per-line conversion (zip_longest and type dispatch on every line)
+
+    $ python benchmarks/bench_load.py [lines]
+"""
+
+import gc
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+
+from aochallenge import load, load_iter
+
+
+def reference_load(filename, splitrecords, recordtype):
+    with open(filename) as f:
+        content = f.read().splitlines()
+    for i, row in enumerate(content):
+        content[i] = row.split(splitrecords)
+        content[i] = reference_convert(content[i], recordtype)
+    return content
+
+
+def reference_convert(content, recordtype):
+    if callable(recordtype):
+        return [recordtype(e) for e in content]
+    lastfunc = str
+    newcontent = []
+    for data, func in itertools.zip_longest(content, recordtype):
+        if func is None:
+            func = lastfunc
+        else:
+            lastfunc = func
+        newcontent.append(func(data))
+    return newcontent
+
+
+def timed(label, lines, func, *args, **kwargs):
+    # Without garbage collection (like timeit), the collections triggered by
+    # the results of the earlier runs would dominate
+    gc.collect()
+    gc.disable()
+    try:
+        t0 = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - t0
+    finally:
+        gc.enable()
+    print(f"  {label:<12} {elapsed:7.3f}s {lines / elapsed / 1e6:6.2f} Mlines/s")
+    return result
+
+
+def write_lines(lines: int, fields: int) -> str:
+    rnd = random.Random(42)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for _ in range(lines):
+            f.write(",".join(str(rnd.randrange(-10**6, 10**6)) for _ in range(fields)))
+            f.write("\n")
+    return f.name
+
+
+def main(lines: int = 1_000_000) -> None:
+    files = {fields: write_lines(lines, fields) for fields in (2, 4)}
+    try:
+        for label, recordtype, fields in (
+            ("int", int, 4),
+            ("(str, int)", (str, int), 2),
+            ("(str, int)", (str, int), 4),
+        ):
+            print(f"recordtype={label}, {lines} lines of {fields} fields")
+            filename = files[fields]
+            expected = timed(
+                "original", lines, reference_load, filename, ",", recordtype
+            )
+            result = timed(
+                "load", lines, load, True, ",", recordtype, filename=filename
+            )
+            assert result == expected
+            records = load_iter(",", recordtype, filename=filename)
+            total = timed("load_iter", lines, sum, map(len, records))
+            assert total == fields * lines
+    finally:
+        for filename in files.values():
+            os.unlink(filename)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,106 @@
+#!/usr/bin/python3
+"""Benchmark of grid.search on large synthetic mazes against the usual
+hand-written searches (dict of Coord distances, bounded_neighbors, heapq)
+
+    $ python benchmarks/bench_search.py [size]
+"""
+
+import heapq
+import random
+import sys
+import time
+from collections import deque
+
+from aochallenge import grid
+from aochallenge.grid import search
+
+
+def maze(size: int, density: float = 0.3, seed: int = 42) -> list[list[str]]:
+    rnd = random.Random(seed)
+    cells = [
+        ["#" if rnd.random() < density else "." for _ in range(size)]
+        for _ in range(size)
+    ]
+    for y in (0, 1, -2, -1):
+        for x in (0, 1, -2, -1):
+            cells[y][x] = "."
+    return cells
+
+
+def naive_bfs(area, start, goal):
+    corner2 = grid.boundaries(area)
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        pos = queue.popleft()
+        if pos == goal:
+            return dist[pos]
+        for n in grid.bounded_neighbors(pos, (0, 0), corner2):
+            if n not in dist and grid.get_element(area, n) != "#":
+                dist[n] = dist[pos] + 1
+                queue.append(n)
+    return None
+
+
+def naive_dijkstra(area, start, goal):
+    corner2 = grid.boundaries(area)
+    dist = {start: 0}
+    heap = [(0, start)]
+    while heap:
+        d, pos = heapq.heappop(heap)
+        if pos == goal:
+            return d
+        if d > dist[pos]:
+            continue
+        for n in grid.bounded_neighbors(pos, (0, 0), corner2):
+            if grid.get_element(area, n) == "#":
+                continue
+            nd = d + 1 + (n.x + n.y) % 3
+            if n not in dist or nd < dist[n]:
+                dist[n] = nd
+                heapq.heappush(heap, (nd, n))
+    return None
+
+
+def timed(label, func, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = func(*args, **kwargs)
+    print(f"  {label:<24} {time.perf_counter() - t0:8.3f}s")
+    return result
+
+
+def main(size: int = 1000) -> None:
+    area = maze(size)
+    start = grid.Coord(0, 0)
+    goal = grid.Coord(size - 1, size - 1)
+    wall = lambda a, b: b != "#"
+    print(f"maze {size}x{size}")
+
+    print("BFS")
+    expected = timed("naive", naive_bfs, area, start, goal)
+    result = timed("search.bfs", search.bfs, area, start, goal, passable=wall)
+    assert result.distance() == expected is not None
+
+    # Cost depends on the position in the naive version, so it is emulated
+    # by a weight grid for the library version
+    weights = [
+        ["#" if v == "#" else (x + y) % 3 + 1 for x, v in enumerate(row)]
+        for y, row in enumerate(area)
+    ]
+    cost = lambda a, b: b
+    print("Dijkstra")
+    expected = timed("naive", naive_dijkstra, area, start, goal)
+    result = timed(
+        "search.dijkstra",
+        search.dijkstra, weights, start, goal, cost=cost, passable=wall,
+    )
+    assert result.distance() == expected
+    result = timed(
+        "search.astar",
+        search.astar, weights, start, goal, cost=cost, passable=wall,
+    )
+    assert result.distance() == expected
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,16 +1,69 @@
 #!/usr/bin/python3
 
-from .solver import Solver, Solution
-from .input import load, variant
-from .debug import print_condensed, print_csv, print_arranged, print_solution
-from .image import save_image
-from . import grid
-
 import sys
 import re
 from functools import cache, lru_cache
 from itertools import combinations, count, product
-from typing import Callable, cast, NamedTuple
+from typing import Any, Callable, cast, NamedTuple
 from collections.abc import Generator
 from dataclasses import dataclass, field
 from copy import copy, deepcopy
+
+# Submodules (and the third-party packages they depend on) are only imported
+# when one of their names is first accessed. `from aochallenge import *`
+# resolves every name in `__all__`, but heavy dependencies (e.g. PIL) are
+# deferred further by the submodules themselves.
+_LAZY: dict[str, tuple[str, str | None]] = {
+    "Solver": ("solver", "Solver"),
+    "Solution": ("solver", "Solution"),
+    "independent": ("solver", "independent"),
+    "load": ("input", "load"),
+    "load_iter": ("input", "load_iter"),
+    "load_grid": ("input", "load_grid"),
+    "variant": ("input", "variant"),
+    "memoize": ("memo", "memoize"),
+    "find_cycle": ("cycle", "find_cycle"),
+    "state_at": ("cycle", "state_at"),
+    "print_condensed": ("debug", "print_condensed"),
+    "print_csv": ("debug", "print_csv"),
+    "print_arranged": ("debug", "print_arranged"),
+    "print_solution": ("debug", "print_solution"),
+    "LiveRenderer": ("debug", "LiveRenderer"),
+    "save_image": ("image", "save_image"),
+    "AnimationWriter": ("image", "AnimationWriter"),
+    "grid": ("grid", None),
+}
+
+__all__ = [
+    *_LAZY,
+    "sys",
+    "re",
+    "cache",
+    "lru_cache",
+    "combinations",
+    "count",
+    "product",
+    "Callable",
+    "cast",
+    "NamedTuple",
+    "Generator",
+    "dataclass",
+    "field",
+    "copy",
+    "deepcopy",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    modname, attr = _LAZY[name]
+    # __import__ (unlike importlib.import_module) is visible to -X importtime
+    module = __import__(f"{__name__}.{modname}", fromlist=["*"])
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,8 +1,10 @@
 from . import grid as grid
-from .debug import print_arranged as print_arranged, print_condensed as print_condensed, print_csv as print_csv, print_solution as print_solution
-from .image import save_image as save_image
-from .input import load as load, variant as variant
-from .solver import Solution as Solution, Solver as Solver
+from .cycle import find_cycle as find_cycle, state_at as state_at
+from .debug import LiveRenderer as LiveRenderer, print_arranged as print_arranged, print_condensed as print_condensed, print_csv as print_csv, print_solution as print_solution
+from .image import AnimationWriter as AnimationWriter, save_image as save_image
+from .input import load as load, load_grid as load_grid, load_iter as load_iter, variant as variant
+from .memo import memoize as memoize
+from .solver import Solution as Solution, Solver as Solver, independent as independent
 from collections.abc import Generator as Generator
 from copy import copy as copy, deepcopy as deepcopy
 from dataclasses import dataclass as dataclass, field as field
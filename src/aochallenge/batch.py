@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+"""Run a solution against all of its input variants
+
+    $ python -m aochallenge.batch [-j JOBS] solution.py
+
+The variants are the `input@@` files next to the solution (`input.txt`,
+`input-t.txt`, `input-t2`, ...). Each variant is run in its own worker
+process, with the variant as the first argument, as if started by hand.
+If an `input@@.out` file exists, the printed results are compared to it.
+"""
+
+from __future__ import annotations
+import argparse
+import contextlib
+import io
+import os
+import re
+import runpy
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+_INPUT_FILE = re.compile(r"input([^.]*)(?:\.txt)?")
+_RESULT_LINE = re.compile(r"(\d+): (.*)")
+
+
+@dataclass
+class VariantResult:
+    variant: str | None
+    filename: str
+    elapsed: float = 0.0
+    results: dict[int, str] = field(default_factory=dict)
+    expected: dict[int, str] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool | None:
+        """Whether the results match the expected ones (None if there is no
+        expected answer file)"""
+        if self.error is not None:
+            return False
+        if self.expected is None:
+            return None
+        return all(self.results.get(i) == r for i, r in self.expected.items())
+
+
+def discover_variants(script: str) -> list[tuple[str | None, str]]:
+    """Variants (None for the main input) and input files of a solution"""
+    directory = os.path.dirname(os.path.abspath(script))
+    variants: dict[str | None, str] = {}
+    for name in sorted(os.listdir(directory)):
+        match = _INPUT_FILE.fullmatch(name)
+        path = os.path.join(directory, name)
+        if match is None or not os.path.isfile(path):
+            continue
+        # `input-t` is preferred to `input-t.txt`, as load() does
+        variants.setdefault(match[1] or None, path)
+    return sorted(variants.items(), key=lambda item: item[0] or "")
+
+
+def run_batch(script: str, jobs: int | None = None) -> list[VariantResult]:
+    """Run the solution against all the variants in parallel processes"""
+    script = os.path.abspath(script)
+    variants = discover_variants(script)
+    if not variants:
+        return []
+    # Every variant gets a fresh interpreter, so no state (e.g. caches) leaks
+    # from one variant to the other
+    with ProcessPoolExecutor(jobs, max_tasks_per_child=1) as pool:
+        futures = [
+            pool.submit(_run_variant, script, variant, filename)
+            for variant, filename in variants
+        ]
+        results = [future.result() for future in futures]
+    for result in results:
+        expected_file = re.sub(r"\.txt$", "", result.filename) + ".out"
+        if os.path.isfile(expected_file):
+            with open(expected_file) as f:
+                result.expected = _parse_results(f.read())
+    return results
+
+
+def print_table(results: list[VariantResult]) -> None:
+    parts = sorted({i for result in results for i in result.results})
+    rows = [["variant", "time", *(f"part{i}" for i in parts), "check"]]
+    for result in results:
+        check = {None: "-", True: "ok", False: "FAIL"}[result.ok]
+        if result.error is not None:
+            check = "ERROR"
+        elif result.ok is False and result.expected is not None:
+            failed = [
+                f"{i}" for i, r in result.expected.items() if result.results.get(i) != r
+            ]
+            check += f" ({','.join(failed)})"
+        rows.append([
+            result.variant or "(main)",
+            f"{result.elapsed:.3f}s",
+            *(result.results.get(i, "") for i in parts),
+            check,
+        ])
+    widths = [max(len(row[c]) for row in rows) for c in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+    for result in results:
+        if result.error is not None:
+            print(f"\n{result.variant or '(main)'}:\n{result.error}", file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m aochallenge.batch",
+        description="Run a solution against all of its input variants",
+    )
+    parser.add_argument("script", help="solution script")
+    parser.add_argument("-j", "--jobs", type=int, help="number of worker processes")
+    args = parser.parse_args(argv)
+    results = run_batch(args.script, args.jobs)
+    if not results:
+        print(f"No input files found for {args.script}", file=sys.stderr)
+        return 1
+    print_table(results)
+    return 0 if all(result.ok is not False for result in results) else 1
+
+
+########## private functions ####################
+
+
+def _run_variant(script: str, variant: str | None, filename: str) -> VariantResult:
+    result = VariantResult(variant, filename)
+    sys.argv = [script] if variant is None else [script, variant]
+    sys.path.insert(0, os.path.dirname(script))
+    output = io.StringIO()
+    t0 = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            runpy.run_path(script, run_name="__main__")
+    except BaseException:
+        result.error = traceback.format_exc()
+    result.elapsed = time.perf_counter() - t0
+    result.results = _parse_results(output.getvalue())
+    return result
+
+
+def _parse_results(text: str) -> dict[int, str]:
+    results = {}
+    for line in text.splitlines():
+        match = _RESULT_LINE.fullmatch(line)
+        if match is not None:
+            results[int(match[1])] = match[2]
+    return results
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+@dataclass
+class VariantResult:
+    variant: Union[str, None]
+    filename: str
+    elapsed: float = ...
+    results: dict[int, str] = ...
+    expected: Union[dict[int, str], None] = ...
+    error: Union[str, None] = ...
+    @property
+    def ok(self) -> Union[bool, None]: ...
+
+def discover_variants(script: str) -> list[tuple[Union[str, None], str]]: ...
+def run_batch(script: str, jobs: Union[int, None] = ...) -> list[VariantResult]: ...
+def print_table(results: list[VariantResult]) -> None: ...
+def main(argv: Union[list[str], None] = ...) -> int: ...
@@ -0,0 +1,145 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Callable, Hashable, Literal, NamedTuple, TypeVar
+
+# Cycle detection in the sequence x0, step(x0), step(step(x0)), ...
+# States are compared by `key(state)` (default: the state itself), which
+# can be a compact fingerprint (e.g. ZobristGrid.fingerprint, a tuple of
+# the relevant fields, or a string).
+#
+#   find_cycle  stores the keys of the states seen (hash-indexed history),
+#               and finds the cycle in start + length steps. It needs one
+#               state at a time, so `step` may modify the state in place
+#               and return it. Memory: O(start + length) keys.
+#   brent       Brent's algorithm, O(1) memory (two states), about
+#               2 * (start + length) steps.
+#   floyd       Floyd's tortoise and hare, O(1) memory, about
+#               3 * (start + length) steps.
+#
+# Brent and Floyd step several copies of the sequence from `initial`, so
+# `step` must return a new state (and must not modify its argument).
+
+S = TypeVar("S")
+Method = Literal["history", "brent", "floyd"]
+
+
+class Cycle(NamedTuple):
+    start: int  # index of the first state of the cycle
+    length: int
+
+    def equivalent(self, n: int) -> int:
+        """Index of the first state equal to state `n`"""
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.length
+
+
+def find_cycle(
+    initial: S, step: Callable[[S], S], key: Callable[[S], Hashable] | None = None
+) -> Cycle:
+    """Cycle of the sequence, found by storing the keys of the states"""
+    return _history(initial, step, key, None)[0]
+
+
+def brent(
+    initial: S, step: Callable[[S], S], key: Callable[[S], Hashable] | None = None
+) -> Cycle:
+    """Cycle of the sequence by Brent's algorithm"""
+    k: Callable[[S], Any] = key or _identity
+    # Length: the tortoise jumps to the hare at powers of two
+    power = length = 1
+    tortoise_key = k(initial)
+    hare = step(initial)
+    while tortoise_key != k(hare):
+        if power == length:
+            tortoise_key = k(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+    # Start: two states `length` apart, stepped until they meet
+    tortoise, hare = initial, initial
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while k(tortoise) != k(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def floyd(
+    initial: S, step: Callable[[S], S], key: Callable[[S], Hashable] | None = None
+) -> Cycle:
+    """Cycle of the sequence by Floyd's algorithm"""
+    k: Callable[[S], Any] = key or _identity
+    tortoise, hare = step(initial), step(step(initial))
+    while k(tortoise) != k(hare):
+        tortoise, hare = step(tortoise), step(step(hare))
+    start = 0
+    tortoise = initial
+    while k(tortoise) != k(hare):
+        tortoise, hare = step(tortoise), step(hare)
+        start += 1
+    length = 1
+    tortoise_key = k(tortoise)
+    hare = step(tortoise)
+    while tortoise_key != k(hare):
+        hare = step(hare)
+        length += 1
+    return Cycle(start, length)
+
+
+def state_at(
+    initial: S,
+    step: Callable[[S], S],
+    n: int,
+    key: Callable[[S], Hashable] | None = None,
+    method: Method = "history",
+) -> S:
+    """State `n` of the sequence (state 0 is `initial`), extrapolated by
+    the cycle of the sequence"""
+    if method == "history":
+        cycle, state, index = _history(initial, step, key, n)
+        if index == n:
+            return state
+        remaining = (n - index) % cycle.length
+    else:
+        cycle = (brent if method == "brent" else floyd)(initial, step, key)
+        state, remaining = initial, cycle.equivalent(n)
+    for _ in range(remaining):
+        state = step(state)
+    return state
+
+
+########## private functions ####################
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+def _history(
+    initial: S,
+    step: Callable[[S], S],
+    key: Callable[[S], Hashable] | None,
+    stop: int | None,
+) -> tuple[Cycle, S, int]:
+    # Returns the cycle, and the current state and its index: the first
+    # repeated state, or state `stop` if it comes first (the cycle is
+    # unknown then: (stop, 0))
+    k: Callable[[S], Any] = key or _identity
+    seen: dict[Any, int] = {}
+    state = initial
+    index = 0
+    while True:
+        if index == stop:
+            return Cycle(index, 0), state, index
+        state_key = k(state)
+        first = seen.get(state_key)
+        if first is not None:
+            return Cycle(first, index - first), state, index
+        seen[state_key] = index
+        state = step(state)
+        index += 1
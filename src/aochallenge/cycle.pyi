@@ -0,0 +1,14 @@
+from typing import Callable, Hashable, Literal, NamedTuple, TypeVar
+
+S = TypeVar("S")
+Method = Literal["history", "brent", "floyd"]
+
+class Cycle(NamedTuple):
+    start: int
+    length: int
+    def equivalent(self, n: int) -> int: ...
+
+def find_cycle(initial: S, step: Callable[[S], S], key: Union[Callable[[S], Hashable], None] = ...) -> Cycle: ...
+def brent(initial: S, step: Callable[[S], S], key: Union[Callable[[S], Hashable], None] = ...) -> Cycle: ...
+def floyd(initial: S, step: Callable[[S], S], key: Union[Callable[[S], Hashable], None] = ...) -> Cycle: ...
+def state_at(initial: S, step: Callable[[S], S], n: int, key: Union[Callable[[S], Hashable], None] = ..., method: Method = ...) -> S: ...
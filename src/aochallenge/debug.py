@@ -1,5 +1,10 @@
 #!/usr/bin/python3
 
+import sys
+import time
+from types import TracebackType
+from typing import Any, Generic, TextIO
+
 from .grid import Grid2D, T
 from .solver import Solver
 
@@ -40,3 +45,111 @@ def print_solution(solution: Solver, *, indent: str = "") -> None:
         if name == "basename":
             continue
         print(f"{indent}{name}: {value}")
+
+
+# The live renderer redraws a grid in place on an ANSI terminal. It keeps
+# the rows drawn last time, and an update only writes the changed cells: the
+# columns that differ are grouped into runs (close runs are merged, as a
+# cursor move costs more than a few unchanged characters), and every run is
+# a cursor move and the new characters. The whole update is a single write.
+# Updates more frequent than `fps` are skipped (the last one is drawn by
+# `close`), so watching does not slow down the simulation much.
+
+_MERGE_GAP = 8  # unchanged characters cheaper than a cursor move
+
+
+class LiveRenderer(Generic[T]):
+    def __init__(
+        self,
+        *,
+        fps: float | None = 30,
+        chars: dict[T, str] | None = None,
+        stream: TextIO | None = None,
+    ) -> None:
+        """Cells are drawn by `chars[value]` (default: str(value)), the
+        characters should be one column wide"""
+        self.fps = fps
+        self.chars = chars
+        self.stream = stream if stream is not None else sys.stdout
+        self.frames = 0
+        self.skipped = 0
+        self._rows: list[str] = []
+        self._status = ""
+        self._last = 0.0
+        self._pending: tuple[Grid2D[T], str] | None = None
+
+    def __enter__(self) -> "LiveRenderer[T]":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def update(self, grid: Grid2D[T], status: str = "", *, force: bool = False) -> bool:
+        """Draw the grid (and a status line below it), unless the previous
+        frame was drawn too recently; returns whether it was drawn"""
+        now = time.perf_counter()
+        if not force and self.fps and now - self._last < 1 / self.fps:
+            self._pending = (grid, status)
+            self.skipped += 1
+            return False
+        self._pending = None
+        self._last = now
+        rows = [self._render(row) for row in grid]
+        out = []
+        if not self.frames or len(rows) != len(self._rows) or any(
+            len(new) != len(old) for new, old in zip(rows, self._rows)
+        ):
+            # Clear the screen, hide the cursor and draw everything
+            out.append("\x1b[?25l\x1b[H\x1b[2J")
+            out.extend(f"\x1b[{y + 1};1H{row}" for y, row in enumerate(rows))
+            self._status = ""
+        else:
+            for y, (new, old) in enumerate(zip(rows, self._rows)):
+                if new != old:
+                    out.extend(_changes(y, old, new))
+        if status != self._status:
+            out.append(f"\x1b[{len(rows) + 1};1H\x1b[2K{status}")
+            self._status = status
+        self._rows = rows
+        self.frames += 1
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+        return True
+
+    def close(self) -> None:
+        """Draw the last skipped update, and restore the cursor below the
+        grid"""
+        if self._pending is not None:
+            self.update(*self._pending, force=True)
+        if self.frames:
+            self.stream.write(f"\x1b[{len(self._rows) + 2};1H\x1b[?25h")
+            self.stream.flush()
+
+    def _render(self, row: Any) -> str:
+        if self.chars is not None:
+            return "".join(map(self.chars.__getitem__, row))
+        if isinstance(row, str):
+            return row
+        return "".join(map(str, row))
+
+
+########## private functions ####################
+
+
+def _changes(y: int, old: str, new: str) -> list[str]:
+    columns = [x for x, (a, b) in enumerate(zip(old, new)) if a != b]
+    out = []
+    start = end = columns[0]
+    for x in columns[1:]:
+        if x - end > _MERGE_GAP:
+            out.append(f"\x1b[{y + 1};{start + 1}H{new[start : end + 1]}")
+            start = x
+        end = x
+    out.append(f"\x1b[{y + 1};{start + 1}H{new[start : end + 1]}")
+    return out
@@ -1,7 +1,21 @@
 from .grid import Grid2D as Grid2D, T as T
 from .solver import Solver as Solver
+from types import TracebackType
+from typing import Generic, TextIO
 
 def print_condensed(data: Grid2D[T]) -> None: ...
 def print_csv(data: Grid2D[T]) -> None: ...
 def print_arranged(data: Grid2D[T]) -> None: ...
 def print_solution(solution: Solver, *, indent: str = ...) -> None: ...
+
+class LiveRenderer(Generic[T]):
+    fps: Union[float, None]
+    chars: Union[dict[T, str], None]
+    stream: TextIO
+    frames: int
+    skipped: int
+    def __init__(self, *, fps: Union[float, None] = ..., chars: Union[dict[T, str], None] = ..., stream: Union[TextIO, None] = ...) -> None: ...
+    def __enter__(self) -> LiveRenderer[T]: ...
+    def __exit__(self, exc_type: Union[type[BaseException], None], exc: Union[BaseException, None], traceback: Union[TracebackType, None]) -> None: ...
+    def update(self, grid: Grid2D[T], status: str = ..., *, force: bool = ...) -> bool: ...
+    def close(self) -> None: ...
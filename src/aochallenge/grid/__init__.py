@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 import itertools
-from typing import cast, Iterator, NamedTuple, Self, TypeAlias, TypeVar
+from typing import Any, Callable, cast, Iterator, NamedTuple, Self, TypeAlias, TypeVar
 
 
 # Note, that we use "type: ignore[override]", because we override the default
 # types of NamedTuple operators
+
 class Coord2D(NamedTuple):
     x: int
     y: int
 
     def __add__(self, other: Coord2D | tuple[int, int] | int) -> Coord2D:  # type: ignore[override]
         # Note: NamedTuple has an __add__ method defined with different annotation
+        # Exact types take a fast path (no isinstance chain, no Python level
+        # NamedTuple.__new__), subclasses are handled by the isinstance chain
+        if type(other) is Coord2D or type(other) is tuple and len(other) == 2:
+            return _new_2d(Coord2D, (self[0] + other[0], self[1] + other[1]))
+        if type(other) is int:
+            return _new_2d(Coord2D, (self[0] + other, self[1] + other))
         if isinstance(other, Coord2D):
             return Coord2D(self.x + other.x, self.y + other.y)
         if isinstance(other, tuple) and len(other) == 2:
@@ -22,6 +29,10 @@ class Coord2D(NamedTuple):
         return NotImplemented
 
     def __sub__(self, other: Coord2D | tuple[int, int] | int) -> Coord2D:
+        if type(other) is Coord2D or type(other) is tuple and len(other) == 2:
+            return _new_2d(Coord2D, (self[0] - other[0], self[1] - other[1]))
+        if type(other) is int:
+            return _new_2d(Coord2D, (self[0] - other, self[1] - other))
         if isinstance(other, Coord2D):
             return Coord2D(self.x - other.x, self.y - other.y)
         if isinstance(other, tuple) and len(other) == 2:
@@ -38,6 +49,14 @@ class Coord3D(NamedTuple):
 
     def __add__(self, other: Coord3D | tuple[int, int, int] | int) -> Coord3D:  # type: ignore[override]
         # Note: NamedTuple has an __add__ method defined with different annotation
+        # Exact types take a fast path (no isinstance chain, no Python level
+        # NamedTuple.__new__), subclasses are handled by the isinstance chain
+        if type(other) is Coord3D or type(other) is tuple and len(other) == 3:
+            return _new_3d(
+                Coord3D, (self[0] + other[0], self[1] + other[1], self[2] + other[2])
+            )
+        if type(other) is int:
+            return _new_3d(Coord3D, (self[0] + other, self[1] + other, self[2] + other))
         if isinstance(other, Coord3D):
             return Coord3D(self.x + other.x, self.y + other.y, self.z + other.z)
         if isinstance(other, tuple) and len(other) == 3:
@@ -47,6 +66,12 @@ class Coord3D(NamedTuple):
         return NotImplemented
 
     def __sub__(self, other: Coord3D | tuple[int, int, int] | int) -> Coord3D:
+        if type(other) is Coord3D or type(other) is tuple and len(other) == 3:
+            return _new_3d(
+                Coord3D, (self[0] - other[0], self[1] - other[1], self[2] - other[2])
+            )
+        if type(other) is int:
+            return _new_3d(Coord3D, (self[0] - other, self[1] - other, self[2] - other))
         if isinstance(other, Coord3D):
             return Coord3D(self.x - other.x, self.y - other.y, self.z - other.z)
         if isinstance(other, tuple) and len(other) == 3:
@@ -56,39 +81,41 @@ class Coord3D(NamedTuple):
         return NotImplemented
 
 
+# Creating the tuples directly is much faster than calling the constructor
+_new_2d = cast(Callable[[type[Coord2D], tuple[int, int]], Coord2D], tuple.__new__)
+_new_3d = cast(
+    Callable[[type[Coord3D], tuple[int, int, int]], Coord3D], tuple.__new__
+)
+
 _Coord2D = Coord2D | tuple[int, int]
 _Coord3D = Coord3D | tuple[int, int, int]
 
 
 def manhattan_2d(a: _Coord2D, b: _Coord2D) -> int:
-    d = _c2d(a) - b
-    return abs(d.x) + abs(d.y)
+    # Unpacking works the same for Coord2D and tuples without a conversion
+    ax, ay = a
+    bx, by = b
+    return abs(ax - bx) + abs(ay - by)
 
 
 def manhattan_3d(a: _Coord3D, b: _Coord3D) -> int:
-    d = _c3d(a) - b
-    return abs(d.x) + abs(d.y) + abs(d.z)
+    ax, ay, az = a
+    bx, by, bz = b
+    return abs(ax - bx) + abs(ay - by) + abs(az - bz)
 
 
 def is_within_2d(coord: _Coord2D, corner1: _Coord2D, corner2: _Coord2D) -> bool:
-    v = _c2d(coord)
-    c1 = _c2d(corner1)
-    c2 = _c2d(corner2)
-    return v.x >= c1.x and v.y >= c1.y and v.x <= c2.x and v.y <= c2.y
+    x, y = coord
+    x1, y1 = corner1
+    x2, y2 = corner2
+    return x1 <= x <= x2 and y1 <= y <= y2
 
 
 def is_within_3d(coord: _Coord3D, corner1: _Coord3D, corner2: _Coord3D) -> bool:
-    v = _c3d(coord)
-    c1 = _c3d(corner1)
-    c2 = _c3d(corner2)
-    return (
-        v.x >= c1.x
-        and v.y >= c1.y
-        and v.z >= c1.z
-        and v.x <= c2.x
-        and v.y <= c2.y
-        and v.z <= c2.z
-    )
+    x, y, z = coord
+    x1, y1, z1 = corner1
+    x2, y2, z2 = corner2
+    return x1 <= x <= x2 and y1 <= y <= y2 and z1 <= z <= z2
 
 
 def neighbors_2d(coord: _Coord2D) -> list[Coord2D]:
@@ -288,6 +315,56 @@ set_element = set_element_2d
 get_element = get_element_2d
 iter_grid = iter_grid_2d
 
+########## Lazily loaded submodules ####################
+
+# Alternative grid representations and grid algorithms live in submodules,
+# some of them depending on optional third-party packages (e.g. numpy), so
+# they are only imported when first accessed. A name mapped to itself is the
+# submodule.
+_LAZY: dict[str, str] = {
+    "ArrayGrid2D": "arraygrid",
+    "ArrayGrid3D": "arraygrid",
+    "create_array_grid_2d": "arraygrid",
+    "create_array_grid_3d": "arraygrid",
+    "ArrayGrid": "arraygrid",
+    "create_array_grid": "arraygrid",
+    "FlatGrid2D": "flatgrid",
+    "FlatGrid3D": "flatgrid",
+    "create_flat_grid_2d": "flatgrid",
+    "create_flat_grid_3d": "flatgrid",
+    "FlatGrid": "flatgrid",
+    "create_flat_grid": "flatgrid",
+    "search": "search",
+    "ByteGrid": "bytegrid",
+    "byte_table": "bytegrid",
+    "DIGITS": "bytegrid",
+    "SparseGrid2D": "sparsegrid",
+    "SparseGrid3D": "sparsegrid",
+    "SparseGrid": "sparsegrid",
+    "BitGrid2D": "bitgrid",
+    "create_bit_grid_2d": "bitgrid",
+    "BitGrid": "bitgrid",
+    "create_bit_grid": "bitgrid",
+    "automaton": "automaton",
+    "components": "components",
+    "GridView2D": "gridview",
+    "view_2d": "gridview",
+    "GridView": "gridview",
+    "view": "gridview",
+    "ZobristGrid2D": "zobrist",
+    "ZobristGrid3D": "zobrist",
+    "ZobristGrid": "zobrist",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = __import__(f"{__name__}.{_LAZY[name]}", fromlist=["*"])
+    value = module if name == _LAZY[name] else getattr(module, name)
+    globals()[name] = value
+    return value
+
 ########## private functions ####################
 
 
@@ -299,6 +376,26 @@ def _c3d(coord: _Coord3D) -> Coord3D:
     return coord if isinstance(coord, Coord3D) else Coord3D(*coord)
 
 
+def _directions_2d(connectivity: int) -> list[Coord2D]:
+    if connectivity == 4:
+        return _neighbor_direct_2d
+    if connectivity == 8:
+        return _neighbor_corner_2d
+    raise ValueError(f"Invalid 2D connectivity: {connectivity} (4 or 8 expected)")
+
+
+def _directions_3d(connectivity: int) -> list[Coord3D]:
+    if connectivity == 6:
+        return _neighbor_direct_3d
+    if connectivity == 18:
+        return _neighbor_edge_3d
+    if connectivity == 26:
+        return _neighbor_corner_3d
+    raise ValueError(
+        f"Invalid 3D connectivity: {connectivity} (6, 18 or 26 expected)"
+    )
+
+
 _neighbor_direct_2d: list[Coord2D] = []
 _neighbor_corner_2d: list[Coord2D] = []
 _neighbor_direct_3d: list[Coord3D] = []
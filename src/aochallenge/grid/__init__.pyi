@@ -67,3 +67,13 @@ boundaries = boundaries_2d
 set_element = set_element_2d
 get_element = get_element_2d
 iter_grid = iter_grid_2d
+from .arraygrid import ArrayGrid as ArrayGrid, ArrayGrid2D as ArrayGrid2D, ArrayGrid3D as ArrayGrid3D, create_array_grid as create_array_grid, create_array_grid_2d as create_array_grid_2d, create_array_grid_3d as create_array_grid_3d
+from .flatgrid import FlatGrid as FlatGrid, FlatGrid2D as FlatGrid2D, FlatGrid3D as FlatGrid3D, create_flat_grid as create_flat_grid, create_flat_grid_2d as create_flat_grid_2d, create_flat_grid_3d as create_flat_grid_3d
+from . import search as search
+from .bytegrid import ByteGrid as ByteGrid, DIGITS as DIGITS, byte_table as byte_table
+from .sparsegrid import SparseGrid as SparseGrid, SparseGrid2D as SparseGrid2D, SparseGrid3D as SparseGrid3D
+from .bitgrid import BitGrid as BitGrid, BitGrid2D as BitGrid2D, create_bit_grid as create_bit_grid, create_bit_grid_2d as create_bit_grid_2d
+from . import automaton as automaton
+from . import components as components
+from .gridview import GridView as GridView, GridView2D as GridView2D, view as view, view_2d as view_2d
+from .zobrist import ZobristGrid as ZobristGrid, ZobristGrid2D as ZobristGrid2D, ZobristGrid3D as ZobristGrid3D
@@ -0,0 +1,150 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, cast, Iterator
+
+import numpy as np
+import numpy.typing as npt
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    _Coord2D,
+    _Coord3D,
+    _c2d,
+    _c3d,
+    _directions_2d,
+    _directions_3d,
+    dimensions_2d,
+    dimensions_3d,
+)
+
+# The array grids below behave like list-of-lists grids (`grid[y][x]`, `len`,
+# iteration), so the functions of the grid module, the debug printers and
+# save_image accept them as they are. Iteration yields rows converted to
+# lists of Python values, but indexing returns writable ndarray views.
+
+
+class ArrayGrid2D:
+    def __init__(self, data: npt.ArrayLike) -> None:
+        self.data: npt.NDArray[Any] = np.ascontiguousarray(data)
+        if self.data.ndim != 2:
+            raise ValueError(f"2D array expected, got {self.data.ndim}D")
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    def __getitem__(self, y: int) -> npt.NDArray[Any]:
+        return cast(npt.NDArray[Any], self.data[y])
+
+    def __iter__(self) -> Iterator[list[Any]]:
+        for row in self.data:
+            yield row.tolist()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data!r})"
+
+    def tolist(self) -> list[list[Any]]:
+        return self.data.tolist()  # type: ignore[no-any-return]
+
+    def mask(self, value: Any) -> npt.NDArray[np.bool_]:
+        return cast(npt.NDArray[np.bool_], self.data == value)
+
+    def count(self, value: Any) -> int:
+        return int(np.count_nonzero(self.data == value))
+
+    def neighbor_sum(self, connectivity: int = 4) -> ArrayGrid2D:
+        """Sum of the neighbor values of each cell, cells outside of the
+        grid count as 0"""
+        return ArrayGrid2D(_neighbor_sum(self.data, _directions_2d(connectivity)))
+
+    def neighbor_count(self, value: Any, connectivity: int = 4) -> ArrayGrid2D:
+        """Number of neighbors of each cell having the given value"""
+        mask = (self.data == value).astype(np.int32)
+        return ArrayGrid2D(_neighbor_sum(mask, _directions_2d(connectivity)))
+
+
+class ArrayGrid3D:
+    def __init__(self, data: npt.ArrayLike) -> None:
+        self.data: npt.NDArray[Any] = np.ascontiguousarray(data)
+        if self.data.ndim != 3:
+            raise ValueError(f"3D array expected, got {self.data.ndim}D")
+
+    def __len__(self) -> int:
+        return int(self.data.shape[0])
+
+    def __getitem__(self, z: int) -> npt.NDArray[Any]:
+        return cast(npt.NDArray[Any], self.data[z])
+
+    def __iter__(self) -> Iterator[list[list[Any]]]:
+        for plane in self.data:
+            yield plane.tolist()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data!r})"
+
+    def tolist(self) -> list[list[list[Any]]]:
+        return self.data.tolist()  # type: ignore[no-any-return]
+
+    def mask(self, value: Any) -> npt.NDArray[np.bool_]:
+        return cast(npt.NDArray[np.bool_], self.data == value)
+
+    def count(self, value: Any) -> int:
+        return int(np.count_nonzero(self.data == value))
+
+    def neighbor_sum(self, connectivity: int = 6) -> ArrayGrid3D:
+        """Sum of the neighbor values of each cell, cells outside of the
+        grid count as 0"""
+        return ArrayGrid3D(_neighbor_sum(self.data, _directions_3d(connectivity)))
+
+    def neighbor_count(self, value: Any, connectivity: int = 6) -> ArrayGrid3D:
+        """Number of neighbors of each cell having the given value"""
+        mask = (self.data == value).astype(np.int32)
+        return ArrayGrid3D(_neighbor_sum(mask, _directions_3d(connectivity)))
+
+
+def create_array_grid_2d(
+    size: _Coord2D | Grid2D[Any], default: Any, dtype: npt.DTypeLike | None = None
+) -> ArrayGrid2D:
+    if not isinstance(size[0], int):
+        size = dimensions_2d(size)
+    s = _c2d(cast(Coord2D, size))
+    return ArrayGrid2D(np.full((s.y, s.x), default, dtype=dtype))
+
+
+def create_array_grid_3d(
+    size: _Coord3D | Grid3D[Any], default: Any, dtype: npt.DTypeLike | None = None
+) -> ArrayGrid3D:
+    if not isinstance(size[0], int):
+        size = dimensions_3d(size)
+    s = _c3d(cast(Coord3D, size))
+    return ArrayGrid3D(np.full((s.z, s.y, s.x), default, dtype=dtype))
+
+
+########## Simplify 2D interface ####################
+
+ArrayGrid = ArrayGrid2D
+create_array_grid = create_array_grid_2d
+
+########## private functions ####################
+
+
+def _neighbor_sum(
+    data: npt.NDArray[Any], directions: list[Coord2D] | list[Coord3D]
+) -> npt.NDArray[Any]:
+    # Shifted slices of a zero padded copy: one vectorized addition per
+    # direction instead of a Python call per cell
+    if data.dtype == np.bool_:
+        data = data.astype(np.int32)
+    padded = np.pad(data, 1)
+    total = np.zeros_like(data)
+    shape = data.shape
+    for d in directions:
+        # direction components are in (x, y[, z]) order, axes in reverse
+        index = tuple(
+            slice(1 + o, 1 + o + n) for o, n in zip(reversed(d), shape)
+        )
+        total += padded[index]
+    return total
@@ -0,0 +1,33 @@
+import numpy as np
+import numpy.typing as npt
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D
+from typing import Any, Iterator
+
+class ArrayGrid2D:
+    data: npt.NDArray[Any]
+    def __init__(self, data: npt.ArrayLike) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, y: int) -> npt.NDArray[Any]: ...
+    def __iter__(self) -> Iterator[list[Any]]: ...
+    def tolist(self) -> list[list[Any]]: ...
+    def mask(self, value: Any) -> npt.NDArray[np.bool_]: ...
+    def count(self, value: Any) -> int: ...
+    def neighbor_sum(self, connectivity: int = ...) -> ArrayGrid2D: ...
+    def neighbor_count(self, value: Any, connectivity: int = ...) -> ArrayGrid2D: ...
+
+class ArrayGrid3D:
+    data: npt.NDArray[Any]
+    def __init__(self, data: npt.ArrayLike) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, z: int) -> npt.NDArray[Any]: ...
+    def __iter__(self) -> Iterator[list[list[Any]]]: ...
+    def tolist(self) -> list[list[list[Any]]]: ...
+    def mask(self, value: Any) -> npt.NDArray[np.bool_]: ...
+    def count(self, value: Any) -> int: ...
+    def neighbor_sum(self, connectivity: int = ...) -> ArrayGrid3D: ...
+    def neighbor_count(self, value: Any, connectivity: int = ...) -> ArrayGrid3D: ...
+
+def create_array_grid_2d(size: Union[_Coord2D, Grid2D[Any]], default: Any, dtype: Union[npt.DTypeLike, None] = ...) -> ArrayGrid2D: ...
+def create_array_grid_3d(size: Union[_Coord3D, Grid3D[Any]], default: Any, dtype: Union[npt.DTypeLike, None] = ...) -> ArrayGrid3D: ...
+ArrayGrid = ArrayGrid2D
+create_array_grid = create_array_grid_2d
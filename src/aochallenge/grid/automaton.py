@@ -0,0 +1,353 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from operator import add
+from typing import Any, Iterable, Iterator, NamedTuple, Sequence, Union
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    MutableGrid2D,
+    MutableGrid3D,
+    _Coord2D,
+    _Coord3D,
+    _directions_2d,
+    _directions_3d,
+    dimensions_2d,
+    dimensions_3d,
+)
+from .flatgrid import FlatGrid2D, FlatGrid3D
+
+# Life-like cellular automata on bounded grids (cells outside are dead).
+#
+# Cells are stored as 0/1 ints in rows padded by a dead cell on both ends
+# (and a dead row/plane around), so the neighbors of a whole row in a given
+# direction are just a slice of a neighboring row. Neighbor counts of a row
+# are the element-wise sum of these slices, computed by chained map(add)
+# calls (one per direction, like a convolution with the neighborhood
+# kernel), and the new states are looked up in a flat rule table indexed by
+# `state * stride + count`. There are no per-cell Python function calls or
+# coordinate objects.
+
+
+class Rule(NamedTuple):
+    birth: frozenset[int]
+    survival: frozenset[int]
+
+
+RuleLike = Union[str, Rule, Sequence[Sequence[Any]]]
+
+LIFE = "B3/S23"
+
+
+def parse_rule(text: str) -> Rule:
+    """Parse a rule in B/S notation, e.g. "B3/S23" (Conway's Game of Life).
+    Counts above 9 (3D) or ranges need commas between the items:
+    "B5-7/S4,6,8-10" """
+    parts = {}
+    for part in text.upper().replace(" ", "").split("/"):
+        if not part or part[0] not in "BS":
+            raise ValueError(f"Invalid rule: {text!r}")
+        parts[part[0]] = _parse_counts(part[1:])
+    return Rule(parts.get("B", frozenset()), parts.get("S", frozenset()))
+
+
+class Automaton2D:
+    def __init__(
+        self,
+        grid: Grid2D[Any],
+        rule: RuleLike = LIFE,
+        *,
+        alive: Any = None,
+        connectivity: int = 8,
+    ) -> None:
+        """Cells equal to `alive` (or truthy cells, if `alive` is None) are
+        alive. The rule is a B/S rule or a table: table[state][count] is the
+        next state of a dead (0) or live (1) cell with `count` live
+        neighbors"""
+        self.width, self.height = dimensions_2d(grid)
+        self.directions = _directions_2d(connectivity)
+        self.stride = len(self.directions) + 1
+        self.table = _rule_table(rule, self.stride)
+        self.generation = 0
+        dead = [0] * (self.width + 2)
+        self.cells = [dead]
+        for row in grid:
+            self.cells.append([0, *_alive_flags(row, alive), 0])
+        self.cells.append(dead.copy())
+
+    def step(self, generations: int = 1) -> Automaton2D:
+        width, stride = self.width, self.stride
+        lookup = self.table.__getitem__
+        offset = stride.__mul__
+        shifts = [(dx + 1, dy) for dx, dy in self.directions]
+        for _ in range(generations):
+            cells = self.cells
+            new = [cells[0]]
+            for y in range(1, self.height + 1):
+                counts: Iterable[int] = [0] * width
+                for x0, dy in shifts:
+                    counts = map(add, counts, cells[y + dy][x0 : x0 + width])
+                states = map(offset, cells[y][1 : width + 1])
+                new.append([0, *map(lookup, map(add, counts, states)), 0])
+            new.append(cells[-1])
+            self.cells = new
+            self.generation += 1
+        return self
+
+    def get_element(self, pos: _Coord2D) -> bool:
+        x, y = pos
+        return bool(self.cells[y + 1][x + 1])
+
+    def count(self) -> int:
+        return sum(map(sum, self.cells))
+
+    def iter_alive(self) -> Iterable[Coord2D]:
+        for y, row in enumerate(self.cells[1:-1]):
+            for x, state in enumerate(row[1:-1]):
+                if state:
+                    yield Coord2D(x, y)
+
+    def to_grid(self, on: Any = True, off: Any = False) -> MutableGrid2D[Any]:
+        states = (off, on)
+        return [[states[v] for v in row[1:-1]] for row in self.cells[1:-1]]
+
+
+class Automaton3D:
+    def __init__(
+        self,
+        grid: Grid3D[Any],
+        rule: RuleLike,
+        *,
+        alive: Any = None,
+        connectivity: int = 26,
+    ) -> None:
+        """See Automaton2D"""
+        self.width, self.height, self.depth = dimensions_3d(grid)
+        self.directions = _directions_3d(connectivity)
+        self.stride = len(self.directions) + 1
+        self.table = _rule_table(rule, self.stride)
+        self.generation = 0
+        self.cells = [self._dead_plane()]
+        for plane in grid:
+            dead = [0] * (self.width + 2)
+            self.cells.append(
+                [dead, *([0, *_alive_flags(row, alive), 0] for row in plane), dead]
+            )
+        self.cells.append(self._dead_plane())
+
+    def step(self, generations: int = 1) -> Automaton3D:
+        width, stride = self.width, self.stride
+        lookup = self.table.__getitem__
+        offset = stride.__mul__
+        shifts = [(dx + 1, dy, dz) for dx, dy, dz in self.directions]
+        for _ in range(generations):
+            cells = self.cells
+            new = [cells[0]]
+            for z in range(1, self.depth + 1):
+                plane = [cells[z][0]]
+                for y in range(1, self.height + 1):
+                    counts: Iterable[int] = [0] * width
+                    for x0, dy, dz in shifts:
+                        counts = map(add, counts, cells[z + dz][y + dy][x0 : x0 + width])
+                    states = map(offset, cells[z][y][1 : width + 1])
+                    plane.append([0, *map(lookup, map(add, counts, states)), 0])
+                plane.append(cells[z][-1])
+                new.append(plane)
+            new.append(cells[-1])
+            self.cells = new
+            self.generation += 1
+        return self
+
+    def get_element(self, pos: _Coord3D) -> bool:
+        x, y, z = pos
+        return bool(self.cells[z + 1][y + 1][x + 1])
+
+    def count(self) -> int:
+        return sum(sum(map(sum, plane)) for plane in self.cells)
+
+    def iter_alive(self) -> Iterable[Coord3D]:
+        for z, plane in enumerate(self.cells[1:-1]):
+            for y, row in enumerate(plane[1:-1]):
+                for x, state in enumerate(row[1:-1]):
+                    if state:
+                        yield Coord3D(x, y, z)
+
+    def to_grid(self, on: Any = True, off: Any = False) -> MutableGrid3D[Any]:
+        states = (off, on)
+        return [
+            [[states[v] for v in row[1:-1]] for row in plane[1:-1]]
+            for plane in self.cells[1:-1]
+        ]
+
+    def _dead_plane(self) -> list[list[int]]:
+        return [[0] * (self.width + 2) for _ in range(self.height + 2)]
+
+
+# The frontier automata give the same results, but track the cells which may
+# change: a cell whose state and live neighbor count have not changed since
+# it was last evaluated (without changing) cannot change. So only the cells
+# that changed in the previous step and their neighbors (the active
+# frontier) are evaluated, and the neighbor counts are updated
+# incrementally when a cell flips. The cost of a step is proportional to the
+# number of changes instead of the grid area.
+#
+# Cells are stored in a flat grid (see grid.flatgrid) with a border, whose
+# state (2) has a rule table row that keeps it unchanged, so border cells
+# never need to be filtered out of the frontier.
+
+_BORDER = 2
+
+
+class _FrontierAutomaton:
+    _flat: FlatGrid2D[int] | FlatGrid3D[int]
+
+    def _setup(self, rule: RuleLike, offsets: list[int]) -> None:
+        self.stride = len(offsets) + 1
+        self.table = bytearray(_rule_table(rule, self.stride) + [_BORDER] * self.stride)
+        self.generation = 0
+        self.offsets = offsets
+        self.cells = bytearray(self._flat.cells)
+        self.counts = bytearray(len(self.cells))
+        counts = self.counts
+        for i in self._flat.indices():
+            if self.cells[i] == 1:
+                for o in offsets:
+                    counts[i + o] += 1
+        self.active = set(self._flat.indices())
+
+    def step(self, generations: int = 1) -> Any:
+        cells, counts, table, stride = self.cells, self.counts, self.table, self.stride
+        offsets = self.offsets
+        for _ in range(generations):
+            # All the changes are found before any of them is applied
+            changed = [
+                i for i in self.active if table[cells[i] * stride + counts[i]] != cells[i]
+            ]
+            active = set(changed)
+            for i in changed:
+                if cells[i]:
+                    cells[i] = 0
+                    for o in offsets:
+                        counts[i + o] -= 1
+                else:
+                    cells[i] = 1
+                    for o in offsets:
+                        counts[i + o] += 1
+                active.update([i + o for o in offsets])
+            self.active = active
+            self.generation += 1
+        return self
+
+    def count(self) -> int:
+        return self.cells.count(1)
+
+    def _alive(self) -> Iterator[int]:
+        cells = self.cells
+        return (i for i in self._flat.indices() if cells[i] == 1)
+
+    def _states(self) -> Iterator[int]:
+        cells = self.cells
+        return (cells[i] for i in self._flat.indices())
+
+
+class FrontierAutomaton2D(_FrontierAutomaton):
+    _flat: FlatGrid2D[int]
+
+    def __init__(
+        self,
+        grid: Grid2D[Any],
+        rule: RuleLike = LIFE,
+        *,
+        alive: Any = None,
+        connectivity: int = 8,
+    ) -> None:
+        """See Automaton2D"""
+        self._flat = FlatGrid2D([_alive_flags(row, alive) for row in grid], _BORDER)
+        self.width, self.height = self._flat.width, self._flat.height
+        self._setup(rule, self._flat.offsets(connectivity))
+
+    def get_element(self, pos: _Coord2D) -> bool:
+        return self.cells[self._flat.index(pos)] == 1
+
+    def iter_alive(self) -> Iterable[Coord2D]:
+        return map(self._flat.coord, self._alive())
+
+    def to_grid(self, on: Any = True, off: Any = False) -> MutableGrid2D[Any]:
+        states = iter(self._states())
+        return [
+            [on if next(states) else off for _ in range(self.width)]
+            for _ in range(self.height)
+        ]
+
+
+class FrontierAutomaton3D(_FrontierAutomaton):
+    _flat: FlatGrid3D[int]
+
+    def __init__(
+        self,
+        grid: Grid3D[Any],
+        rule: RuleLike,
+        *,
+        alive: Any = None,
+        connectivity: int = 26,
+    ) -> None:
+        """See Automaton2D"""
+        self._flat = FlatGrid3D(
+            [[_alive_flags(row, alive) for row in plane] for plane in grid], _BORDER
+        )
+        self.width, self.height, self.depth = (
+            self._flat.width, self._flat.height, self._flat.depth
+        )
+        self._setup(rule, self._flat.offsets(connectivity))
+
+    def get_element(self, pos: _Coord3D) -> bool:
+        return self.cells[self._flat.index(pos)] == 1
+
+    def iter_alive(self) -> Iterable[Coord3D]:
+        return map(self._flat.coord, self._alive())
+
+    def to_grid(self, on: Any = True, off: Any = False) -> MutableGrid3D[Any]:
+        states = iter(self._states())
+        return [
+            [[on if next(states) else off for _ in range(self.width)] for _ in range(self.height)]
+            for _ in range(self.depth)
+        ]
+
+
+########## Simplify 2D interface ####################
+
+Automaton = Automaton2D
+FrontierAutomaton = FrontierAutomaton2D
+
+
+########## private functions ####################
+
+
+def _parse_counts(text: str) -> frozenset[int]:
+    items = text.split(",") if "," in text or "-" in text else list(text)
+    counts: set[int] = set()
+    for item in filter(None, items):
+        low, _, high = item.partition("-")
+        counts.update(range(int(low), int(high or low) + 1))
+    return frozenset(counts)
+
+
+def _rule_table(rule: RuleLike, stride: int) -> list[int]:
+    if isinstance(rule, str):
+        rule = parse_rule(rule)
+    if isinstance(rule, Rule):
+        return [int(c in rule.birth) for c in range(stride)] + [
+            int(c in rule.survival) for c in range(stride)
+        ]
+    if len(rule) != 2 or any(len(row) < stride for row in rule):
+        raise ValueError(f"Rule table must be 2 rows of {stride} states")
+    return [int(bool(v)) for row in rule for v in row[:stride]]
+
+
+def _alive_flags(row: Sequence[Any], alive: Any) -> list[int]:
+    if alive is None:
+        return [1 if v else 0 for v in row]
+    return [1 if v == alive else 0 for v in row]
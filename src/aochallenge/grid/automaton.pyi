@@ -0,0 +1,72 @@
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D, MutableGrid2D as MutableGrid2D, MutableGrid3D as MutableGrid3D
+from typing import Any, Iterable, NamedTuple, Sequence
+
+class Rule(NamedTuple):
+    birth: frozenset[int]
+    survival: frozenset[int]
+
+RuleLike = Union[str, Rule, Sequence[Sequence[Any]]]
+LIFE: str
+
+def parse_rule(text: str) -> Rule: ...
+
+class Automaton2D:
+    width: int
+    height: int
+    directions: list[Coord2D]
+    stride: int
+    table: list[int]
+    generation: int
+    cells: list[list[int]]
+    def __init__(self, grid: Grid2D[Any], rule: RuleLike = ..., *, alive: Any = ..., connectivity: int = ...) -> None: ...
+    def step(self, generations: int = ...) -> Automaton2D: ...
+    def get_element(self, pos: _Coord2D) -> bool: ...
+    def count(self) -> int: ...
+    def iter_alive(self) -> Iterable[Coord2D]: ...
+    def to_grid(self, on: Any = ..., off: Any = ...) -> MutableGrid2D[Any]: ...
+
+class Automaton3D:
+    width: int
+    height: int
+    depth: int
+    directions: list[Coord3D]
+    stride: int
+    table: list[int]
+    generation: int
+    cells: list[list[list[int]]]
+    def __init__(self, grid: Grid3D[Any], rule: RuleLike, *, alive: Any = ..., connectivity: int = ...) -> None: ...
+    def step(self, generations: int = ...) -> Automaton3D: ...
+    def get_element(self, pos: _Coord3D) -> bool: ...
+    def count(self) -> int: ...
+    def iter_alive(self) -> Iterable[Coord3D]: ...
+    def to_grid(self, on: Any = ..., off: Any = ...) -> MutableGrid3D[Any]: ...
+Automaton = Automaton2D
+
+class _FrontierAutomaton:
+    stride: int
+    table: bytearray
+    generation: int
+    offsets: list[int]
+    cells: bytearray
+    counts: bytearray
+    active: set[int]
+    def step(self, generations: int = ...) -> Any: ...
+    def count(self) -> int: ...
+
+class FrontierAutomaton2D(_FrontierAutomaton):
+    width: int
+    height: int
+    def __init__(self, grid: Grid2D[Any], rule: RuleLike = ..., *, alive: Any = ..., connectivity: int = ...) -> None: ...
+    def get_element(self, pos: _Coord2D) -> bool: ...
+    def iter_alive(self) -> Iterable[Coord2D]: ...
+    def to_grid(self, on: Any = ..., off: Any = ...) -> MutableGrid2D[Any]: ...
+
+class FrontierAutomaton3D(_FrontierAutomaton):
+    width: int
+    height: int
+    depth: int
+    def __init__(self, grid: Grid3D[Any], rule: RuleLike, *, alive: Any = ..., connectivity: int = ...) -> None: ...
+    def get_element(self, pos: _Coord3D) -> bool: ...
+    def iter_alive(self) -> Iterable[Coord3D]: ...
+    def to_grid(self, on: Any = ..., off: Any = ...) -> MutableGrid3D[Any]: ...
+FrontierAutomaton = FrontierAutomaton2D
@@ -0,0 +1,207 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Iterable, Iterator
+
+from . import (
+    Coord2D,
+    Grid2D,
+    MutableGrid2D,
+    _Coord2D,
+    dimensions_2d,
+)
+
+# A bit grid is a boolean grid with every row packed into a Python int: bit
+# `x` of `rows[y]` is the cell (x, y). Whole rows are processed by a single
+# big-integer operation, so set operations (and, or, xor, not), shifts and
+# population counts cost a few operations per row instead of per cell.
+#
+# Neighbor counts are computed bit-sliced: the shifted neighbor rows are
+# added by a binary ripple-carry adder working on whole rows, so the count
+# of every cell of a row is held in four "bit planes" (count bit 0..3).
+# Cells with a given count are then selected by and-ing the planes (or
+# their complements). This is how a Game of Life step is a handful of
+# integer operations per row.
+
+
+class BitGrid2D:
+    def __init__(self, rows: Iterable[int], width: int) -> None:
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.rows = [row & self.mask for row in rows]
+
+    @property
+    def height(self) -> int:
+        return len(self.rows)
+
+    @classmethod
+    def from_grid(cls, grid: Grid2D[Any], on: Any = None) -> BitGrid2D:
+        """Cells equal to `on` (or truthy cells, if `on` is None) are set"""
+        width = dimensions_2d(grid).x
+        rows = []
+        for row in grid:
+            cells = [bool(v) for v in row] if on is None else [v == on for v in row]
+            # Most significant bit first for int(): reversed row
+            rows.append(int("".join("1" if c else "0" for c in reversed(cells)) or "0", 2))
+        return cls(rows, width)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid2D):
+            return NotImplemented
+        return self.width == other.width and self.rows == other.rows
+
+    def __and__(self, other: BitGrid2D) -> BitGrid2D:
+        return BitGrid2D(map(int.__and__, self.rows, other.rows), self.width)
+
+    def __or__(self, other: BitGrid2D) -> BitGrid2D:
+        return BitGrid2D(map(int.__or__, self.rows, other.rows), self.width)
+
+    def __xor__(self, other: BitGrid2D) -> BitGrid2D:
+        return BitGrid2D(map(int.__xor__, self.rows, other.rows), self.width)
+
+    def __sub__(self, other: BitGrid2D) -> BitGrid2D:
+        mask = self.mask
+        return BitGrid2D(
+            [a & (mask ^ b) for a, b in zip(self.rows, other.rows)], self.width
+        )
+
+    def __invert__(self) -> BitGrid2D:
+        mask = self.mask
+        return BitGrid2D([mask ^ row for row in self.rows], self.width)
+
+    def __str__(self) -> str:
+        return "\n".join(
+            format(row, f"0{self.width}b")[::-1].replace("0", ".").replace("1", "#")
+            if self.width else ""
+            for row in self.rows
+        )
+
+    def get_element(self, pos: _Coord2D) -> bool:
+        x, y = pos
+        return bool(self.rows[y] >> x & 1)
+
+    def set_element(self, pos: _Coord2D, value: bool) -> None:
+        x, y = pos
+        if value:
+            self.rows[y] |= 1 << x
+        else:
+            self.rows[y] &= ~(1 << x)
+
+    def count(self) -> int:
+        return sum(row.bit_count() for row in self.rows)
+
+    def iter_set(self) -> Iterator[Coord2D]:
+        """Coordinates of the set cells, row by row"""
+        for y, row in enumerate(self.rows):
+            while row:
+                low = row & -row
+                yield Coord2D(low.bit_length() - 1, y)
+                row ^= low
+
+    def shift(self, dx: int, dy: int) -> BitGrid2D:
+        """Cells moved by (dx, dy); cells moving out are lost"""
+        height = len(self.rows)
+        if dx >= 0:
+            rows = [row << dx for row in self.rows]
+        else:
+            rows = [row >> -dx for row in self.rows]
+        if dy >= 0:
+            rows = [0] * min(dy, height) + rows[: max(height - dy, 0)]
+        else:
+            rows = rows[-dy:] + [0] * min(-dy, height)
+        return BitGrid2D(rows, self.width)
+
+    def count_planes(self, connectivity: int = 8) -> list[list[int]]:
+        """Bit-sliced neighbor counts: planes[k][y] holds bit k of the count
+        of every cell of row y"""
+        if connectivity not in (4, 8):
+            raise ValueError(f"Invalid 2D connectivity: {connectivity} (4 or 8 expected)")
+        mask = self.mask
+        rows = self.rows
+        padded = [0, *rows, 0]
+        planes: list[list[int]] = [[], [], [], []]
+        for y in range(len(rows)):
+            above, row, below = padded[y], padded[y + 1], padded[y + 2]
+            terms = [above, below, (row << 1) & mask, row >> 1]
+            if connectivity == 8:
+                terms += [
+                    (above << 1) & mask, above >> 1, (below << 1) & mask, below >> 1
+                ]
+            b0 = b1 = b2 = b3 = 0
+            for term in terms:
+                carry = b0 & term
+                b0 ^= term
+                carry2 = b1 & carry
+                b1 ^= carry
+                carry = b2 & carry2
+                b2 ^= carry2
+                b3 |= carry
+            planes[0].append(b0)
+            planes[1].append(b1)
+            planes[2].append(b2)
+            planes[3].append(b3)
+        return planes
+
+    def neighbor_mask(self, counts: Iterable[int], connectivity: int = 8) -> BitGrid2D:
+        """Cells with a number of set neighbors in `counts`"""
+        return self._select(self.count_planes(connectivity), counts)
+
+    def neighbor_count(self, connectivity: int = 8) -> MutableGrid2D[int]:
+        """Number of set neighbors of every cell"""
+        planes = self.count_planes(connectivity)
+        return [
+            [
+                sum((planes[k][y] >> x & 1) << k for k in range(4))
+                for x in range(self.width)
+            ]
+            for y in range(len(self.rows))
+        ]
+
+    def life_step(
+        self, birth: Iterable[int] = (3,), survival: Iterable[int] = (2, 3),
+        connectivity: int = 8,
+    ) -> BitGrid2D:
+        """Next generation of a Life-like cellular automaton (Conway's Game of
+        Life by default)"""
+        planes = self.count_planes(connectivity)
+        born = self._select(planes, birth) - self
+        return born | (self._select(planes, survival) & self)
+
+    def to_grid(self, on: Any = True, off: Any = False) -> MutableGrid2D[Any]:
+        return [
+            [on if row >> x & 1 else off for x in range(self.width)] for row in self.rows
+        ]
+
+    def _select(self, planes: list[list[int]], counts: Iterable[int]) -> BitGrid2D:
+        # Cells whose count (in the bit planes) is in `counts`
+        counts = set(counts)
+        for count in counts:
+            if not 0 <= count <= 8:
+                raise ValueError(f"Invalid neighbor count: {count} (0..8 expected)")
+        mask = self.mask
+        result = [0] * len(self.rows)
+        for count in counts:
+            for y in range(len(result)):
+                selected = mask
+                for k in range(4):
+                    plane = planes[k][y]
+                    selected &= plane if count >> k & 1 else mask ^ plane
+                result[y] |= selected
+        return BitGrid2D(result, self.width)
+
+
+def create_bit_grid_2d(size: _Coord2D | Grid2D[Any]) -> BitGrid2D:
+    """Empty (all cleared) bit grid"""
+    if not isinstance(size[0], int):
+        size = dimensions_2d(size)
+    width, height = size
+    return BitGrid2D([0] * height, width)
+
+
+########## Simplify 2D interface ####################
+
+BitGrid = BitGrid2D
+create_bit_grid = create_bit_grid_2d
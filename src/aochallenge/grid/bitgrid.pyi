@@ -0,0 +1,33 @@
+from . import Coord2D as Coord2D, Grid2D as Grid2D, MutableGrid2D as MutableGrid2D
+from typing import Any, Iterable, Iterator
+
+class BitGrid2D:
+    width: int
+    mask: int
+    rows: list[int]
+    def __init__(self, rows: Iterable[int], width: int) -> None: ...
+    @property
+    def height(self) -> int: ...
+    @classmethod
+    def from_grid(cls, grid: Grid2D[Any], on: Any = ...) -> BitGrid2D: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __and__(self, other: BitGrid2D) -> BitGrid2D: ...
+    def __or__(self, other: BitGrid2D) -> BitGrid2D: ...
+    def __xor__(self, other: BitGrid2D) -> BitGrid2D: ...
+    def __sub__(self, other: BitGrid2D) -> BitGrid2D: ...
+    def __invert__(self) -> BitGrid2D: ...
+    def get_element(self, pos: _Coord2D) -> bool: ...
+    def set_element(self, pos: _Coord2D, value: bool) -> None: ...
+    def count(self) -> int: ...
+    def iter_set(self) -> Iterator[Coord2D]: ...
+    def shift(self, dx: int, dy: int) -> BitGrid2D: ...
+    def count_planes(self, connectivity: int = ...) -> list[list[int]]: ...
+    def neighbor_mask(self, counts: Iterable[int], connectivity: int = ...) -> BitGrid2D: ...
+    def neighbor_count(self, connectivity: int = ...) -> MutableGrid2D[int]: ...
+    def life_step(self, birth: Iterable[int] = ..., survival: Iterable[int] = ..., connectivity: int = ...) -> BitGrid2D: ...
+    def to_grid(self, on: Any = ..., off: Any = ...) -> MutableGrid2D[Any]: ...
+
+def create_bit_grid_2d(size: Union[_Coord2D, Grid2D[Any]]) -> BitGrid2D: ...
+BitGrid = BitGrid2D
+create_bit_grid = create_bit_grid_2d
@@ -0,0 +1,129 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+import mmap
+from typing import Iterator
+
+from . import Coord2D, MutableGrid2D, _Coord2D, _c2d
+
+# A ByteGrid keeps a character map as it is in the input: a single buffer
+# (bytearray or mmap) with the rows one after the other, each followed by
+# its line ending. Row `y` starts at `y * stride`, so rows are zero-copy
+# memoryview slices. `grid[y][x]` works as with list-of-lists grids (the
+# values are byte values, i.e. ints), so get_element_2d/set_element_2d and
+# iter_grid_2d accept it.
+
+Buffer = bytearray | mmap.mmap
+
+DIGITS: dict[str, int] = {str(d): d for d in range(10)}
+
+
+def byte_table(mapping: dict[str, int] | dict[int, int]) -> bytes:
+    """Translation table for bytes.translate(): characters (or byte values)
+    not in the mapping are kept"""
+    table = bytearray(range(256))
+    for key, value in mapping.items():
+        table[ord(key) if isinstance(key, str) else key] = value
+    return bytes(table)
+
+
+class ByteGrid:
+    def __init__(self, data: Buffer) -> None:
+        self.data = data
+        end = data.find(b"\n")
+        size = len(data)
+        while size and data[size - 1] in (10, 13):
+            size -= 1
+        if end < 0:
+            self.width = self.stride = size
+        else:
+            self.stride = end + 1
+            self.width = end - 1 if end and data[end - 1] == 13 else end
+        self.height = (size + self.stride - self.width) // self.stride if size else 0
+        if self.height and (self.height - 1) * self.stride + self.width != size:
+            raise ValueError("Rows of the grid have different lengths")
+        self._view = memoryview(data)
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> memoryview:
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("ByteGrid row index out of range")
+        start = y * self.stride
+        return self._view[start : start + self.width]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        view = self._view
+        for start in range(0, self.height * self.stride, self.stride):
+            yield view[start : start + self.width]
+
+    def __str__(self) -> str:
+        return "\n".join(bytes(row).decode("latin-1") for row in self)
+
+    def index(self, pos: _Coord2D) -> int:
+        p = _c2d(pos)
+        return p.y * self.stride + p.x
+
+    def coord(self, index: int) -> Coord2D:
+        y, x = divmod(index, self.stride)
+        return Coord2D(x, y)
+
+    def get_element(self, pos: _Coord2D) -> int:
+        return self.data[self._cell(pos)]
+
+    def set_element(self, pos: _Coord2D, value: int) -> None:
+        self.data[self._cell(pos)] = value
+
+    def find(self, value: bytes | str | int) -> Coord2D | None:
+        """Coordinate of the first cell with the given value (a sequence of
+        cells within a row, if more than one byte)"""
+        needle = _needle(value)
+        width, stride = self.width, self.stride
+        index = self.data.find(needle)
+        # Skip matches in (or across) line endings
+        while index >= 0 and index % stride + len(needle) > width:
+            index = self.data.find(needle, index + 1)
+        return None if index < 0 else self.coord(index)
+
+    def count(self, value: bytes | str | int) -> int:
+        """Number of cells with the given value (non-overlapping sequences,
+        if more than one byte)"""
+        needle = _needle(value)
+        data, width = self.data, self.width
+        return sum(
+            data[start : start + width].count(needle)
+            for start in range(0, self.height * self.stride, self.stride)
+        )
+
+    def translate(self, table: bytes | dict[str, int] | dict[int, int]) -> None:
+        """Translate all the cells in place (line endings are kept)"""
+        if isinstance(table, dict):
+            table = byte_table(table)
+        data, width = self.data, self.width
+        for start in range(0, self.height * self.stride, self.stride):
+            data[start : start + width] = data[start : start + width].translate(table)
+
+    def to_grid(self) -> MutableGrid2D[int]:
+        return [list(row) for row in self]
+
+    def _cell(self, pos: _Coord2D) -> int:
+        # Index of the cell, which must not be outside the rows (the
+        # buffer goes on with the line endings and the next row)
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"ByteGrid cell out of range: {tuple(pos)}")
+        return y * self.stride + x
+
+
+########## private functions ####################
+
+
+def _needle(value: bytes | str | int) -> bytes:
+    if isinstance(value, int):
+        return bytes((value,))
+    if isinstance(value, str):
+        return value.encode("latin-1")
+    return value
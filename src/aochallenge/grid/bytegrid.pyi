@@ -0,0 +1,26 @@
+import mmap
+from . import Coord2D as Coord2D, MutableGrid2D as MutableGrid2D
+from typing import Iterator
+
+Buffer = Union[bytearray, mmap.mmap]
+DIGITS: dict[str, int]
+
+def byte_table(mapping: Union[dict[str, int], dict[int, int]]) -> bytes: ...
+
+class ByteGrid:
+    data: Buffer
+    width: int
+    height: int
+    stride: int
+    def __init__(self, data: Buffer) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, y: int) -> memoryview: ...
+    def __iter__(self) -> Iterator[memoryview]: ...
+    def index(self, pos: _Coord2D) -> int: ...
+    def coord(self, index: int) -> Coord2D: ...
+    def get_element(self, pos: _Coord2D) -> int: ...
+    def set_element(self, pos: _Coord2D, value: int) -> None: ...
+    def find(self, value: Union[bytes, str, int]) -> Union[Coord2D, None]: ...
+    def count(self, value: Union[bytes, str, int]) -> int: ...
+    def translate(self, table: Union[bytes, dict[str, int], dict[int, int]]) -> None: ...
+    def to_grid(self) -> MutableGrid2D[int]: ...
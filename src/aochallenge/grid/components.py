@@ -0,0 +1,261 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from functools import partial
+from itertools import product
+from operator import eq
+from typing import Any, Callable, NamedTuple, Sequence
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    MutableGrid2D,
+    MutableGrid3D,
+    _Coord2D,
+    _Coord3D,
+    _c2d,
+    _c3d,
+    _directions_2d,
+    _directions_3d,
+    dimensions_2d,
+    dimensions_3d,
+)
+
+# Region handling without recursion: flood fill uses an explicit stack, and
+# connected components are labeled by the classic two-pass algorithm:
+#
+#   1. cells are visited in storage order, and each one is united (in a
+#      union-find forest) with its already visited neighbors of equal value,
+#   2. every cell gets the consecutive label of its root, and the size,
+#      bounding box and perimeter (surface in 3D) of the components are
+#      collected on the way.
+#
+# Both work on a flat copy of the cells, with the coordinates of a neighbor
+# in direction `d` found by adding the precomputed index offset of `d`.
+# 2D and 3D share the implementation; the dimensions are (width, height) or
+# (width, height, depth).
+
+
+class Component(NamedTuple):
+    label: int
+    value: Any
+    size: int
+    bounds: tuple[Any, Any]  # inclusive corners, Coord2D or Coord3D
+    perimeter: int  # number of cell sides on the border of the component
+
+
+class Labeling(NamedTuple):
+    labels: Any  # MutableGrid2D[int] or MutableGrid3D[int]
+    components: list[Component]  # components[label - 1]
+
+
+def flood_fill_2d(
+    grid: Grid2D[Any],
+    start: _Coord2D,
+    connectivity: int = 4,
+    match: Callable[[Any], bool] | None = None,
+) -> list[Coord2D]:
+    """Coordinates of the region of `start`: connected cells for which
+    `match(value)` is true (default: equal to the value at `start`)"""
+    dims = dimensions_2d(grid)
+    cells = [v for row in grid for v in row]
+    indices = _flood_fill(cells, dims, _c2d(start), _directions_2d(connectivity), match)
+    w = dims[0]
+    return [Coord2D(i % w, i // w) for i in indices]
+
+
+def flood_fill_3d(
+    grid: Grid3D[Any],
+    start: _Coord3D,
+    connectivity: int = 6,
+    match: Callable[[Any], bool] | None = None,
+) -> list[Coord3D]:
+    """See flood_fill_2d"""
+    dims = dimensions_3d(grid)
+    cells = [v for plane in grid for row in plane for v in row]
+    indices = _flood_fill(cells, dims, _c3d(start), _directions_3d(connectivity), match)
+    w, h = dims[0], dims[1]
+    return [Coord3D(i % w, i // w % h, i // (w * h)) for i in indices]
+
+
+def label_components_2d(
+    grid: Grid2D[Any], connectivity: int = 4, background: Any = None
+) -> Labeling:
+    """Label the connected regions of equal values (1, 2, ...). Cells equal
+    to `background` (if given) are not labeled (0)"""
+    dims = dimensions_2d(grid)
+    cells = [v for row in grid for v in row]
+    labels, components = _label(
+        cells, dims, _directions_2d(connectivity), _directions_2d(4), background, Coord2D
+    )
+    w = dims[0]
+    return Labeling([labels[y * w : (y + 1) * w] for y in range(dims[1])], components)
+
+
+def label_components_3d(
+    grid: Grid3D[Any], connectivity: int = 6, background: Any = None
+) -> Labeling:
+    """See label_components_2d (the perimeter is the surface)"""
+    dims = dimensions_3d(grid)
+    cells = [v for plane in grid for row in plane for v in row]
+    labels, components = _label(
+        cells, dims, _directions_3d(connectivity), _directions_3d(6), background, Coord3D
+    )
+    w, h, d = dims
+    label_grid: MutableGrid3D[int] = [
+        [labels[(z * h + y) * w : (z * h + y + 1) * w] for y in range(h)]
+        for z in range(d)
+    ]
+    return Labeling(label_grid, components)
+
+
+########## Simplify 2D interface ####################
+
+flood_fill = flood_fill_2d
+label_components = label_components_2d
+
+
+########## private functions ####################
+
+
+def _strides(dims: Sequence[int]) -> list[int]:
+    strides = [1]
+    for size in dims[:-1]:
+        strides.append(strides[-1] * size)
+    return strides
+
+
+def _neighbor_offsets(
+    directions: Sequence[Sequence[int]], strides: list[int]
+) -> list[tuple[int, tuple[int, ...]]]:
+    return [(sum(map(int.__mul__, d, strides)), tuple(d)) for d in directions]
+
+
+def _within(coord: Sequence[int], d: Sequence[int], dims: Sequence[int]) -> bool:
+    for c, dc, size in zip(coord, d, dims):
+        if not 0 <= c + dc < size:
+            return False
+    return True
+
+
+def _flood_fill(
+    cells: list[Any],
+    dims: Sequence[int],
+    start: Sequence[int],
+    directions: Sequence[Sequence[int]],
+    match: Callable[[Any], bool] | None,
+) -> list[int]:
+    strides = _strides(dims)
+    offsets = _neighbor_offsets(directions, strides)
+    first = sum(map(int.__mul__, start, strides))
+    if match is None:
+        match = partial(eq, cells[first])
+    if not match(cells[first]):
+        return []
+    seen = bytearray(len(cells))
+    seen[first] = 1
+    stack = [first]
+    region = []
+    while stack:
+        i = stack.pop()
+        region.append(i)
+        coord = _coord(i, dims)
+        for offset, d in offsets:
+            j = i + offset
+            if _within(coord, d, dims) and not seen[j] and match(cells[j]):
+                seen[j] = 1
+                stack.append(j)
+    region.sort()
+    return region
+
+
+def _coord(index: int, dims: Sequence[int]) -> list[int]:
+    coord = []
+    for size in dims:
+        index, c = divmod(index, size)
+        coord.append(c)
+    return coord
+
+
+def _label(
+    cells: list[Any],
+    dims: Sequence[int],
+    directions: Sequence[Sequence[int]],
+    faces: Sequence[Sequence[int]],
+    background: Any,
+    coord_type: Callable[..., Any],
+) -> tuple[list[int], list[Component]]:
+    strides = _strides(dims)
+    # Neighbors visited before a cell: the last nonzero axis is negative
+    prior = [
+        (offset, d)
+        for offset, d in _neighbor_offsets(directions, strides)
+        if offset < 0
+    ]
+    parent = list(range(len(cells)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # path halving
+            i = parent[i]
+        return i
+
+    coords = [tuple(reversed(c)) for c in product(*(range(s) for s in reversed(dims)))]
+    has_background = background is not None
+    for i, value in enumerate(cells):
+        if has_background and value == background:
+            continue
+        coord = coords[i]
+        for offset, d in prior:
+            j = i + offset
+            if _within(coord, d, dims) and cells[j] == value:
+                a, b = find(i), find(j)
+                if a != b:
+                    parent[max(a, b)] = min(a, b)
+
+    # Second pass: consecutive labels and statistics
+    labels = [0] * len(cells)
+    components: list[Component] = []
+    low: list[list[int]] = []
+    high: list[list[int]] = []
+    sizes: list[int] = []
+    perimeters: list[int] = []
+    root_label: dict[int, int] = {}
+    face_offsets = _neighbor_offsets(faces, strides)
+    for i, value in enumerate(cells):
+        if has_background and value == background:
+            continue
+        root = find(i)
+        label = root_label.get(root)
+        if label is None:
+            label = root_label[root] = len(sizes) + 1
+            low.append(list(coords[i]))
+            high.append(list(coords[i]))
+            sizes.append(0)
+            perimeters.append(0)
+            components.append(Component(label, value, 0, ((), ()), 0))
+        labels[i] = label
+        k = label - 1
+        sizes[k] += 1
+        coord = coords[i]
+        lo, hi = low[k], high[k]
+        for axis, c in enumerate(coord):
+            if c < lo[axis]:
+                lo[axis] = c
+            elif c > hi[axis]:
+                hi[axis] = c
+        for offset, d in face_offsets:
+            # (background cells are their own roots)
+            if not _within(coord, d, dims) or find(i + offset) != root:
+                perimeters[k] += 1
+    components = [
+        c._replace(
+            size=sizes[k],
+            bounds=(coord_type(*low[k]), coord_type(*high[k])),
+            perimeter=perimeters[k],
+        )
+        for k, c in enumerate(components)
+    ]
+    return labels, components
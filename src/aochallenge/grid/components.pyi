@@ -0,0 +1,20 @@
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D, MutableGrid2D as MutableGrid2D, MutableGrid3D as MutableGrid3D
+from typing import Any, Callable, NamedTuple
+
+class Component(NamedTuple):
+    label: int
+    value: Any
+    size: int
+    bounds: tuple[Any, Any]
+    perimeter: int
+
+class Labeling(NamedTuple):
+    labels: Any
+    components: list[Component]
+
+def flood_fill_2d(grid: Grid2D[Any], start: _Coord2D, connectivity: int = ..., match: Union[Callable[[Any], bool], None] = ...) -> list[Coord2D]: ...
+def flood_fill_3d(grid: Grid3D[Any], start: _Coord3D, connectivity: int = ..., match: Union[Callable[[Any], bool], None] = ...) -> list[Coord3D]: ...
+def label_components_2d(grid: Grid2D[Any], connectivity: int = ..., background: Any = ...) -> Labeling: ...
+def label_components_3d(grid: Grid3D[Any], connectivity: int = ..., background: Any = ...) -> Labeling: ...
+flood_fill = flood_fill_2d
+label_components = label_components_2d
@@ -0,0 +1,272 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import cast, Generic, Iterator
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    MutableGrid2D,
+    MutableGrid3D,
+    T,
+    _Coord2D,
+    _Coord3D,
+    _c2d,
+    _c3d,
+    _directions_2d,
+    _directions_3d,
+    dimensions_2d,
+    dimensions_3d,
+)
+
+# Flat grids store the cells in a single row-major list and address them by
+# integer index, so hot loops (BFS, flood fill, simulations) work with ints
+# and precomputed neighbor offsets instead of coordinate objects. Coordinates
+# are only needed to convert at the edges (`index()` and `coord()`).
+#
+# With a `border` value, the grid is surrounded by a one cell wide frame of
+# that value. Neighbor indices of inner cells can then be calculated by a
+# single addition (`neighbors()` never leaves the cell list), and the search
+# stops on the border because of its value. Without a border, neighbors are
+# looked up in a bounds-checked table, built on first use.
+
+
+class FlatGrid2D(Generic[T]):
+    def __init__(self, grid: Grid2D[T], border: T | None = None) -> None:
+        self.width, self.height = dimensions_2d(grid)
+        self.border = border
+        pad = 0 if border is None else 1
+        self.pad = pad
+        self.stride = self.width + 2 * pad
+        self.offset = pad * self.stride + pad
+        if border is None:
+            self.cells: list[T] = [v for row in grid for v in row]
+        else:
+            frame = [border] * self.stride
+            self.cells = frame.copy()
+            for row in grid:
+                self.cells.append(border)
+                self.cells.extend(row)
+                self.cells.append(border)
+            self.cells.extend(frame)
+        self._offsets: dict[int, list[int]] = {}
+        self._tables: dict[int, list[tuple[int, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> T:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self.cells[index] = value
+
+    def index(self, pos: _Coord2D) -> int:
+        p = _c2d(pos)
+        return self.offset + p.y * self.stride + p.x
+
+    def coord(self, index: int) -> Coord2D:
+        y, x = divmod(index, self.stride)
+        return Coord2D(x - self.pad, y - self.pad)
+
+    def get_element(self, pos: _Coord2D) -> T:
+        return self.cells[self.index(pos)]
+
+    def set_element(self, pos: _Coord2D, value: T) -> None:
+        self.cells[self.index(pos)] = value
+
+    def indices(self) -> Iterator[int]:
+        """Indices of the cells inside of the border"""
+        for y in range(self.height):
+            start = self.offset + y * self.stride
+            yield from range(start, start + self.width)
+
+    def iter_grid(self) -> Iterator[tuple[int, T]]:
+        cells = self.cells
+        for i in self.indices():
+            yield i, cells[i]
+
+    def offsets(self, connectivity: int = 4) -> list[int]:
+        """Index differences of the neighbors (4 or 8 connectivity)"""
+        if connectivity not in self._offsets:
+            self._offsets[connectivity] = [
+                d.y * self.stride + d.x for d in _directions_2d(connectivity)
+            ]
+        return self._offsets[connectivity]
+
+    def neighbor_table(self, connectivity: int = 4) -> list[tuple[int, ...]]:
+        """Indices of the neighbors of each cell (including border cells),
+        limited to the stored cells"""
+        if connectivity not in self._tables:
+            w = self.stride
+            h = len(self.cells) // w
+            directions = _directions_2d(connectivity)
+            self._tables[connectivity] = [
+                tuple(
+                    (y + d.y) * w + x + d.x
+                    for d in directions
+                    if 0 <= x + d.x < w and 0 <= y + d.y < h
+                )
+                for y in range(h)
+                for x in range(w)
+            ]
+        return self._tables[connectivity]
+
+    def neighbors(
+        self, index: int, connectivity: int = 4
+    ) -> list[int] | tuple[int, ...]:
+        if self.pad:
+            return [index + o for o in self.offsets(connectivity)]
+        return self.neighbor_table(connectivity)[index]
+
+    def to_grid(self) -> MutableGrid2D[T]:
+        cells = self.cells
+        end = self.offset + self.height * self.stride
+        return [
+            cells[start : start + self.width]
+            for start in range(self.offset, end, self.stride)
+        ]
+
+
+class FlatGrid3D(Generic[T]):
+    def __init__(self, grid: Grid3D[T], border: T | None = None) -> None:
+        self.width, self.height, self.depth = dimensions_3d(grid)
+        self.border = border
+        pad = 0 if border is None else 1
+        self.pad = pad
+        self.stride = self.width + 2 * pad
+        self.plane_stride = self.stride * (self.height + 2 * pad)
+        self.offset = pad * (self.plane_stride + self.stride + 1)
+        if border is None:
+            self.cells: list[T] = [
+                v for plane in grid for row in plane for v in row
+            ]
+        else:
+            frame = [border] * self.plane_stride
+            self.cells = frame.copy()
+            for plane in grid:
+                self.cells.extend([border] * self.stride)
+                for row in plane:
+                    self.cells.append(border)
+                    self.cells.extend(row)
+                    self.cells.append(border)
+                self.cells.extend([border] * self.stride)
+            self.cells.extend(frame)
+        self._offsets: dict[int, list[int]] = {}
+        self._tables: dict[int, list[tuple[int, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __getitem__(self, index: int) -> T:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self.cells[index] = value
+
+    def index(self, pos: _Coord3D) -> int:
+        p = _c3d(pos)
+        return self.offset + p.z * self.plane_stride + p.y * self.stride + p.x
+
+    def coord(self, index: int) -> Coord3D:
+        z, rest = divmod(index, self.plane_stride)
+        y, x = divmod(rest, self.stride)
+        return Coord3D(x - self.pad, y - self.pad, z - self.pad)
+
+    def get_element(self, pos: _Coord3D) -> T:
+        return self.cells[self.index(pos)]
+
+    def set_element(self, pos: _Coord3D, value: T) -> None:
+        self.cells[self.index(pos)] = value
+
+    def indices(self) -> Iterator[int]:
+        """Indices of the cells inside of the border"""
+        for z in range(self.depth):
+            for y in range(self.height):
+                start = self.offset + z * self.plane_stride + y * self.stride
+                yield from range(start, start + self.width)
+
+    def iter_grid(self) -> Iterator[tuple[int, T]]:
+        cells = self.cells
+        for i in self.indices():
+            yield i, cells[i]
+
+    def offsets(self, connectivity: int = 6) -> list[int]:
+        """Index differences of the neighbors (6, 18 or 26 connectivity)"""
+        if connectivity not in self._offsets:
+            self._offsets[connectivity] = [
+                d.z * self.plane_stride + d.y * self.stride + d.x
+                for d in _directions_3d(connectivity)
+            ]
+        return self._offsets[connectivity]
+
+    def neighbor_table(self, connectivity: int = 6) -> list[tuple[int, ...]]:
+        """Indices of the neighbors of each cell (including border cells),
+        limited to the stored cells"""
+        if connectivity not in self._tables:
+            w = self.stride
+            h = self.plane_stride // w
+            dp = len(self.cells) // self.plane_stride
+            directions = _directions_3d(connectivity)
+            self._tables[connectivity] = [
+                tuple(
+                    ((z + d.z) * h + y + d.y) * w + x + d.x
+                    for d in directions
+                    if 0 <= x + d.x < w and 0 <= y + d.y < h and 0 <= z + d.z < dp
+                )
+                for z in range(dp)
+                for y in range(h)
+                for x in range(w)
+            ]
+        return self._tables[connectivity]
+
+    def neighbors(
+        self, index: int, connectivity: int = 6
+    ) -> list[int] | tuple[int, ...]:
+        if self.pad:
+            return [index + o for o in self.offsets(connectivity)]
+        return self.neighbor_table(connectivity)[index]
+
+    def to_grid(self) -> MutableGrid3D[T]:
+        cells = self.cells
+        return [
+            [
+                cells[start : start + self.width]
+                for start in range(
+                    plane, plane + self.height * self.stride, self.stride
+                )
+            ]
+            for plane in range(
+                self.offset,
+                self.offset + self.depth * self.plane_stride,
+                self.plane_stride,
+            )
+        ]
+
+
+def create_flat_grid_2d(
+    size: _Coord2D | Grid2D[T], default: T, border: T | None = None
+) -> FlatGrid2D[T]:
+    if not isinstance(size[0], int):
+        size = dimensions_2d(size)
+    s = _c2d(cast(Coord2D, size))
+    return FlatGrid2D([[default] * s.x for _ in range(s.y)], border)
+
+
+def create_flat_grid_3d(
+    size: _Coord3D | Grid3D[T], default: T, border: T | None = None
+) -> FlatGrid3D[T]:
+    if not isinstance(size[0], int):
+        size = dimensions_3d(size)
+    s = _c3d(cast(Coord3D, size))
+    return FlatGrid3D(
+        [[[default] * s.x for _1 in range(s.y)] for _2 in range(s.z)], border
+    )
+
+
+########## Simplify 2D interface ####################
+
+FlatGrid = FlatGrid2D
+create_flat_grid = create_flat_grid_2d
@@ -0,0 +1,55 @@
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D, MutableGrid2D as MutableGrid2D, MutableGrid3D as MutableGrid3D, T as T
+from typing import Generic, Iterator
+
+class FlatGrid2D(Generic[T]):
+    width: int
+    height: int
+    border: Union[T, None]
+    pad: int
+    stride: int
+    offset: int
+    cells: list[T]
+    def __init__(self, grid: Grid2D[T], border: Union[T, None] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> T: ...
+    def __setitem__(self, index: int, value: T) -> None: ...
+    def index(self, pos: _Coord2D) -> int: ...
+    def coord(self, index: int) -> Coord2D: ...
+    def get_element(self, pos: _Coord2D) -> T: ...
+    def set_element(self, pos: _Coord2D, value: T) -> None: ...
+    def indices(self) -> Iterator[int]: ...
+    def iter_grid(self) -> Iterator[tuple[int, T]]: ...
+    def offsets(self, connectivity: int = ...) -> list[int]: ...
+    def neighbor_table(self, connectivity: int = ...) -> list[tuple[int, ...]]: ...
+    def neighbors(self, index: int, connectivity: int = ...) -> Union[list[int], tuple[int, ...]]: ...
+    def to_grid(self) -> MutableGrid2D[T]: ...
+
+class FlatGrid3D(Generic[T]):
+    width: int
+    height: int
+    depth: int
+    border: Union[T, None]
+    pad: int
+    stride: int
+    plane_stride: int
+    offset: int
+    cells: list[T]
+    def __init__(self, grid: Grid3D[T], border: Union[T, None] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, index: int) -> T: ...
+    def __setitem__(self, index: int, value: T) -> None: ...
+    def index(self, pos: _Coord3D) -> int: ...
+    def coord(self, index: int) -> Coord3D: ...
+    def get_element(self, pos: _Coord3D) -> T: ...
+    def set_element(self, pos: _Coord3D, value: T) -> None: ...
+    def indices(self) -> Iterator[int]: ...
+    def iter_grid(self) -> Iterator[tuple[int, T]]: ...
+    def offsets(self, connectivity: int = ...) -> list[int]: ...
+    def neighbor_table(self, connectivity: int = ...) -> list[tuple[int, ...]]: ...
+    def neighbors(self, index: int, connectivity: int = ...) -> Union[list[int], tuple[int, ...]]: ...
+    def to_grid(self) -> MutableGrid3D[T]: ...
+
+def create_flat_grid_2d(size: Union[_Coord2D, Grid2D[T]], default: T, border: Union[T, None] = ...) -> FlatGrid2D[T]: ...
+def create_flat_grid_3d(size: Union[_Coord3D, Grid3D[T]], default: T, border: Union[T, None] = ...) -> FlatGrid3D[T]: ...
+FlatGrid = FlatGrid2D
+create_flat_grid = create_flat_grid_2d
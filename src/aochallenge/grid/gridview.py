@@ -0,0 +1,229 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Generic, Iterator
+
+from . import (
+    Coord2D,
+    Grid2D,
+    MutableGrid2D,
+    T,
+    _Coord2D,
+    dimensions_2d,
+)
+
+# A view is a window of a grid seen through a rotation or reflection,
+# without copying the cells. View coordinates are mapped to coordinates of
+# the underlying grid by an affine map:
+#
+#   gx = ax * x + bx * y + cx
+#   gy = ay * x + by * y + cy
+#
+# where (ax, ay) and (bx, by) are unit vectors along the grid axes. Views of
+# views compose their maps, so every view refers to the original grid
+# directly, and a chain of transforms costs one index calculation per
+# access.
+#
+# Indexing a view by a row (`view[y]`) returns a row proxy, so a view can be
+# used as a grid by the module functions (`get_element_2d`, `iter_grid_2d`,
+# `dimensions_2d`, ...). Rows that are rows of the grid (in either
+# direction) are read by slicing; `materialize()` returns a copy.
+
+_Transform = tuple[int, int, int, int, int, int]
+
+_IDENTITY: _Transform = (1, 0, 0, 0, 1, 0)
+
+
+class GridView2D(Generic[T]):
+    def __init__(
+        self,
+        grid: Grid2D[T],
+        transform: _Transform = _IDENTITY,
+        size: _Coord2D | None = None,
+    ) -> None:
+        """View of `grid`; `transform` is (ax, bx, cx, ay, by, cy) of the
+        map above, `size` is the size of the view (default: the grid's)"""
+        self.grid = grid
+        self.transform = transform
+        width, height = dimensions_2d(grid) if size is None else size
+        self.width: int = width
+        self.height: int = height
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _RowView[T]:
+        if not 0 <= y < self.height:
+            raise IndexError(f"Row index out of view: {y}")
+        return _RowView(self, y)
+
+    def __iter__(self) -> Iterator[_RowView[T]]:
+        return (_RowView(self, y) for y in range(self.height))
+
+    def __repr__(self) -> str:
+        return f"GridView2D({self.materialize()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, GridView2D):
+            other = other.materialize()
+        if not isinstance(other, (list, tuple)):
+            return NotImplemented
+        rows: list[list[Any]] = [list(row) for row in other]
+        return bool(self.materialize() == rows)
+
+    @property
+    def dimensions(self) -> Coord2D:
+        return Coord2D(self.width, self.height)
+
+    def grid_coord(self, pos: _Coord2D) -> Coord2D:
+        """Coordinates in the underlying grid of a position of the view"""
+        x, y = pos
+        ax, bx, cx, ay, by, cy = self.transform
+        return Coord2D(ax * x + bx * y + cx, ay * x + by * y + cy)
+
+    def get_element(self, pos: _Coord2D) -> T:
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position out of view: {pos}")
+        ax, bx, cx, ay, by, cy = self.transform
+        value: T = self.grid[ay * x + by * y + cy][ax * x + bx * y + cx]
+        return value
+
+    def set_element(self, pos: _Coord2D, value: T) -> None:
+        """Write through to the underlying (mutable) grid"""
+        x, y = pos
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"Position out of view: {pos}")
+        ax, bx, cx, ay, by, cy = self.transform
+        grid: Any = self.grid
+        grid[ay * x + by * y + cy][ax * x + bx * y + cx] = value
+
+    def iter_grid(self) -> Iterator[tuple[Coord2D, T]]:
+        for y in range(self.height):
+            for x, value in enumerate(self._row(y)):
+                yield Coord2D(x, y), value
+
+    def materialize(self) -> MutableGrid2D[T]:
+        """Contiguous copy of the view as a list of lists"""
+        return [self._row(y) for y in range(self.height)]
+
+    # Transforms: the result is a view of the same grid
+
+    def transpose(self) -> GridView2D[T]:
+        return self._derive((0, 1, 0, 1, 0, 0), (self.height, self.width))
+
+    def rot90(self) -> GridView2D[T]:
+        """Rotated clockwise"""
+        return self._derive((0, 1, 0, -1, 0, self.height - 1), (self.height, self.width))
+
+    def rot180(self) -> GridView2D[T]:
+        return self._derive(
+            (-1, 0, self.width - 1, 0, -1, self.height - 1), (self.width, self.height)
+        )
+
+    def rot270(self) -> GridView2D[T]:
+        """Rotated counterclockwise"""
+        return self._derive((0, -1, self.width - 1, 1, 0, 0), (self.height, self.width))
+
+    def rotate(self, turns: int) -> GridView2D[T]:
+        """Rotated clockwise by `turns` quarter turns (negative:
+        counterclockwise)"""
+        turns %= 4
+        if turns == 0:
+            return self._derive(_IDENTITY, (self.width, self.height))
+        return (self.rot90, self.rot180, self.rot270)[turns - 1]()
+
+    def flip_x(self) -> GridView2D[T]:
+        """Mirrored horizontally (x reversed)"""
+        return self._derive((-1, 0, self.width - 1, 0, 1, 0), (self.width, self.height))
+
+    def flip_y(self) -> GridView2D[T]:
+        """Mirrored vertically (y reversed)"""
+        return self._derive((1, 0, 0, 0, -1, self.height - 1), (self.width, self.height))
+
+    def window(self, corner: _Coord2D, size: _Coord2D) -> GridView2D[T]:
+        """Sub-rectangle with the top left `corner` and `size`"""
+        x, y = corner
+        width, height = size
+        if not (
+            0 <= x and 0 <= y and 0 <= width and 0 <= height
+            and x + width <= self.width and y + height <= self.height
+        ):
+            raise IndexError(f"Window out of view: {corner}, {size}")
+        return self._derive((1, 0, x, 0, 1, y), (width, height))
+
+    # Private helpers
+
+    def _derive(self, inner: _Transform, size: _Coord2D) -> GridView2D[T]:
+        # Compose the maps: view -> self (inner), self -> grid
+        ax, bx, cx, ay, by, cy = self.transform
+        iax, ibx, icx, iay, iby, icy = inner
+        return GridView2D(
+            self.grid,
+            (
+                ax * iax + bx * iay,
+                ax * ibx + bx * iby,
+                ax * icx + bx * icy + cx,
+                ay * iax + by * iay,
+                ay * ibx + by * iby,
+                ay * icx + by * icy + cy,
+            ),
+            size,
+        )
+
+    def _row(self, y: int) -> list[T]:
+        ax, bx, cx, ay, by, cy = self.transform
+        width = self.width
+        gx, gy = bx * y + cx, by * y + cy
+        if width == 0:
+            return []
+        if ay == 0:
+            # A row of the grid, forwards or backwards
+            row = self.grid[gy]
+            if ax == 1:
+                return list(row[gx : gx + width])
+            return list(row[gx - width + 1 : gx + 1])[::-1]
+        # A column of the grid, downwards or upwards (row by row: grids like
+        # ByteGrid cannot be sliced)
+        grid = self.grid
+        return [grid[gy + i * ay][gx] for i in range(width)]
+
+
+class _RowView(Generic[T]):
+    __slots__ = ("view", "y")
+
+    def __init__(self, view: GridView2D[T], y: int) -> None:
+        self.view = view
+        self.y = y
+
+    def __len__(self) -> int:
+        return self.view.width
+
+    def __getitem__(self, x: int) -> T:
+        view = self.view
+        if not 0 <= x < view.width:
+            raise IndexError(f"Column index out of view: {x}")
+        ax, bx, cx, ay, by, cy = view.transform
+        y = self.y
+        value: T = view.grid[ay * x + by * y + cy][ax * x + bx * y + cx]
+        return value
+
+    def __setitem__(self, x: int, value: T) -> None:
+        self.view.set_element((x, self.y), value)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.view._row(self.y))
+
+    def __repr__(self) -> str:
+        return repr(self.view._row(self.y))
+
+
+def view_2d(grid: Grid2D[T]) -> GridView2D[T]:
+    """Identity view of a grid (the starting point of transforms)"""
+    return GridView2D(grid)
+
+
+########## Simplify 2D interface ####################
+
+GridView = GridView2D
+view = view_2d
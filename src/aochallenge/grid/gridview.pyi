@@ -0,0 +1,43 @@
+from . import Coord2D as Coord2D, Grid2D as Grid2D, MutableGrid2D as MutableGrid2D, T as T
+from typing import Generic, Iterator
+
+_Transform = tuple[int, int, int, int, int, int]
+
+class GridView2D(Generic[T]):
+    grid: Grid2D[T]
+    transform: _Transform
+    width: int
+    height: int
+    def __init__(self, grid: Grid2D[T], transform: _Transform = ..., size: Union[_Coord2D, None] = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, y: int) -> _RowView[T]: ...
+    def __iter__(self) -> Iterator[_RowView[T]]: ...
+    def __eq__(self, other: object) -> bool: ...
+    @property
+    def dimensions(self) -> Coord2D: ...
+    def grid_coord(self, pos: _Coord2D) -> Coord2D: ...
+    def get_element(self, pos: _Coord2D) -> T: ...
+    def set_element(self, pos: _Coord2D, value: T) -> None: ...
+    def iter_grid(self) -> Iterator[tuple[Coord2D, T]]: ...
+    def materialize(self) -> MutableGrid2D[T]: ...
+    def transpose(self) -> GridView2D[T]: ...
+    def rot90(self) -> GridView2D[T]: ...
+    def rot180(self) -> GridView2D[T]: ...
+    def rot270(self) -> GridView2D[T]: ...
+    def rotate(self, turns: int) -> GridView2D[T]: ...
+    def flip_x(self) -> GridView2D[T]: ...
+    def flip_y(self) -> GridView2D[T]: ...
+    def window(self, corner: _Coord2D, size: _Coord2D) -> GridView2D[T]: ...
+
+class _RowView(Generic[T]):
+    view: GridView2D[T]
+    y: int
+    def __init__(self, view: GridView2D[T], y: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, x: int) -> T: ...
+    def __setitem__(self, x: int, value: T) -> None: ...
+    def __iter__(self) -> Iterator[T]: ...
+
+def view_2d(grid: Grid2D[T]) -> GridView2D[T]: ...
+GridView = GridView2D
+view = view_2d
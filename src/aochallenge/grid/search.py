@@ -0,0 +1,394 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+import copy
+import heapq
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from typing import Any, Callable, Generic, TypeVar
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    _Coord2D,
+    _Coord3D,
+    manhattan_2d,
+    manhattan_3d,
+)
+from .flatgrid import FlatGrid2D, FlatGrid3D
+
+# The searches run on a flat copy of the grid surrounded by a sentinel
+# border, so neighbors are plain index additions, and distances and
+# predecessors are stored in arrays indexed the same way. Coordinates are
+# only used to convert the starts, goals and the results.
+#
+# Callbacks get the values of the cells, not their coordinates:
+# - passable(from_value, to_value) -> bool: whether a step is allowed,
+# - cost(from_value, to_value) -> int: the non-negative cost of a step.
+# A goal can be a coordinate, a collection of coordinates or a callable
+# getting the value of a cell. The search stops at the first goal reached.
+
+C = TypeVar("C", Coord2D, Coord3D)
+Passable = Callable[[Any, Any], bool]
+Cost = Callable[[Any, Any], int]
+Goal = Any  # coordinate, iterable of coordinates or Callable[[Any], bool]
+
+_BORDER = object()
+_NONE = -1
+
+
+class SearchResult(Generic[C]):
+    def __init__(
+        self,
+        fgrid: FlatGrid2D[Any] | FlatGrid3D[Any],
+        dist: array[int],
+        prev: array[int],
+        goal: int,
+    ) -> None:
+        self._fgrid = fgrid
+        self._index: Callable[[Any], int] = fgrid.index
+        self._coord: Callable[[int], C] = fgrid.coord  # type: ignore[assignment]
+        self._dist = dist
+        self._prev = prev
+        self._goal = goal
+
+    @property
+    def goal(self) -> C | None:
+        """The goal reached, None if no goal was given or reached"""
+        if self._goal == _NONE:
+            return None
+        return self._coord(self._goal)
+
+    def reached(self, pos: C | tuple[int, ...]) -> bool:
+        return self._dist[self._index(pos)] != _NONE
+
+    def distance(self, pos: C | tuple[int, ...] | None = None) -> int | None:
+        """Distance of a cell (or the goal reached) from the closest start,
+        None if it is not reached"""
+        i = self._goal if pos is None else self._index(pos)
+        if i == _NONE or self._dist[i] == _NONE:
+            return None
+        return self._dist[i]
+
+    def path(self, pos: C | tuple[int, ...] | None = None) -> list[C]:
+        """Cells of a shortest path from a start to the cell (or the goal
+        reached), both ends included. Empty if the cell is not reached."""
+        i = self._goal if pos is None else self._index(pos)
+        if i == _NONE or self._dist[i] == _NONE:
+            return []
+        prev = self._prev
+        indices = []
+        while i != _NONE:
+            indices.append(i)
+            i = prev[i]
+        coord = self._coord
+        return [coord(i) for i in reversed(indices)]
+
+    def distance_grid(self, default: Any = None) -> Any:
+        """Distances as a list-of-lists grid, unreached cells are default"""
+        distances = copy.copy(self._fgrid)
+        distances.cells = [default if d == _NONE else d for d in self._dist]
+        return distances.to_grid()
+
+
+########## 2D ####################
+
+
+def bfs_2d(
+    grid: Grid2D[Any],
+    start: _Coord2D | Iterable[_Coord2D],
+    goal: Goal = None,
+    *,
+    passable: Passable | None = None,
+    connectivity: int = 4,
+) -> SearchResult[Coord2D]:
+    fgrid = FlatGrid2D(grid, _BORDER)
+    return _bfs(fgrid, fgrid.offsets(connectivity), start, goal, passable)
+
+
+def bfs_01_2d(
+    grid: Grid2D[Any],
+    start: _Coord2D | Iterable[_Coord2D],
+    goal: Goal = None,
+    *,
+    cost: Cost,
+    passable: Passable | None = None,
+    connectivity: int = 4,
+) -> SearchResult[Coord2D]:
+    """BFS for step costs of 0 or 1"""
+    fgrid = FlatGrid2D(grid, _BORDER)
+    return _bfs_01(fgrid, fgrid.offsets(connectivity), start, goal, cost, passable)
+
+
+def dijkstra_2d(
+    grid: Grid2D[Any],
+    start: _Coord2D | Iterable[_Coord2D],
+    goal: Goal = None,
+    *,
+    cost: Cost | None = None,
+    passable: Passable | None = None,
+    connectivity: int = 4,
+) -> SearchResult[Coord2D]:
+    fgrid = FlatGrid2D(grid, _BORDER)
+    return _dijkstra(
+        fgrid, fgrid.offsets(connectivity), start, goal, cost, passable, None
+    )
+
+
+def astar_2d(
+    grid: Grid2D[Any],
+    start: _Coord2D | Iterable[_Coord2D],
+    goal: _Coord2D,
+    *,
+    cost: Cost | None = None,
+    passable: Passable | None = None,
+    heuristic: Callable[[Coord2D, Coord2D], int] = manhattan_2d,
+    connectivity: int = 4,
+) -> SearchResult[Coord2D]:
+    """A* search, the heuristic must not overestimate the remaining cost
+    (manhattan_2d is admissible for 4-connectivity with costs >= 1)"""
+    fgrid = FlatGrid2D(grid, _BORDER)
+    target = Coord2D(*goal)
+    coord = fgrid.coord
+    return _dijkstra(
+        fgrid,
+        fgrid.offsets(connectivity),
+        start,
+        goal,
+        cost,
+        passable,
+        lambda i: heuristic(coord(i), target),
+    )
+
+
+########## 3D ####################
+
+
+def bfs_3d(
+    grid: Grid3D[Any],
+    start: _Coord3D | Iterable[_Coord3D],
+    goal: Goal = None,
+    *,
+    passable: Passable | None = None,
+    connectivity: int = 6,
+) -> SearchResult[Coord3D]:
+    fgrid = FlatGrid3D(grid, _BORDER)
+    return _bfs(fgrid, fgrid.offsets(connectivity), start, goal, passable)
+
+
+def bfs_01_3d(
+    grid: Grid3D[Any],
+    start: _Coord3D | Iterable[_Coord3D],
+    goal: Goal = None,
+    *,
+    cost: Cost,
+    passable: Passable | None = None,
+    connectivity: int = 6,
+) -> SearchResult[Coord3D]:
+    """BFS for step costs of 0 or 1"""
+    fgrid = FlatGrid3D(grid, _BORDER)
+    return _bfs_01(fgrid, fgrid.offsets(connectivity), start, goal, cost, passable)
+
+
+def dijkstra_3d(
+    grid: Grid3D[Any],
+    start: _Coord3D | Iterable[_Coord3D],
+    goal: Goal = None,
+    *,
+    cost: Cost | None = None,
+    passable: Passable | None = None,
+    connectivity: int = 6,
+) -> SearchResult[Coord3D]:
+    fgrid = FlatGrid3D(grid, _BORDER)
+    return _dijkstra(
+        fgrid, fgrid.offsets(connectivity), start, goal, cost, passable, None
+    )
+
+
+def astar_3d(
+    grid: Grid3D[Any],
+    start: _Coord3D | Iterable[_Coord3D],
+    goal: _Coord3D,
+    *,
+    cost: Cost | None = None,
+    passable: Passable | None = None,
+    heuristic: Callable[[Coord3D, Coord3D], int] = manhattan_3d,
+    connectivity: int = 6,
+) -> SearchResult[Coord3D]:
+    """A* search, the heuristic must not overestimate the remaining cost
+    (manhattan_3d is admissible for 6-connectivity with costs >= 1)"""
+    fgrid = FlatGrid3D(grid, _BORDER)
+    target = Coord3D(*goal)
+    coord = fgrid.coord
+    return _dijkstra(
+        fgrid,
+        fgrid.offsets(connectivity),
+        start,
+        goal,
+        cost,
+        passable,
+        lambda i: heuristic(coord(i), target),
+    )
+
+
+########## Simplify 2D interface ####################
+
+bfs = bfs_2d
+bfs_01 = bfs_01_2d
+dijkstra = dijkstra_2d
+astar = astar_2d
+
+########## private functions ####################
+
+_Flat = FlatGrid2D[Any] | FlatGrid3D[Any]
+
+
+def _is_coord(value: Any) -> bool:
+    return isinstance(value, tuple) and bool(value) and isinstance(value[0], int)
+
+
+def _start_indices(fgrid: _Flat, start: Any) -> list[int]:
+    starts = [start] if _is_coord(start) else start
+    return [fgrid.index(s) for s in starts]
+
+
+def _goal_check(fgrid: _Flat, goal: Goal) -> Callable[[int], bool] | None:
+    if goal is None:
+        return None
+    if callable(goal):
+        cells = fgrid.cells
+        return lambda i: bool(goal(cells[i]))
+    goals = [goal] if _is_coord(goal) else goal
+    return {fgrid.index(g) for g in goals}.__contains__
+
+
+def _bfs(
+    fgrid: _Flat,
+    offsets: list[int],
+    start: Any,
+    goal: Goal,
+    passable: Passable | None,
+) -> SearchResult[Any]:
+    cells = fgrid.cells
+    dist = array("q", [_NONE]) * len(cells)
+    prev = array("q", [_NONE]) * len(cells)
+    is_goal = _goal_check(fgrid, goal)
+    queue = deque(_start_indices(fgrid, start))
+    for i in queue:
+        dist[i] = 0
+    while queue:
+        i = queue.popleft()
+        if is_goal is not None and is_goal(i):
+            return SearchResult(fgrid, dist, prev, i)
+        d = dist[i] + 1
+        v = cells[i]
+        for o in offsets:
+            j = i + o
+            if dist[j] != _NONE:
+                continue
+            w = cells[j]
+            if w is _BORDER or passable is not None and not passable(v, w):
+                continue
+            dist[j] = d
+            prev[j] = i
+            queue.append(j)
+    return SearchResult(fgrid, dist, prev, _NONE)
+
+
+def _bfs_01(
+    fgrid: _Flat,
+    offsets: list[int],
+    start: Any,
+    goal: Goal,
+    cost: Cost,
+    passable: Passable | None,
+) -> SearchResult[Any]:
+    cells = fgrid.cells
+    dist = array("q", [_NONE]) * len(cells)
+    prev = array("q", [_NONE]) * len(cells)
+    done = bytearray(len(cells))
+    is_goal = _goal_check(fgrid, goal)
+    queue = deque(_start_indices(fgrid, start))
+    for i in queue:
+        dist[i] = 0
+    while queue:
+        i = queue.popleft()
+        if done[i]:
+            continue
+        done[i] = 1
+        if is_goal is not None and is_goal(i):
+            return SearchResult(fgrid, dist, prev, i)
+        d = dist[i]
+        v = cells[i]
+        for o in offsets:
+            j = i + o
+            if done[j]:
+                continue
+            w = cells[j]
+            if w is _BORDER or passable is not None and not passable(v, w):
+                continue
+            c = cost(v, w)
+            if dist[j] == _NONE or d + c < dist[j]:
+                dist[j] = d + c
+                prev[j] = i
+                if c:
+                    queue.append(j)
+                else:
+                    queue.appendleft(j)
+    return SearchResult(fgrid, dist, prev, _NONE)
+
+
+def _dijkstra(
+    fgrid: _Flat,
+    offsets: list[int],
+    start: Any,
+    goal: Goal,
+    cost: Cost | None,
+    passable: Passable | None,
+    heuristic: Callable[[int], int] | None,
+) -> SearchResult[Any]:
+    # Also A*, if a heuristic is given: the heap is then ordered by the
+    # estimated total cost, which is calculated once per cell
+    cells = fgrid.cells
+    dist = array("q", [_NONE]) * len(cells)
+    prev = array("q", [_NONE]) * len(cells)
+    estimate = None if heuristic is None else array("q", [_NONE]) * len(cells)
+    done = bytearray(len(cells))
+    is_goal = _goal_check(fgrid, goal)
+    heap: list[tuple[int, int]] = []
+    for i in _start_indices(fgrid, start):
+        dist[i] = 0
+        heap.append((0 if heuristic is None else heuristic(i), i))
+    heapq.heapify(heap)
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    while heap:
+        _, i = heappop(heap)
+        if done[i]:
+            continue
+        done[i] = 1
+        if is_goal is not None and is_goal(i):
+            return SearchResult(fgrid, dist, prev, i)
+        d = dist[i]
+        v = cells[i]
+        for o in offsets:
+            j = i + o
+            if done[j]:
+                continue
+            w = cells[j]
+            if w is _BORDER or passable is not None and not passable(v, w):
+                continue
+            nd = d + 1 if cost is None else d + cost(v, w)
+            if dist[j] == _NONE or nd < dist[j]:
+                dist[j] = nd
+                prev[j] = i
+                if heuristic is None or estimate is None:
+                    heappush(heap, (nd, j))
+                else:
+                    if estimate[j] == _NONE:
+                        estimate[j] = heuristic(j)
+                    heappush(heap, (nd + estimate[j], j))
+    return SearchResult(fgrid, dist, prev, _NONE)
@@ -0,0 +1,32 @@
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D, manhattan_2d as manhattan_2d, manhattan_3d as manhattan_3d
+from .flatgrid import FlatGrid2D as FlatGrid2D, FlatGrid3D as FlatGrid3D
+from array import array
+from collections.abc import Iterable
+from typing import Any, Callable, Generic, TypeVar
+
+C = TypeVar('C', Coord2D, Coord3D)
+Passable = Callable[[Any, Any], bool]
+Cost = Callable[[Any, Any], int]
+Goal = Any
+
+class SearchResult(Generic[C]):
+    def __init__(self, fgrid: Union[FlatGrid2D[Any], FlatGrid3D[Any]], dist: array[int], prev: array[int], goal: int) -> None: ...
+    @property
+    def goal(self) -> Union[C, None]: ...
+    def reached(self, pos: Union[C, tuple[int, ...]]) -> bool: ...
+    def distance(self, pos: Union[C, tuple[int, ...], None] = ...) -> Union[int, None]: ...
+    def path(self, pos: Union[C, tuple[int, ...], None] = ...) -> list[C]: ...
+    def distance_grid(self, default: Any = ...) -> Any: ...
+
+def bfs_2d(grid: Grid2D[Any], start: Union[_Coord2D, Iterable[_Coord2D]], goal: Goal = ..., *, passable: Union[Passable, None] = ..., connectivity: int = ...) -> SearchResult[Coord2D]: ...
+def bfs_01_2d(grid: Grid2D[Any], start: Union[_Coord2D, Iterable[_Coord2D]], goal: Goal = ..., *, cost: Cost, passable: Union[Passable, None] = ..., connectivity: int = ...) -> SearchResult[Coord2D]: ...
+def dijkstra_2d(grid: Grid2D[Any], start: Union[_Coord2D, Iterable[_Coord2D]], goal: Goal = ..., *, cost: Union[Cost, None] = ..., passable: Union[Passable, None] = ..., connectivity: int = ...) -> SearchResult[Coord2D]: ...
+def astar_2d(grid: Grid2D[Any], start: Union[_Coord2D, Iterable[_Coord2D]], goal: _Coord2D, *, cost: Union[Cost, None] = ..., passable: Union[Passable, None] = ..., heuristic: Callable[[Coord2D, Coord2D], int] = ..., connectivity: int = ...) -> SearchResult[Coord2D]: ...
+def bfs_3d(grid: Grid3D[Any], start: Union[_Coord3D, Iterable[_Coord3D]], goal: Goal = ..., *, passable: Union[Passable, None] = ..., connectivity: int = ...) -> SearchResult[Coord3D]: ...
+def bfs_01_3d(grid: Grid3D[Any], start: Union[_Coord3D, Iterable[_Coord3D]], goal: Goal = ..., *, cost: Cost, passable: Union[Passable, None] = ..., connectivity: int = ...) -> SearchResult[Coord3D]: ...
+def dijkstra_3d(grid: Grid3D[Any], start: Union[_Coord3D, Iterable[_Coord3D]], goal: Goal = ..., *, cost: Union[Cost, None] = ..., passable: Union[Passable, None] = ..., connectivity: int = ...) -> SearchResult[Coord3D]: ...
+def astar_3d(grid: Grid3D[Any], start: Union[_Coord3D, Iterable[_Coord3D]], goal: _Coord3D, *, cost: Union[Cost, None] = ..., passable: Union[Passable, None] = ..., heuristic: Callable[[Coord3D, Coord3D], int] = ..., connectivity: int = ...) -> SearchResult[Coord3D]: ...
+bfs = bfs_2d
+bfs_01 = bfs_01_2d
+dijkstra = dijkstra_2d
+astar = astar_2d
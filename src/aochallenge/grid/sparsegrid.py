@@ -0,0 +1,290 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from typing import Any, Generic, Iterator
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    MutableGrid2D,
+    MutableGrid3D,
+    T,
+    _Coord2D,
+    _Coord3D,
+    _c2d,
+    _c3d,
+    _directions_2d,
+    _directions_3d,
+)
+
+# Sparse grids are unbounded: cells are stored in fixed-size square (cubic)
+# tiles, which are allocated on the first write of a non-default value. A
+# tile is a flat list, so cells of the same area are close to each other,
+# and memory scales with the occupied area instead of the bounding
+# rectangle. Cells of missing tiles have the default value.
+#
+# Every tile keeps the number of its non-default cells, and it is freed when
+# the last one is reset to the default. The bounding box of the non-default
+# cells is extended on every write. Resetting a cell on its border marks it
+# stale, and it is recomputed on the next use from the tiles on the border
+# (the tile keys give the extreme tiles, only their cells are scanned).
+#
+# Coordinates can be negative; the tile of a cell is found by shifting (the
+# tile size is a power of two), which rounds towards negative infinity.
+
+
+class _BoundingBox(Generic[T]):
+    default: T
+    shift: int
+    mask: int
+    tiles: dict[Any, list[T]]
+    _counts: dict[Any, int]
+    _min: list[int] | None
+    _max: list[int]
+    _stale: bool
+
+    def _extend(self, pos: tuple[int, ...]) -> None:
+        if self._min is None:
+            self._min, self._max = list(pos), list(pos)
+            return
+        for axis, c in enumerate(pos):
+            if c < self._min[axis]:
+                self._min[axis] = c
+            elif c > self._max[axis]:
+                self._max[axis] = c
+
+    def _clear(self, key: tuple[int, ...], pos: tuple[int, ...]) -> None:
+        # A non-default cell of tile `key` is reset to the default
+        count = self._counts[key] - 1
+        if count:
+            self._counts[key] = count
+        else:
+            del self._counts[key], self.tiles[key]
+        if self._min is not None and not self._stale:
+            low, high = self._min, self._max
+            self._stale = any(c == low[i] or c == high[i] for i, c in enumerate(pos))
+
+    def _live_box(self) -> tuple[list[int], list[int]] | None:
+        if self._stale:
+            self._stale = False
+            self._min = None
+            if self.tiles:
+                keys = list(self.tiles)
+                dims = range(len(keys[0]))
+                self._min = [min(self._axis_cells(a, min(k[a] for k in keys))) for a in dims]
+                self._max = [max(self._axis_cells(a, max(k[a] for k in keys))) for a in dims]
+        if self._min is None:
+            return None
+        return self._min, self._max
+
+    def _axis_cells(self, axis: int, t: int) -> list[int]:
+        # Coordinates (on `axis`) of the non-default cells of the tiles of
+        # the layer `t` (tile coordinate on `axis`)
+        shift, mask, default = axis * self.shift, self.mask, self.default
+        base = t << self.shift
+        return [
+            base + ((i >> shift) & mask)
+            for key, tile in self.tiles.items()
+            if key[axis] == t
+            for i, value in enumerate(tile)
+            if value != default
+        ]
+
+
+class SparseGrid2D(_BoundingBox[T]):
+    def __init__(self, default: T, tile: int = 16) -> None:
+        if tile <= 0 or tile & (tile - 1):
+            raise ValueError(f"Tile size must be a power of two: {tile}")
+        self.default = default
+        self.tile = tile
+        self.shift = tile.bit_length() - 1
+        self.mask = tile - 1
+        self.tiles: dict[tuple[int, int], list[T]] = {}
+        self._counts: dict[tuple[int, int], int] = {}
+        self._min: list[int] | None = None
+        self._max: list[int] = [0, 0]
+        self._stale = False
+
+    @classmethod
+    def from_grid(
+        cls, grid: Grid2D[T], default: T, origin: _Coord2D = (0, 0), tile: int = 16
+    ) -> SparseGrid2D[T]:
+        sgrid = cls(default, tile)
+        ox, oy = origin
+        for y, row in enumerate(grid):
+            for x, value in enumerate(row):
+                if value != default:
+                    sgrid.set_element((ox + x, oy + y), value)
+        return sgrid
+
+    def __getitem__(self, pos: _Coord2D) -> T:
+        return self.get_element(pos)
+
+    def __setitem__(self, pos: _Coord2D, value: T) -> None:
+        self.set_element(pos, value)
+
+    def get_element(self, pos: _Coord2D) -> T:
+        x, y = pos
+        shift = self.shift
+        tile = self.tiles.get((x >> shift, y >> shift))
+        if tile is None:
+            return self.default
+        mask = self.mask
+        return tile[((y & mask) << shift) | (x & mask)]
+
+    def set_element(self, pos: _Coord2D, value: T) -> None:
+        x, y = pos
+        shift = self.shift
+        key = (x >> shift, y >> shift)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if value == self.default:
+                return
+            tile = self.tiles[key] = [self.default] * (self.tile * self.tile)
+            self._counts[key] = 0
+        mask = self.mask
+        i = ((y & mask) << shift) | (x & mask)
+        old, tile[i] = tile[i], value
+        if old == self.default:
+            if value != self.default:
+                self._counts[key] += 1
+                self._extend((x, y))
+        elif value == self.default:
+            self._clear(key, (x, y))
+
+    def neighbors(self, pos: _Coord2D, connectivity: int = 4) -> list[Coord2D]:
+        p = _c2d(pos)
+        return [p + d for d in _directions_2d(connectivity)]
+
+    def iter_grid(self) -> Iterator[tuple[Coord2D, T]]:
+        """Non-default cells, tile by tile"""
+        shift, mask, default = self.shift, self.mask, self.default
+        for (tx, ty), tile in sorted(self.tiles.items()):
+            bx, by = tx << shift, ty << shift
+            for i, value in enumerate(tile):
+                if value != default:
+                    yield Coord2D(bx + (i & mask), by + (i >> shift)), value
+
+    @property
+    def bounds(self) -> tuple[Coord2D, Coord2D] | None:
+        """Corners (inclusive) of the bounding box of the non-default values,
+        or None if there are none"""
+        box = self._live_box()
+        if box is None:
+            return None
+        return Coord2D(*box[0]), Coord2D(*box[1])
+
+    def to_grid(self) -> MutableGrid2D[T]:
+        """Dense grid of the bounding box (see `bounds` for the origin)"""
+        box = self._live_box()
+        if box is None:
+            return []
+        (x1, y1), (x2, y2) = box
+        get = self.get_element
+        return [[get((x, y)) for x in range(x1, x2 + 1)] for y in range(y1, y2 + 1)]
+
+
+class SparseGrid3D(_BoundingBox[T]):
+    def __init__(self, default: T, tile: int = 8) -> None:
+        if tile <= 0 or tile & (tile - 1):
+            raise ValueError(f"Tile size must be a power of two: {tile}")
+        self.default = default
+        self.tile = tile
+        self.shift = tile.bit_length() - 1
+        self.mask = tile - 1
+        self.tiles: dict[tuple[int, int, int], list[T]] = {}
+        self._counts: dict[tuple[int, int, int], int] = {}
+        self._min: list[int] | None = None
+        self._max: list[int] = [0, 0, 0]
+        self._stale = False
+
+    @classmethod
+    def from_grid(
+        cls, grid: Grid3D[T], default: T, origin: _Coord3D = (0, 0, 0), tile: int = 8
+    ) -> SparseGrid3D[T]:
+        sgrid = cls(default, tile)
+        ox, oy, oz = origin
+        for z, plane in enumerate(grid):
+            for y, row in enumerate(plane):
+                for x, value in enumerate(row):
+                    if value != default:
+                        sgrid.set_element((ox + x, oy + y, oz + z), value)
+        return sgrid
+
+    def __getitem__(self, pos: _Coord3D) -> T:
+        return self.get_element(pos)
+
+    def __setitem__(self, pos: _Coord3D, value: T) -> None:
+        self.set_element(pos, value)
+
+    def get_element(self, pos: _Coord3D) -> T:
+        x, y, z = pos
+        shift = self.shift
+        tile = self.tiles.get((x >> shift, y >> shift, z >> shift))
+        if tile is None:
+            return self.default
+        mask = self.mask
+        return tile[((((z & mask) << shift) | (y & mask)) << shift) | (x & mask)]
+
+    def set_element(self, pos: _Coord3D, value: T) -> None:
+        x, y, z = pos
+        shift = self.shift
+        key = (x >> shift, y >> shift, z >> shift)
+        tile = self.tiles.get(key)
+        if tile is None:
+            if value == self.default:
+                return
+            tile = self.tiles[key] = [self.default] * (self.tile**3)
+            self._counts[key] = 0
+        mask = self.mask
+        i = ((((z & mask) << shift) | (y & mask)) << shift) | (x & mask)
+        old, tile[i] = tile[i], value
+        if old == self.default:
+            if value != self.default:
+                self._counts[key] += 1
+                self._extend((x, y, z))
+        elif value == self.default:
+            self._clear(key, (x, y, z))
+
+    def neighbors(self, pos: _Coord3D, connectivity: int = 6) -> list[Coord3D]:
+        p = _c3d(pos)
+        return [p + d for d in _directions_3d(connectivity)]
+
+    def iter_grid(self) -> Iterator[tuple[Coord3D, T]]:
+        """Non-default cells, tile by tile"""
+        shift, mask, default = self.shift, self.mask, self.default
+        for (tx, ty, tz), tile in sorted(self.tiles.items()):
+            bx, by, bz = tx << shift, ty << shift, tz << shift
+            for i, value in enumerate(tile):
+                if value != default:
+                    yield Coord3D(
+                        bx + (i & mask), by + ((i >> shift) & mask), bz + (i >> 2 * shift)
+                    ), value
+
+    @property
+    def bounds(self) -> tuple[Coord3D, Coord3D] | None:
+        """Corners (inclusive) of the bounding box of the non-default values,
+        or None if there are none"""
+        box = self._live_box()
+        if box is None:
+            return None
+        return Coord3D(*box[0]), Coord3D(*box[1])
+
+    def to_grid(self) -> MutableGrid3D[T]:
+        """Dense grid of the bounding box (see `bounds` for the origin)"""
+        box = self._live_box()
+        if box is None:
+            return []
+        (x1, y1, z1), (x2, y2, z2) = box
+        get = self.get_element
+        return [
+            [[get((x, y, z)) for x in range(x1, x2 + 1)] for y in range(y1, y2 + 1)]
+            for z in range(z1, z2 + 1)
+        ]
+
+
+########## Simplify 2D interface ####################
+
+SparseGrid = SparseGrid2D
@@ -0,0 +1,43 @@
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D, MutableGrid2D as MutableGrid2D, MutableGrid3D as MutableGrid3D, T as T
+from typing import Generic, Iterator
+
+class _BoundingBox(Generic[T]): ...
+
+class SparseGrid2D(_BoundingBox[T]):
+    default: T
+    tile: int
+    shift: int
+    mask: int
+    tiles: dict[tuple[int, int], list[T]]
+    def __init__(self, default: T, tile: int = ...) -> None: ...
+    @classmethod
+    def from_grid(cls, grid: Grid2D[T], default: T, origin: _Coord2D = ..., tile: int = ...) -> SparseGrid2D[T]: ...
+    def __getitem__(self, pos: _Coord2D) -> T: ...
+    def __setitem__(self, pos: _Coord2D, value: T) -> None: ...
+    def get_element(self, pos: _Coord2D) -> T: ...
+    def set_element(self, pos: _Coord2D, value: T) -> None: ...
+    def neighbors(self, pos: _Coord2D, connectivity: int = ...) -> list[Coord2D]: ...
+    def iter_grid(self) -> Iterator[tuple[Coord2D, T]]: ...
+    @property
+    def bounds(self) -> Union[tuple[Coord2D, Coord2D], None]: ...
+    def to_grid(self) -> MutableGrid2D[T]: ...
+
+class SparseGrid3D(_BoundingBox[T]):
+    default: T
+    tile: int
+    shift: int
+    mask: int
+    tiles: dict[tuple[int, int, int], list[T]]
+    def __init__(self, default: T, tile: int = ...) -> None: ...
+    @classmethod
+    def from_grid(cls, grid: Grid3D[T], default: T, origin: _Coord3D = ..., tile: int = ...) -> SparseGrid3D[T]: ...
+    def __getitem__(self, pos: _Coord3D) -> T: ...
+    def __setitem__(self, pos: _Coord3D, value: T) -> None: ...
+    def get_element(self, pos: _Coord3D) -> T: ...
+    def set_element(self, pos: _Coord3D, value: T) -> None: ...
+    def neighbors(self, pos: _Coord3D, connectivity: int = ...) -> list[Coord3D]: ...
+    def iter_grid(self) -> Iterator[tuple[Coord3D, T]]: ...
+    @property
+    def bounds(self) -> Union[tuple[Coord3D, Coord3D], None]: ...
+    def to_grid(self) -> MutableGrid3D[T]: ...
+SparseGrid = SparseGrid2D
@@ -0,0 +1,208 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+from random import Random
+from typing import Generic, Hashable, Iterator
+
+from . import (
+    Coord2D,
+    Coord3D,
+    Grid2D,
+    Grid3D,
+    MutableGrid2D,
+    MutableGrid3D,
+    T,
+    _Coord2D,
+    _Coord3D,
+    dimensions_2d,
+    dimensions_3d,
+)
+
+# Zobrist hashing: every (cell, value) pair has a random 64-bit key, and the
+# fingerprint of a grid is the XOR of the keys of its cells. Changing a cell
+# from `old` to `new` XORs out the key of `old` and XORs in the key of
+# `new`, so the fingerprint is kept up to date in O(1) per write, instead of
+# hashing the whole grid (O(area)) every time a state is looked up.
+#
+# The keys of a value are generated on its first use, from a generator
+# seeded by the seed and the value, so grids of the same size and seed have
+# the same fingerprint for the same content. Values must be hashable.
+#
+# Different states may (very rarely) have the same fingerprint: use
+# `snapshot()` to compare the states themselves where it matters.
+#
+# Indexing returns row (and plane) proxies, whose writes also update the
+# fingerprint, so the grid functions (set_element_2d, ...) keep it valid.
+
+
+class _ZobristGrid(Generic[T]):
+    fingerprint: int
+    seed: int
+    _size: int
+    _keys: dict[Hashable, list[int]]
+
+    def _table(self, value: T) -> list[int]:
+        keys = self._keys.get(value)
+        if keys is None:
+            rng = Random(f"{self.seed}:{value!r}")
+            keys = self._keys[value] = [rng.getrandbits(64) for _ in range(self._size)]
+        return keys
+
+    def _write(self, row: list[T], x: int, index: int, value: T) -> None:
+        old = row[x]
+        if old == value:
+            return
+        self.fingerprint ^= self._table(old)[index] ^ self._table(value)[index]
+        row[x] = value
+
+    def _hash_cells(self, cells: Iterator[T]) -> int:
+        fingerprint = 0
+        for i, value in enumerate(cells):
+            fingerprint ^= self._table(value)[i]
+        return fingerprint
+
+
+class ZobristGrid2D(_ZobristGrid[T]):
+    def __init__(self, grid: Grid2D[T], seed: int = 0) -> None:
+        """Copy of `grid` with an incrementally updated `fingerprint`"""
+        self.width, self.height = dimensions_2d(grid)
+        self.seed = seed
+        self._size = self.width * self.height
+        self._keys = {}
+        self.cells: MutableGrid2D[T] = [list(row) for row in grid]
+        self.fingerprint = self.rehash()
+
+    def __len__(self) -> int:
+        return self.height
+
+    def __getitem__(self, y: int) -> _Row[T]:
+        if y < 0:
+            y += self.height
+        return _Row(self, self.cells[y], y * self.width)
+
+    def __iter__(self) -> Iterator[_Row[T]]:
+        width = self.width
+        return (_Row(self, row, y * width) for y, row in enumerate(self.cells))
+
+    def get_element(self, pos: _Coord2D) -> T:
+        x, y = pos
+        return self.cells[y][x]
+
+    def set_element(self, pos: _Coord2D, value: T) -> None:
+        x, y = pos
+        self._write(self.cells[y], x, y * self.width + x, value)
+
+    def iter_grid(self) -> Iterator[tuple[Coord2D, T]]:
+        for y, row in enumerate(self.cells):
+            for x, value in enumerate(row):
+                yield Coord2D(x, y), value
+
+    def rehash(self) -> int:
+        """Fingerprint computed from scratch"""
+        return self._hash_cells(v for row in self.cells for v in row)
+
+    def snapshot(self) -> tuple[tuple[T, ...], ...]:
+        """Immutable copy of the state (to verify fingerprint matches)"""
+        return tuple(map(tuple, self.cells))
+
+    def to_grid(self) -> MutableGrid2D[T]:
+        return [row.copy() for row in self.cells]
+
+
+class ZobristGrid3D(_ZobristGrid[T]):
+    def __init__(self, grid: Grid3D[T], seed: int = 0) -> None:
+        """See ZobristGrid2D"""
+        self.width, self.height, self.depth = dimensions_3d(grid)
+        self.seed = seed
+        self._size = self.width * self.height * self.depth
+        self._keys = {}
+        self.cells: MutableGrid3D[T] = [[list(row) for row in plane] for plane in grid]
+        self.fingerprint = self.rehash()
+
+    def __len__(self) -> int:
+        return self.depth
+
+    def __getitem__(self, z: int) -> _Plane[T]:
+        if z < 0:
+            z += self.depth
+        return _Plane(self, self.cells[z], z * self.height * self.width)
+
+    def __iter__(self) -> Iterator[_Plane[T]]:
+        size = self.height * self.width
+        return (_Plane(self, plane, z * size) for z, plane in enumerate(self.cells))
+
+    def get_element(self, pos: _Coord3D) -> T:
+        x, y, z = pos
+        return self.cells[z][y][x]
+
+    def set_element(self, pos: _Coord3D, value: T) -> None:
+        x, y, z = pos
+        self._write(self.cells[z][y], x, (z * self.height + y) * self.width + x, value)
+
+    def iter_grid(self) -> Iterator[tuple[Coord3D, T]]:
+        for z, plane in enumerate(self.cells):
+            for y, row in enumerate(plane):
+                for x, value in enumerate(row):
+                    yield Coord3D(x, y, z), value
+
+    def rehash(self) -> int:
+        """Fingerprint computed from scratch"""
+        return self._hash_cells(v for plane in self.cells for row in plane for v in row)
+
+    def snapshot(self) -> tuple[tuple[tuple[T, ...], ...], ...]:
+        """Immutable copy of the state (to verify fingerprint matches)"""
+        return tuple(tuple(map(tuple, plane)) for plane in self.cells)
+
+    def to_grid(self) -> MutableGrid3D[T]:
+        return [[row.copy() for row in plane] for plane in self.cells]
+
+
+class _Row(Generic[T]):
+    __slots__ = ("grid", "row", "start")
+
+    def __init__(self, grid: _ZobristGrid[T], row: list[T], start: int) -> None:
+        self.grid = grid
+        self.row = row
+        self.start = start  # cell index of the first cell
+
+    def __len__(self) -> int:
+        return len(self.row)
+
+    def __getitem__(self, x: int) -> T:
+        return self.row[x]
+
+    def __setitem__(self, x: int, value: T) -> None:
+        if not isinstance(x, int):
+            raise TypeError("ZobristGrid cells can only be written one by one")
+        if x < 0:
+            x += len(self.row)
+        self.grid._write(self.row, x, self.start + x, value)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.row)
+
+
+class _Plane(Generic[T]):
+    __slots__ = ("grid", "plane", "start")
+
+    def __init__(self, grid: _ZobristGrid[T], plane: list[list[T]], start: int) -> None:
+        self.grid = grid
+        self.plane = plane
+        self.start = start
+
+    def __len__(self) -> int:
+        return len(self.plane)
+
+    def __getitem__(self, y: int) -> _Row[T]:
+        if y < 0:
+            y += len(self.plane)
+        row = self.plane[y]
+        return _Row(self.grid, row, self.start + y * len(row))
+
+    def __iter__(self) -> Iterator[_Row[T]]:
+        return (self[y] for y in range(len(self.plane)))
+
+
+########## Simplify 2D interface ####################
+
+ZobristGrid = ZobristGrid2D
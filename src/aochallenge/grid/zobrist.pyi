@@ -0,0 +1,58 @@
+from . import Coord2D as Coord2D, Coord3D as Coord3D, Grid2D as Grid2D, Grid3D as Grid3D, MutableGrid2D as MutableGrid2D, MutableGrid3D as MutableGrid3D, T as T
+from typing import Generic, Hashable, Iterator
+
+class _ZobristGrid(Generic[T]):
+    fingerprint: int
+    seed: int
+
+class ZobristGrid2D(_ZobristGrid[T]):
+    width: int
+    height: int
+    cells: MutableGrid2D[T]
+    def __init__(self, grid: Grid2D[T], seed: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, y: int) -> _Row[T]: ...
+    def __iter__(self) -> Iterator[_Row[T]]: ...
+    def get_element(self, pos: _Coord2D) -> T: ...
+    def set_element(self, pos: _Coord2D, value: T) -> None: ...
+    def iter_grid(self) -> Iterator[tuple[Coord2D, T]]: ...
+    def rehash(self) -> int: ...
+    def snapshot(self) -> tuple[tuple[T, ...], ...]: ...
+    def to_grid(self) -> MutableGrid2D[T]: ...
+
+class ZobristGrid3D(_ZobristGrid[T]):
+    width: int
+    height: int
+    depth: int
+    cells: MutableGrid3D[T]
+    def __init__(self, grid: Grid3D[T], seed: int = ...) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, z: int) -> _Plane[T]: ...
+    def __iter__(self) -> Iterator[_Plane[T]]: ...
+    def get_element(self, pos: _Coord3D) -> T: ...
+    def set_element(self, pos: _Coord3D, value: T) -> None: ...
+    def iter_grid(self) -> Iterator[tuple[Coord3D, T]]: ...
+    def rehash(self) -> int: ...
+    def snapshot(self) -> tuple[tuple[tuple[T, ...], ...], ...]: ...
+    def to_grid(self) -> MutableGrid3D[T]: ...
+
+class _Row(Generic[T]):
+    grid: _ZobristGrid[T]
+    row: list[T]
+    start: int
+    def __init__(self, grid: _ZobristGrid[T], row: list[T], start: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, x: int) -> T: ...
+    def __setitem__(self, x: int, value: T) -> None: ...
+    def __iter__(self) -> Iterator[T]: ...
+
+class _Plane(Generic[T]):
+    grid: _ZobristGrid[T]
+    plane: list[list[T]]
+    start: int
+    def __init__(self, grid: _ZobristGrid[T], plane: list[list[T]], start: int) -> None: ...
+    def __len__(self) -> int: ...
+    def __getitem__(self, y: int) -> _Row[T]: ...
+    def __iter__(self) -> Iterator[_Row[T]]: ...
+
+ZobristGrid = ZobristGrid2D
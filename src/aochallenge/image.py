@@ -1,24 +1,206 @@
 #!/usr/bin/python3
 
-from PIL import Image
-from typing import TypeAlias
+from __future__ import annotations
+import threading
+from queue import Queue
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Any, Generic, TypeAlias
 
-from .grid import Grid2D, iter_grid, T
+from .grid import Grid2D, T
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 ColorLUT: TypeAlias = dict[T, int]
 
+# The image is built in one buffer, which is passed to Pillow by a single
+# frombytes call: every row is converted by a C-level map over the lookup
+# table and joined. With at most 256 colors the buffer holds palette
+# indices (one byte per pixel), otherwise RGB triplets.
+
+
+def save_image(
+    filename: str, grid: Grid2D[T], colors: ColorLUT[T], scale: int = 1
+) -> None:
+    """Save the grid as an image (RGB), every cell as a `scale` x `scale`
+    square of its color"""
+    # Pillow is imported on first use only, it is slow to load and optional
+    from PIL import Image
 
-def save_image(filename: str, grid: Grid2D[T], colors: ColorLUT[T]) -> None:
-    lut = {}
     width = len(grid[0])
     height = len(grid)
-    img = Image.new("RGB", (width, height))
-    px = img.load()  # type: ignore[func-returns-value]
+    if len(colors) <= 256:
+        data = _palette_data(grid, _palette_index(colors))
+        img = _palette_image(data, (width, height), colors).convert("RGB")
+    else:
+        lut = {k: _rgb(c) for k, c in colors.items()}
+        data = b"".join(b"".join(map(lut.__getitem__, row)) for row in grid)
+        img = Image.frombytes("RGB", (width, height), data)
+    img = _scaled(img, scale)
+    img.save(filename)
 
-    for k, c in colors.items():
-        lut[k] = ((c >> 16) & 0xFF, (c >> 8) & 0xFF, c & 0xFF)
 
-    for pos, v in iter_grid(grid):
-        px[pos.x, pos.y] = lut[v]
+# Animations are written while the simulation runs. Frames are converted to
+# palette index buffers by `add` (so the grid can be modified right after),
+# and put into a bounded queue, from which a background thread encodes and
+# writes them. If the encoder falls behind, `add` blocks, so at most
+# `maxqueue` frames are held in memory.
+#
+# A GIF file is written frame by frame, using Pillow's GIF encoder for the
+# frames. With `deltas`, a frame only holds the band of rows that changed
+# since the previous frame, drawn over it. Otherwise (a filename pattern
+# like "frames/{:05}.png") every frame is saved as a separate image.
 
-    img.save(filename)
+
+class AnimationWriter(Generic[T]):
+    def __init__(
+        self,
+        filename: str,
+        colors: ColorLUT[T],
+        *,
+        duration: int = 100,
+        loop: int = 0,
+        scale: int = 1,
+        deltas: bool = True,
+        maxqueue: int = 16,
+    ) -> None:
+        """Animated GIF (`filename` ends with .gif, `duration` of a frame in
+        milliseconds, `loop` count, 0: forever), or image sequence
+        (`filename` is a pattern formatted by the frame number)"""
+        if len(colors) > 256:
+            raise ValueError(f"Too many colors for an animation: {len(colors)} (max. 256)")
+        gif = filename.lower().endswith(".gif")
+        if not gif and filename.format(0) == filename.format(1):
+            raise ValueError(f"No frame number in the image sequence pattern: {filename}")
+        self.filename = filename
+        self.colors = colors
+        self.duration = duration
+        self.loop = loop
+        self.scale = scale
+        self.gif = gif
+        self.deltas = deltas and self.gif
+        self.frames = 0
+        self._index = _palette_index(colors)
+        self._queue: Queue[tuple[bytes, tuple[int, int]] | None] = Queue(maxqueue)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._write, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> AnimationWriter[T]:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def add(self, grid: Grid2D[T]) -> None:
+        """Append a frame (all frames must have the same size)"""
+        if self._error is not None:
+            raise self._error
+        size = (len(grid[0]), len(grid))
+        self._queue.put((_palette_data(grid, self._index), size))
+        self.frames += 1
+
+    def close(self) -> None:
+        """Write the pending frames and finish the file"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _write(self) -> None:
+        fp: IO[bytes] | None = None
+        previous = b""
+        number = 0
+        try:
+            while (frame := self._queue.get()) is not None:
+                data, size = frame
+                if not self.gif:
+                    img = _scaled(_palette_image(data, size, self.colors), self.scale)
+                    img.convert("RGB").save(self.filename.format(number))
+                else:
+                    if fp is None:
+                        fp = open(self.filename, "wb")
+                        self._write_header(fp, data, size)
+                    self._write_frame(fp, data, size, previous)
+                previous = data
+                number += 1
+        except BaseException as e:  # reported to the main thread
+            self._error = e
+            # Drain the queue, so `add` and `close` never block
+            while frame is not None:
+                frame = self._queue.get()
+        finally:
+            if fp is not None:
+                fp.write(b";")  # trailer
+                fp.close()
+
+    def _write_header(self, fp: IO[bytes], data: bytes, size: tuple[int, int]) -> None:
+        from PIL import GifImagePlugin
+
+        img = _scaled(_palette_image(data, size, self.colors), self.scale)
+        header, _ = GifImagePlugin.getheader(img, None, {"loop": self.loop})
+        fp.write(b"".join(header))
+
+    def _write_frame(
+        self, fp: IO[bytes], data: bytes, size: tuple[int, int], previous: bytes
+    ) -> None:
+        from PIL import GifImagePlugin
+
+        width, height = size
+        top, bottom = 0, height
+        if self.deltas and len(previous) == len(data):
+            # Band of changed rows (at least one row, GIF has no empty frames)
+            top = 0
+            while top < height - 1 and _row(data, top, width) == _row(previous, top, width):
+                top += 1
+            bottom = height
+            while bottom > top + 1 and (
+                _row(data, bottom - 1, width) == _row(previous, bottom - 1, width)
+            ):
+                bottom -= 1
+        band = data[top * width : bottom * width]
+        img = _scaled(_palette_image(band, (width, bottom - top), self.colors), self.scale)
+        params = {"duration": self.duration, "disposal": 1}
+        offset = (0, top * self.scale)
+        fp.write(b"".join(GifImagePlugin.getdata(img, offset, **params)))
+
+
+########## private functions ####################
+
+
+def _rgb(color: int) -> bytes:
+    return bytes(((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF))
+
+
+def _palette_index(colors: ColorLUT[T]) -> dict[T, int]:
+    return {k: i for i, k in enumerate(colors)}
+
+
+def _palette_data(grid: Grid2D[T], index: dict[T, int]) -> bytes:
+    return b"".join(bytes(map(index.__getitem__, row)) for row in grid)
+
+
+def _palette_image(data: bytes, size: tuple[int, int], colors: ColorLUT[Any]) -> Image.Image:
+    from PIL import Image
+
+    img = Image.frombytes("P", size, data)
+    img.putpalette(b"".join(_rgb(c) for c in colors.values()))
+    return img
+
+
+def _scaled(img: Image.Image, scale: int) -> Image.Image:
+    if scale == 1:
+        return img
+    from PIL import Image
+
+    return img.resize((img.width * scale, img.height * scale), Image.Resampling.NEAREST)
+
+
+def _row(data: bytes, y: int, width: int) -> bytes:
+    return data[y * width : (y + 1) * width]
@@ -1,6 +1,22 @@
-from .grid import Grid2D as Grid2D, T as T, iter_grid as iter_grid
-from typing import TypeAlias
+from .grid import Grid2D as Grid2D, T as T
+from types import TracebackType
+from typing import Generic, TypeAlias
 
 ColorLUT: TypeAlias
 
-def save_image(filename: str, grid: Grid2D[T], colors: ColorLUT[T]) -> None: ...
+def save_image(filename: str, grid: Grid2D[T], colors: ColorLUT[T], scale: int = ...) -> None: ...
+
+class AnimationWriter(Generic[T]):
+    filename: str
+    colors: ColorLUT[T]
+    duration: int
+    loop: int
+    scale: int
+    gif: bool
+    deltas: bool
+    frames: int
+    def __init__(self, filename: str, colors: ColorLUT[T], *, duration: int = ..., loop: int = ..., scale: int = ..., deltas: bool = ..., maxqueue: int = ...) -> None: ...
+    def __enter__(self) -> AnimationWriter[T]: ...
+    def __exit__(self, exc_type: Union[type[BaseException], None], exc: Union[BaseException, None], traceback: Union[TracebackType, None]) -> None: ...
+    def add(self, grid: Grid2D[T]) -> None: ...
+    def close(self) -> None: ...
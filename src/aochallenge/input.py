@@ -1,9 +1,17 @@
 #!/usr/bin/python3
 
 import itertools
+import mmap
+import operator
 import os
+import re
 import sys
-from typing import Any
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from .grid.bytegrid import ByteGrid
 
 
 def load(
@@ -13,55 +21,284 @@ def load(
     *,
     lut: dict[str | None, Any] | None = None,
     filename: str | None = None,
+    ints: bool | Literal["array", "numpy"] = False,
 ) -> list[str | int | list[str | int]] | Any:
-    if filename is None:
-        filename = os.path.dirname(sys.argv[0]) + "/input@@"
-    variant: str = sys.argv[1] if len(sys.argv) > 1 else ""
     content: Any
     if lut is not None:
-        lut_content = lut[variant if variant else None]
+        lut_content = lut[variant() or None]
+        _record_input("lut", lut_content)
         if not isinstance(lut_content, str):
             return lut_content
         content = lut_content
     else:
-        filename = filename.replace("@@", variant)
-        if os.path.isfile(filename):
-            with open(filename, "r") as f:
-                content = f.read()
-        elif os.path.isfile(filename + ".txt"):
-            with open(filename + ".txt", "r") as f:
-                content = f.read()
-        else:
-            raise FileNotFoundError(f"Couldn't load either '{filename}' or '{filename}.txt'")
+        filename = _resolve_filename(filename)
+        _record_input("file", filename)
+        with open(filename, "r") as f:
+            content = f.read()
+    if ints:
+        if splitrecords is not None or recordtype is not None:
+            raise ValueError(
+                "'ints' cannot be combined with splitrecords or recordtype"
+            )
+        return _extract_ints(content, splitlines, ints)
     if splitlines:
         content = content.splitlines()
         if splitrecords is not None:
-            for i, row in enumerate(content):
-                if splitrecords == "":
-                    content[i] = list(row)
-                else:
-                    content[i] = row.split(splitrecords)
-                if recordtype is not None:
-                    content[i] = _convert_records(content[i], recordtype)
+            content = list(_parse_records(content, splitrecords, recordtype))
         elif recordtype is not None:
-            content = _convert_records(content, recordtype)
+            if callable(recordtype):
+                content = list(map(recordtype, content))
+            else:
+                content = _convert_records(content, recordtype)
     elif splitrecords is not None:
-        content = content.splitlines()
-        if splitrecords == "":
-            content = list(content[0])
-        else:
-            content = content[0].split(splitrecords)
-        if recordtype is not None:
-            content = _convert_records(content, recordtype)
+        lines = content.splitlines()[:1]
+        content = next(_parse_records(lines, splitrecords, recordtype), None)
+        if content is None:
+            raise IndexError("Empty input: there is no line to split")
     return content
 
 
+def load_iter(
+    splitrecords: str | None = None,
+    recordtype: list[type] | tuple[type, ...] | type | None = None,
+    *,
+    lut: dict[str | None, Any] | None = None,
+    filename: str | None = None,
+    use_mmap: bool = False,
+) -> Iterator[Any]:
+    """Generator version of `load(True, splitrecords, recordtype)`, which
+    reads and converts the input line by line, so only one line is kept in
+    memory at a time"""
+    lines: Iterable[str]
+    if lut is not None:
+        lut_content = lut[variant() or None]
+        _record_input("lut", lut_content)
+        if not isinstance(lut_content, str):
+            yield lut_content
+            return
+        lines = lut_content.splitlines()
+    else:
+        filename = _resolve_filename(filename)
+        _record_input("file", filename)
+        if use_mmap:
+            lines = _iter_mmap_lines(filename)
+        else:
+            lines = _iter_file_lines(filename)
+    if splitrecords is not None:
+        yield from _parse_records(lines, splitrecords, recordtype)
+    elif recordtype is not None:
+        # Without splitting, the record types apply to the lines
+        if callable(recordtype):
+            yield from map(recordtype, lines)
+        else:
+            last = recordtype[-1] if recordtype else str
+            types = itertools.chain(recordtype, itertools.repeat(last))
+            for row, func in zip(lines, types):
+                yield func(row)
+    else:
+        yield from lines
+
+
+def load_grid(
+    *,
+    translate: bytes | dict[str, int] | None = None,
+    lut: dict[str | None, Any] | None = None,
+    filename: str | None = None,
+    use_mmap: bool = False,
+) -> "ByteGrid":
+    """Load a character map into a ByteGrid without splitting it into lines:
+    the file is read into a single buffer (or mapped copy-on-write with
+    `use_mmap`), optionally translated by a `byte_table` or mapping"""
+    from .grid.bytegrid import ByteGrid, byte_table
+
+    data: bytearray | mmap.mmap
+    if lut is not None:
+        lut_content = lut[variant() or None]
+        _record_input("lut", lut_content)
+        data = bytearray(lut_content.encode())
+    else:
+        filename = _resolve_filename(filename)
+        _record_input("file", filename)
+        size = os.path.getsize(filename)
+        with open(filename, "rb") as f:
+            if use_mmap and size:  # empty files cannot be mapped
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            else:
+                data = bytearray(size)
+                f.readinto(data)
+    grid = ByteGrid(data)
+    if translate is not None:
+        grid.translate(byte_table(translate) if isinstance(translate, dict) else translate)
+    return grid
+
+
+# Command line options of the library itself, which are not input variants
+OPTIONS = ("--no-cache",)
+
+
 def variant() -> str | None:
-    return sys.argv[1] if len(sys.argv) > 1 else None
+    args = [arg for arg in sys.argv[1:] if arg not in OPTIONS]
+    return args[0] if args else None
+
+
+def loaded_inputs() -> list[tuple[str, Any]]:
+    """The inputs loaded so far, as ("file", filename) or ("lut", content)
+    pairs, without repetitions (used e.g. to identify the input of cached
+    results)"""
+    return list(_loaded.values())
+
+
+def clear_loaded_inputs() -> None:
+    """Forget the inputs loaded so far (a new solver starts a new run)"""
+    _loaded.clear()
+
+
+########## private functions ####################
+
+_loaded: dict[tuple[str, str], tuple[str, Any]] = {}
+
+
+def _record_input(kind: str, value: Any) -> None:
+    _loaded.setdefault((kind, repr(value)), (kind, value))
+
+
+def _resolve_filename(filename: str | None) -> str:
+    if filename is None:
+        filename = os.path.dirname(sys.argv[0]) + "/input@@"
+    filename = filename.replace("@@", variant() or "")
+    if os.path.isfile(filename):
+        return filename
+    if os.path.isfile(filename + ".txt"):
+        return filename + ".txt"
+    raise FileNotFoundError(f"Couldn't load either '{filename}' or '{filename}.txt'")
+
+
+def _iter_file_lines(filename: str) -> Iterator[str]:
+    with open(filename, "r") as f:
+        for line in f:
+            yield line[:-1] if line.endswith("\n") else line
+
+
+def _iter_mmap_lines(filename: str) -> Iterator[str]:
+    if os.path.getsize(filename) == 0:  # empty files cannot be mapped
+        return
+    with open(filename, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                yield line.rstrip(b"\r\n").decode()
+
+
+# All the integers are found by a single regex scan of the whole input. Line
+# boundaries (if needed) are found by the same scan, matching the newlines
+# too. The flat list of values and the line offsets are then built by C level
+# filter/map calls, without per-line Python work.
+
+_INTEGER = re.compile(r"-?\d+")
+_INTEGER_OR_NEWLINE = re.compile(r"-?\d+|\n")
+
+
+def _extract_ints(content: str, splitlines: bool, mode: bool | str) -> Any:
+    if mode not in (True, "array", "numpy"):
+        raise ValueError(f"Invalid 'ints' mode: {mode!r}")
+    if not splitlines:
+        values = array("q", map(int, _INTEGER.findall(content)))
+        if mode == "array":
+            return values
+        if mode == "numpy":
+            import numpy
+
+            return numpy.frombuffer(values, dtype=numpy.int64)
+        return values.tolist()
+    tokens = _INTEGER_OR_NEWLINE.findall(content)
+    if content and not content.endswith("\n"):
+        tokens.append("\n")
+    values = array("q", map(int, filter("\n".__ne__, tokens)))
+    # Each newline token at position p closes a line, and p - k integers
+    # precede the k-th newline
+    newlines = itertools.compress(itertools.count(), map("\n".__eq__, tokens))
+    offsets = array("q", [0])
+    offsets.extend(map(operator.sub, newlines, itertools.count()))
+    if mode == "array":
+        return values, offsets
+    if mode == "numpy":
+        import numpy
+
+        lines = len(offsets) - 1
+        flat = numpy.frombuffer(values, dtype=numpy.int64)
+        counts = {b - a for a, b in zip(offsets, offsets[1:])}
+        if len(counts) > 1:
+            raise ValueError("Lines contain different number of integers")
+        return flat.reshape(lines, counts.pop() if counts else 0)
+    flat_list = values.tolist()
+    return [flat_list[a:b] for a, b in zip(offsets, offsets[1:])]
+
+
+# Records are parsed by a single generator expression (or a generator
+# function for type lists) chosen once per load from the
+# splitrecords/recordtype spec, so there is no type dispatch and no extra
+# function call per line. Lines with as many fields as types are converted
+# by unpacking (2 or 3 types, the usual "name,value" records) or by
+# map(operator.call), extra fields by the last type. Lines with missing
+# fields fall back to the general rule (converted from None).
+
+
+def _parse_records(
+    lines: Iterable[str],
+    splitrecords: str,
+    recordtype: list[type] | tuple[type, ...] | type | None,
+) -> Iterator[Any]:
+    """Lines split into records, converted by `recordtype`"""
+    if recordtype is not None and not callable(recordtype) and len(recordtype) < 2:
+        recordtype = recordtype[0] if recordtype else str
+    if callable(recordtype):
+        func = recordtype
+        if splitrecords == "":
+            return ([*map(func, row)] for row in lines)
+        return ([*map(func, row.split(splitrecords))] for row in lines)
+    records = map(list, lines) if splitrecords == "" else (
+        map(str.split, lines, itertools.repeat(splitrecords))
+    )
+    if recordtype is None:
+        return records
+    return _convert_fields(records, list(recordtype))
+
+
+def _convert_fields(records: Iterable[list[str]], types: list[type]) -> Iterator[Any]:
+    count = len(types)
+    last = types[-1]
+    if count == 2:
+        a, b = types
+        for fields in records:
+            if len(fields) == 2:
+                x, y = fields
+                yield [a(x), b(y)]
+            elif len(fields) > 2:
+                yield [a(fields[0]), *map(b, fields[1:])]
+            else:
+                yield _convert_records(fields, types)
+    elif count == 3:
+        a, b, c = types
+        for fields in records:
+            if len(fields) == 3:
+                x, y, z = fields
+                yield [a(x), b(y), c(z)]
+            elif len(fields) > 3:
+                yield [a(fields[0]), b(fields[1]), *map(c, fields[2:])]
+            else:
+                yield _convert_records(fields, types)
+    else:
+        call = operator.call
+        for fields in records:
+            if len(fields) == count:
+                yield [*map(call, types, fields)]
+            elif len(fields) > count:
+                yield [*map(call, types, fields), *map(last, fields[count:])]
+            else:
+                yield _convert_records(fields, types)
 
 
 def _convert_records(
-    content: str, recordtype: list[type] | tuple[type, ...] | type
+    content: Iterable[str], recordtype: list[type] | tuple[type, ...] | type
 ) -> list[Any]:
     if callable(recordtype):
         return [recordtype(e) for e in content]
@@ -1,4 +1,12 @@
-from typing import Any
+from collections.abc import Iterator
+from .grid.bytegrid import ByteGrid as ByteGrid
+from typing import Any, Literal
+
+def load(splitlines: bool = ..., splitrecords: Union[str, None] = ..., recordtype: Union[list[type], tuple[type, ...], type, None] = ..., *, lut: Union[dict[Union[str, None], Any], None] = ..., filename: Union[str, None] = ..., ints: Union[bool, Literal['array', 'numpy']] = ...) -> Union[list[Union[str, int, list[Union[str, int]]]], Any]: ...
+def load_iter(splitrecords: Union[str, None] = ..., recordtype: Union[list[type], tuple[type, ...], type, None] = ..., *, lut: Union[dict[Union[str, None], Any], None] = ..., filename: Union[str, None] = ..., use_mmap: bool = ...) -> Iterator[Any]: ...
+def load_grid(*, translate: Union[bytes, dict[str, int], None] = ..., lut: Union[dict[Union[str, None], Any], None] = ..., filename: Union[str, None] = ..., use_mmap: bool = ...) -> ByteGrid: ...
+OPTIONS: tuple[str, ...]
 
-def load(splitlines: bool = ..., splitrecords: Union[str, None] = ..., recordtype: Union[list[type], tuple[type, ...], type, None] = ..., *, lut: Union[dict[Union[str, None], Any], None] = ..., filename: Union[str, None] = ...) -> Union[list[Union[str, int, list[Union[str, int]]]], Any]: ...
 def variant() -> Union[str, None]: ...
+def loaded_inputs() -> list[tuple[str, Any]]: ...
+def clear_loaded_inputs() -> None: ...
@@ -0,0 +1,302 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import update_wrapper
+from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, TypeVar, overload
+
+if TYPE_CHECKING:
+    import shelve
+
+# Memoization with bounded size and visible statistics, instead of the
+# unbounded functools.cache:
+#
+#   @memoize                                  # unbounded, like functools.cache
+#   @memoize(maxsize=100_000)                 # LRU eviction above 100000 entries
+#   @memoize(policy="lfu", maxmemory=2**30)   # LFU eviction above ~1 GiB
+#   @memoize(normalize=True)                  # lists/sets/dicts as arguments
+#   @memoize(maxsize=10**6, disk="dp.db")     # evicted entries go to a shelve
+#
+# The shelve file only extends the cache of the current run: it is created
+# empty, cleared by cache_clear() and closed at exit. Entries are stored
+# under the repr of the key, so only keys of tuples and plain values
+# (numbers, strings, bytes, None) are spilled to disk.
+#
+# Memory is estimated by sys.getsizeof of the keys and values (not deep), so
+# `maxmemory` is a rough bound. Statistics of all memoized functions are
+# collected by `memo_stats()`, and printed by Solver.main if statistics are
+# enabled (see aochallenge.stats).
+
+R = TypeVar("R")
+Policy = Literal["lru", "lfu"]
+
+_registry: list[Memoized[Any]] = []
+_KWD_MARK = object()
+
+
+@dataclass
+class MemoStats:
+    name: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_hits: int = 0
+    size: int = 0
+    memory: int = 0
+
+    def __str__(self) -> str:
+        calls = self.hits + self.disk_hits + self.misses
+        ratio = (self.hits + self.disk_hits) / calls if calls else 0.0
+        text = (
+            f"{self.name}: {self.hits} hits, {self.misses} misses"
+            f" ({ratio:.1%}), {self.evictions} evictions, {self.size} entries"
+        )
+        if self.memory:
+            text += f" (~{self.memory / 1024:.1f} KiB)"
+        if self.disk_hits:
+            text += f", {self.disk_hits} disk hits"
+        return text
+
+
+class Memoized(Generic[R]):
+    def __init__(
+        self,
+        func: Callable[..., R],
+        maxsize: int | None = None,
+        policy: Policy = "lru",
+        maxmemory: int | None = None,
+        normalize: bool | Callable[..., Any] = False,
+        disk: str | None = None,
+    ) -> None:
+        if policy not in ("lru", "lfu"):
+            raise ValueError(f"Unknown memoization policy: {policy!r}")
+        self.func = func
+        self.maxsize = maxsize
+        self.policy = policy
+        self.maxmemory = maxmemory
+        self.normalize: Callable[..., Any] | None = (
+            normalize_key if normalize is True else normalize or None
+        )
+        self.disk = disk
+        self.stats = MemoStats(getattr(func, "__qualname__", repr(func)))
+        self._shelf: shelve.Shelf[Any] | None = None
+        if disk is not None:
+            import atexit
+
+            atexit.register(self.close)
+        self.cache_clear()
+        update_wrapper(self, func)
+        _registry.append(self)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        key: Any = args
+        if kwargs:
+            key = (*args, _KWD_MARK, *sorted(kwargs.items()))
+        if self.normalize is not None:
+            key = self.normalize(key)
+        cache = self._cache
+        stats = self.stats
+        value: R
+        try:
+            value = cache[key]
+        except KeyError:
+            pass
+        else:
+            stats.hits += 1
+            if self._bounded:
+                self._touch(key)
+            return value
+        disk_key = None if self.disk is None else _disk_key(key)
+        if disk_key is not None:
+            shelf = self._open_shelf()
+            if disk_key in shelf:
+                stats.disk_hits += 1
+                value = shelf[disk_key]
+                self._store(key, value)
+                return value
+        stats.misses += 1
+        value = self.func(*args, **kwargs)
+        self._store(key, value)
+        return value
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        # Support memoized methods (self becomes part of the key)
+        if obj is None:
+            return self
+        return _BoundMemoized(self, obj)
+
+    def cache_info(self) -> MemoStats:
+        self.stats.size = len(self._cache)
+        self.stats.memory = self._memory
+        return self.stats
+
+    def cache_clear(self) -> None:
+        self._cache: dict[Any, Any] = OrderedDict() if self.policy == "lru" else {}
+        # LFU: use counts, and insertion ordered keys per count, so the least
+        # frequently (and among those the least recently) used key is found
+        # in O(1)
+        self._counts: dict[Any, int] = {}
+        self._buckets: dict[int, OrderedDict[Any, None]] = {}
+        self._min_count = 0
+        self._memory = 0
+        self._bounded = self.maxsize is not None or self.maxmemory is not None
+        self.stats.hits = self.stats.misses = self.stats.evictions = 0
+        self.stats.disk_hits = 0
+        self.close()  # the shelf is recreated empty when needed
+
+    def close(self) -> None:
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def _store(self, key: Any, value: Any) -> None:
+        if self._bounded:
+            size = 0
+            if self.maxmemory is not None:
+                size = sys.getsizeof(key) + sys.getsizeof(value)
+            # Evicted before inserting, so the new entry is never the victim
+            while self._cache and (
+                (self.maxsize is not None and len(self._cache) >= self.maxsize)
+                or (self.maxmemory is not None and self._memory + size > self.maxmemory)
+            ):
+                self._evict()
+            self._memory += size
+            if self.policy == "lfu":
+                self._counts[key] = 1
+                self._buckets.setdefault(1, OrderedDict())[key] = None
+                self._min_count = 1
+        self._cache[key] = value
+
+    def _touch(self, key: Any) -> None:
+        if self.policy == "lru":
+            self._cache.move_to_end(key)  # type: ignore[attr-defined]
+            return
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def _evict(self) -> None:
+        if self.policy == "lru":
+            key, value = self._cache.popitem(last=False)  # type: ignore[call-arg]
+        else:
+            bucket = self._buckets[self._min_count]
+            key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+                self._min_count = min(self._buckets, default=0)
+            del self._counts[key]
+            value = self._cache.pop(key)
+        if self.maxmemory is not None:
+            self._memory -= sys.getsizeof(key) + sys.getsizeof(value)
+        self.stats.evictions += 1
+        disk_key = None if self.disk is None else _disk_key(key)
+        if disk_key is not None:
+            self._open_shelf()[disk_key] = value
+
+    def _open_shelf(self) -> shelve.Shelf[Any]:
+        if self._shelf is None:
+            import shelve
+
+            # A new, empty shelf: results of other runs (maybe on other
+            # inputs) must not be reused
+            self._shelf = shelve.open(self.disk or "", flag="n")
+        return self._shelf
+
+
+@overload
+def memoize(func: Callable[..., R]) -> Memoized[R]: ...
+
+
+@overload
+def memoize(
+    *,
+    maxsize: int | None = None,
+    policy: Policy = "lru",
+    maxmemory: int | None = None,
+    normalize: bool | Callable[..., Any] = False,
+    disk: str | None = None,
+) -> Callable[[Callable[..., R]], Memoized[R]]: ...
+
+
+def memoize(
+    func: Callable[..., R] | None = None,
+    *,
+    maxsize: int | None = None,
+    policy: Policy = "lru",
+    maxmemory: int | None = None,
+    normalize: bool | Callable[..., Any] = False,
+    disk: str | None = None,
+) -> Memoized[R] | Callable[[Callable[..., R]], Memoized[R]]:
+    """Memoization decorator, usable with or without arguments"""
+
+    def decorator(func: Callable[..., R]) -> Memoized[R]:
+        return Memoized(func, maxsize, policy, maxmemory, normalize, disk)
+
+    return decorator if func is None else decorator(func)
+
+
+def normalize_key(value: Any) -> Any:
+    """Hashable and type independent form of arguments: lists (e.g. grids)
+    and tuples (e.g. coordinates) become tuples, sets become frozensets,
+    dicts become frozensets of their items"""
+    if isinstance(value, (list, tuple)):
+        return tuple(map(normalize_key, value))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(map(normalize_key, value))
+    if isinstance(value, dict):
+        return frozenset((k, normalize_key(v)) for k, v in value.items())
+    return value
+
+
+def memo_stats() -> list[MemoStats]:
+    """Statistics of all the memoized functions that have been called"""
+    return [
+        memoized.cache_info()
+        for memoized in _registry
+        if memoized.stats.hits or memoized.stats.misses or memoized.stats.disk_hits
+    ]
+
+
+########## private functions ####################
+
+
+_STABLE_TYPES = (type(None), bool, int, float, complex, str, bytes)
+
+
+def _disk_key(key: Any) -> str | None:
+    # Shelf key of a cache key, or None if its repr is not stable (e.g.
+    # object addresses, or the iteration order of sets): such keys are not
+    # spilled to disk
+    if key is _KWD_MARK:
+        return "**"
+    if type(key) in _STABLE_TYPES:
+        return repr(key)
+    if isinstance(key, tuple):
+        items = []
+        for item in key:
+            item_key = _disk_key(item)
+            if item_key is None:
+                return None
+            items.append(item_key)
+        return f"({','.join(items)},)"
+    return None
+
+
+class _BoundMemoized:
+    def __init__(self, memoized: Memoized[Any], obj: Any) -> None:
+        self._memoized = memoized
+        self._obj = obj
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self._memoized(self._obj, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._memoized, name)
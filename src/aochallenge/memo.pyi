@@ -0,0 +1,37 @@
+import shelve
+from typing import Any, Callable, Generic, Literal, TypeVar, overload
+
+R = TypeVar('R')
+Policy = Literal['lru', 'lfu']
+
+class MemoStats:
+    name: str
+    hits: int = ...
+    misses: int = ...
+    evictions: int = ...
+    disk_hits: int = ...
+    size: int = ...
+    memory: int = ...
+    def __init__(self, name: str, hits: int = ..., misses: int = ..., evictions: int = ..., disk_hits: int = ..., size: int = ..., memory: int = ...) -> None: ...
+
+class Memoized(Generic[R]):
+    func: Callable[..., R]
+    maxsize: Union[int, None]
+    policy: Policy
+    maxmemory: Union[int, None]
+    normalize: Union[Callable[..., Any], None]
+    disk: Union[str, None]
+    stats: MemoStats
+    def __init__(self, func: Callable[..., R], maxsize: Union[int, None] = ..., policy: Policy = ..., maxmemory: Union[int, None] = ..., normalize: Union[bool, Callable[..., Any]] = ..., disk: Union[str, None] = ...) -> None: ...
+    def __call__(self, *args: Any, **kwargs: Any) -> R: ...
+    def __get__(self, obj: Any, objtype: Union[type, None] = ...) -> Any: ...
+    def cache_info(self) -> MemoStats: ...
+    def cache_clear(self) -> None: ...
+    def close(self) -> None: ...
+
+@overload
+def memoize(func: Callable[..., R]) -> Memoized[R]: ...
+@overload
+def memoize(*, maxsize: Union[int, None] = ..., policy: Policy = ..., maxmemory: Union[int, None] = ..., normalize: Union[bool, Callable[..., Any]] = ..., disk: Union[str, None] = ...) -> Callable[[Callable[..., R]], Memoized[R]]: ...
+def normalize_key(value: Any) -> Any: ...
+def memo_stats() -> list[MemoStats]: ...
@@ -0,0 +1,156 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+import hashlib
+import os
+import pickle
+import sys
+from typing import Any
+
+from .input import _resolve_filename, loaded_inputs, variant
+
+# Persistent cache of the results of Solver parts. A result is stored under a
+# key computed from
+#
+#   - the input variant, and the content of the inputs loaded so far (see
+#     input.loaded_inputs), or of the default input file if none is loaded
+#     yet (the parts may load the input themselves),
+#   - the source of the module of the solution, except the later parts (so
+#     editing part2 keeps the cached result of part1, but editing part1, a
+#     helper function or __init__ invalidates both: part2 may call part1),
+#   - the name of the part.
+#
+# Results are pickled one file per key. The directory is bounded by size;
+# the least recently used files (by mtime, which is updated on every hit)
+# are evicted first.
+#
+# Caching is enabled by the `cache_results` attribute of the solver or the
+# AOC_CACHE=1 environment variable, and disabled by the `--no-cache` command
+# line option. The directory is AOC_CACHE_DIR (default: ~/.cache/aochallenge)
+#
+# A cached part is not run, so its side effects are missing: with caching
+# on, parts must not pass state to each other through `self` (a part may
+# call an earlier part instead).
+
+DEFAULT_MAXSIZE = 64 * 1024 * 1024
+
+_MISSING = object()
+
+
+class ResultCache:
+    def __init__(self, directory: str | None = None, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        if directory is None:
+            directory = os.environ.get("AOC_CACHE_DIR") or os.path.join(
+                os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+                "aochallenge",
+            )
+        self.directory = directory
+        self.maxsize = maxsize
+
+    def key(self, solver: Any, part: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(repr(variant()).encode())
+        inputs = loaded_inputs()
+        if not inputs:
+            try:
+                inputs = [("file", _resolve_filename(None))]
+            except FileNotFoundError:
+                pass
+        for kind, value in inputs:
+            digest.update(kind.encode())
+            if kind == "file":
+                with open(value, "rb") as f:
+                    digest.update(hashlib.file_digest(f, "sha256").digest())
+            else:
+                digest.update(repr(value).encode())
+        digest.update(_solution_source(type(solver), part).encode())
+        digest.update(f"{type(solver).__qualname__}.{part}".encode())
+        return digest.hexdigest()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        filename = self._filename(key)
+        try:
+            with open(filename, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return default
+        os.utime(filename)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        try:
+            data = pickle.dumps(value)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return  # unpicklable results are not cached
+        os.makedirs(self.directory, exist_ok=True)
+        filename = self._filename(key)
+        # Written to a temporary file first, so parallel workers never see
+        # a partial result
+        temporary = f"{filename}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, filename)
+        self.evict()
+
+    def evict(self) -> None:
+        """Remove the least recently used results above `maxsize`"""
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pickle"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.maxsize:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith(".pickle"):
+                    os.remove(entry.path)
+
+    def compute(self, solver: Any, part: str) -> Any:
+        """Result of the part, from the cache if possible"""
+        key = self.key(solver, part)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = getattr(solver, part)()
+            self.put(key, value)
+        return value
+
+    def _filename(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pickle")
+
+
+########## private functions ####################
+
+
+def _solution_source(cls: type, part: str) -> str:
+    import inspect
+
+    try:
+        source = inspect.getsource(sys.modules[cls.__module__])
+    except (OSError, TypeError, KeyError):
+        # No source file (e.g. interactive session): the class is still
+        # better than nothing
+        return cls.__qualname__
+    number = _part_number(part)
+    for name in dir(cls):
+        if _part_number(name) > number:
+            try:
+                source = source.replace(inspect.getsource(getattr(cls, name)), "")
+            except (OSError, TypeError):
+                pass
+    return source
+
+
+def _part_number(name: str) -> int:
+    if name.startswith("part") and name[4:].isdigit():
+        return int(name[4:])
+    return -1
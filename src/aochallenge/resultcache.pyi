@@ -0,0 +1,15 @@
+from .input import loaded_inputs as loaded_inputs, variant as variant
+from typing import Any
+
+DEFAULT_MAXSIZE: int
+
+class ResultCache:
+    directory: str
+    maxsize: int
+    def __init__(self, directory: Union[str, None] = ..., maxsize: int = ...) -> None: ...
+    def key(self, solver: Any, part: str) -> str: ...
+    def get(self, key: str, default: Any = ...) -> Any: ...
+    def put(self, key: str, value: Any) -> None: ...
+    def evict(self) -> None: ...
+    def clear(self) -> None: ...
+    def compute(self, solver: Any, part: str) -> Any: ...
@@ -1,21 +1,136 @@
 #!/usr/bin/python3
 
+import itertools
+import os
 import sys
-from typing import Any, Generator
-from .input import load, variant
+from collections.abc import Iterable, Iterator
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Generator, TypeVar
+from .input import clear_loaded_inputs, load, variant
+
+if TYPE_CHECKING:
+    from multiprocessing.context import BaseContext
+    from .stats import Instrumentation, PartStats
+
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 class Solver:
+    # Parts decorated with @independent are run in parallel processes if set
+    # (or if the AOC_PARALLEL environment variable is set)
+    parallel: bool = False
+    # Results of the parts are cached on disk if set (or if the AOC_CACHE
+    # environment variable is set), see aochallenge.resultcache
+    cache_results: bool = False
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> "Solver":
+        # A new solver is a new run: the inputs loaded earlier in the process
+        # must not identify its cached results (see aochallenge.resultcache)
+        clear_loaded_inputs()
+        return super().__new__(cls)
+
     def solve_more(self) -> Generator[int | str, None, None]:
         i: int = 1
         while hasattr(self, f"part{i}"):
-            method = getattr(self, f"part{i}")
-            yield method()
+            yield self._solve_part(f"part{i}")
             i += 1
 
-    def main(self) -> None:
-        for i, result in enumerate(self.solve_more(), 1):
+    def main(
+        self,
+        *,
+        stats: bool | str | None = None,
+        profile: str | None = None,
+        report: str | None = None,
+        parallel: bool | None = None,
+    ) -> None:
+        """Print the results of the parts. Instrumentation (see
+        aochallenge.stats) is enabled by the arguments or by the AOC_STATS,
+        AOC_PROFILE and AOC_REPORT environment variables"""
+        from .stats import Instrumentation
+
+        instrumentation = Instrumentation(stats, profile, report)
+        if parallel is None:
+            parallel = self.parallel or os.environ.get(
+                "AOC_PARALLEL", ""
+            ).lower() in ("1", "yes", "true", "on")
+        results: Iterable[Any]
+        if parallel and type(self).solve_more is Solver.solve_more:
+            results = self._solve_parallel(instrumentation)
+        elif instrumentation.enabled:
+            results = self._solve_measured(instrumentation)
+        else:
+            results = self.solve_more()
+        for i, result in enumerate(results, 1):
             print(f"{i}: {result}")
+        if instrumentation.enabled:
+            instrumentation.finish()
+
+    def _solve_measured(self, instrumentation: "Instrumentation") -> Iterator[Any]:
+        # Each step of the generator is measured, so overridden solve_more
+        # methods are instrumented per part too
+        parts = self.solve_more()
+        for i in itertools.count(1):
+            try:
+                yield instrumentation.measure(i, parts.__next__)
+            except StopIteration:
+                return
+
+    def _solve_parallel(self, instrumentation: "Instrumentation") -> Iterator[Any]:
+        # The pool is forked after __init__, so the parsed input is shared
+        # copy-on-write with the workers. Independent parts are submitted
+        # first, then the others run in this process meanwhile, in order.
+        # Their results (and statistics) are buffered, as all the results
+        # are yielded in the order of the parts.
+        from concurrent.futures import ProcessPoolExecutor
+
+        global _solver
+        names = list(itertools.takewhile(
+            lambda name: hasattr(self, name), (f"part{i}" for i in itertools.count(1))
+        ))
+        independent_parts = [
+            name for name in names if getattr(getattr(self, name), "independent", False)
+        ]
+        context = _fork_context()
+        if not independent_parts or context is None:
+            if instrumentation.enabled:
+                yield from self._solve_measured(instrumentation)
+            else:
+                yield from self.solve_more()
+            return
+        _solver = self
+        # One worker per part: there are only a few of them
+        with ProcessPoolExecutor(len(independent_parts), mp_context=context) as pool:
+            futures = {
+                name: pool.submit(_run_part, name, int(name[4:]), instrumentation)
+                for name in independent_parts
+            }
+            local = {}
+            for i, name in enumerate(names, 1):
+                if name not in futures:
+                    local[name] = _run_part(name, i, instrumentation)
+            for name in names:
+                if name in futures:
+                    result, part_stats = futures[name].result()
+                else:
+                    result, part_stats = local[name]
+                if part_stats is not None:
+                    instrumentation.record(part_stats)
+                yield result
+
+    def _solve_part(self, name: str) -> Any:
+        if _cache_enabled(self):
+            from .resultcache import ResultCache
+
+            return ResultCache().compute(self, name)
+        return getattr(self, name)()
+
+
+def independent(method: F) -> F:
+    """Mark a part method as independent of the other parts (it uses only
+    the state set by __init__), so it can run in a parallel process"""
+    setattr(method, "independent", True)
+    return method
+
 
 class Solution(Solver):
     basename: str # deprecated property!
@@ -70,3 +185,35 @@ class Solution(Solver):
         from .debug import print_arranged
 
         return print_arranged(data)
+
+
+########## private functions ####################
+
+# The solver of the running main(), inherited by the forked workers
+_solver: Solver | None = None
+
+
+def _cache_enabled(solver: Solver) -> bool:
+    if "--no-cache" in sys.argv[1:]:
+        return False
+    return solver.cache_results or os.environ.get(
+        "AOC_CACHE", ""
+    ).lower() in ("1", "yes", "true", "on")
+
+
+def _fork_context() -> "BaseContext | None":
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context("fork")
+
+
+def _run_part(
+    name: str, part: int, instrumentation: "Instrumentation"
+) -> "tuple[Any, PartStats | None]":
+    assert _solver is not None
+    method = partial(_solver._solve_part, name)
+    if instrumentation.enabled:
+        return instrumentation.run(part, method)
+    return method(), None
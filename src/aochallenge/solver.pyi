@@ -1,9 +1,15 @@
-from .input import load as load, variant as variant
-from typing import Any, Generator
+from .input import clear_loaded_inputs as clear_loaded_inputs, load as load, variant as variant
+from typing import Any, Callable, Generator, TypeVar
+
+F = TypeVar('F', bound=Callable[..., Any])
 
 class Solver:
+    parallel: bool
+    cache_results: bool
     def solve_more(self) -> Generator[Union[int, str], None, None]: ...
-    def main(self) -> None: ...
+    def main(self, *, stats: Union[bool, str, None] = ..., profile: Union[str, None] = ..., report: Union[str, None] = ..., parallel: Union[bool, None] = ...) -> None: ...
+
+def independent(method: F) -> F: ...
 
 class Solution(Solver):
     basename: str
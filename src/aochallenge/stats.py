@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+
+from __future__ import annotations
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from .input import variant
+
+# Opt-in instrumentation of Solver.main. Every option can be given as an
+# argument of main() or by an environment variable (the command line
+# arguments are taken by the input variant):
+#
+#   AOC_STATS=time,memory   print wall/CPU time (and peak memory) per part
+#                           to stderr; "1" or "all" means both
+#   AOC_PROFILE=<dir>       dump a cProfile stats file per part into <dir>
+#   AOC_REPORT=<file>       append the run as one JSON line to <file>
+#
+# Nothing is printed to stdout, so the solutions' output is unchanged.
+
+STATS_KINDS = ("time", "memory")
+
+
+@dataclass
+class PartStats:
+    part: int
+    result: str
+    wall: float
+    cpu: float
+    peak_memory: int | None = None
+    profile: str | None = None
+
+    def __str__(self) -> str:
+        text = f"part{self.part}: wall {self.wall:.6f}s, cpu {self.cpu:.6f}s"
+        if self.peak_memory is not None:
+            text += f", peak memory {self.peak_memory / 1024:.1f} KiB"
+        return text
+
+
+class Instrumentation:
+    def __init__(
+        self,
+        stats: bool | str | None = None,
+        profile: str | None = None,
+        report: str | None = None,
+    ) -> None:
+        self.stats = _parse_stats(
+            os.environ.get("AOC_STATS", "") if stats is None else stats
+        )
+        self.profile = profile if profile is not None else os.environ.get("AOC_PROFILE")
+        self.report = report if report is not None else os.environ.get("AOC_REPORT")
+        self.parts: list[PartStats] = []
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.stats or self.profile or self.report)
+
+    def measure(self, part: int, func: Callable[[], Any]) -> Any:
+        """Call `func` (computing part `part`) and record its statistics"""
+        result, stats = self.run(part, func)
+        self.record(stats)
+        return result
+
+    def run(self, part: int, func: Callable[[], Any]) -> tuple[Any, PartStats]:
+        """Call `func` and return its result with the statistics, without
+        recording them (e.g. in a worker process)"""
+        tracing = "memory" in self.stats
+        if tracing:
+            import tracemalloc
+
+            started = tracemalloc.is_tracing()
+            if not started:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        profiler = None
+        if self.profile:
+            import cProfile
+
+            profiler = cProfile.Profile()
+        cpu0 = time.process_time()
+        wall0 = time.perf_counter()
+        try:
+            result = func() if profiler is None else profiler.runcall(func)
+        finally:
+            wall = time.perf_counter() - wall0
+            cpu = time.process_time() - cpu0
+            peak = None
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                if not started:
+                    tracemalloc.stop()
+        profile_file = None
+        if profiler is not None and self.profile is not None:
+            os.makedirs(self.profile, exist_ok=True)
+            profile_file = os.path.join(self.profile, f"part{part}.prof")
+            profiler.dump_stats(profile_file)
+        return result, PartStats(part, str(result), wall, cpu, peak, profile_file)
+
+    def record(self, stats: PartStats) -> None:
+        self.parts.append(stats)
+        if self.stats:
+            print(stats, file=sys.stderr)
+
+    def finish(self) -> None:
+        """Print the memoization statistics and write the report"""
+        # Only if memoization is used at all (aochallenge.memo is imported)
+        memo = sys.modules.get(f"{__package__}.memo")
+        memo_stats = memo.memo_stats() if memo is not None else []
+        if self.stats:
+            for stats in memo_stats:
+                print(f"memoize {stats}", file=sys.stderr)
+        if self.report:
+            self.write_report([asdict(stats) for stats in memo_stats])
+
+    def write_report(self, memo: list[dict[str, Any]] | None = None) -> None:
+        if not self.report:
+            return
+        run = {
+            "script": sys.argv[0],
+            "variant": variant(),
+            "timestamp": time.time(),
+            "parts": [asdict(part) for part in self.parts],
+            "memo": memo or [],
+        }
+        with open(self.report, "a") as f:
+            f.write(json.dumps(run) + "\n")
+
+
+########## private functions ####################
+
+
+def _parse_stats(stats: bool | str) -> set[str]:
+    if isinstance(stats, bool):
+        return set(STATS_KINDS) if stats else set()
+    kinds = {kind.strip().lower() for kind in stats.split(",")} - {""}
+    if kinds & {"1", "all", "yes", "true"}:
+        return set(STATS_KINDS)
+    if kinds & {"0", "no", "false"}:
+        return set()
+    unknown = kinds - set(STATS_KINDS)
+    if unknown:
+        raise ValueError(f"Unknown statistics: {', '.join(sorted(unknown))}")
+    return kinds
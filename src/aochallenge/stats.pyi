@@ -0,0 +1,26 @@
+from typing import Any, Callable
+
+STATS_KINDS: tuple[str, ...]
+
+class PartStats:
+    part: int
+    result: str
+    wall: float
+    cpu: float
+    peak_memory: Union[int, None] = ...
+    profile: Union[str, None] = ...
+    def __init__(self, part: int, result: str, wall: float, cpu: float, peak_memory: Union[int, None] = ..., profile: Union[str, None] = ...) -> None: ...
+
+class Instrumentation:
+    stats: set[str]
+    profile: Union[str, None]
+    report: Union[str, None]
+    parts: list[PartStats]
+    def __init__(self, stats: Union[bool, str, None] = ..., profile: Union[str, None] = ..., report: Union[str, None] = ...) -> None: ...
+    @property
+    def enabled(self) -> bool: ...
+    def measure(self, part: int, func: Callable[[], Any]) -> Any: ...
+    def run(self, part: int, func: Callable[[], Any]) -> tuple[Any, PartStats]: ...
+    def record(self, stats: PartStats) -> None: ...
+    def finish(self) -> None: ...
+    def write_report(self, memo: Union[list[dict[str, Any]], None] = ...) -> None: ...
@@ -0,0 +1,64 @@
+import textwrap
+
+from aochallenge.batch import discover_variants, main, run_batch
+
+SOLUTION = textwrap.dedent("""\
+    from aochallenge import *
+
+
+    class Solution(Solver):
+        def __init__(self):
+            self.data = load(True, ",", int)
+
+        def part1(self):
+            return sum(map(sum, self.data))
+
+        def part2(self):
+            return max(map(max, self.data))
+
+
+    Solution().main()
+""")
+
+
+def make_solution(tmp_path):
+    script = tmp_path / "day01.py"
+    script.write_text(SOLUTION)
+    (tmp_path / "input.txt").write_text("1,2\n3,4\n")
+    (tmp_path / "input-t.txt").write_text("1,1\n")
+    (tmp_path / "input-t.out").write_text("1: 2\n2: 1\n")
+    (tmp_path / "input-t2").write_text("5\n")
+    (tmp_path / "input-t2.out").write_text("1: 5\n2: 6\n")
+    (tmp_path / "input-bad").write_text("x\n")
+    return str(script)
+
+
+def test_discover_variants(tmp_path):
+    script = make_solution(tmp_path)
+    (tmp_path / "input-t2.txt").write_text("5\n")
+    variants = discover_variants(script)
+    assert [variant for variant, _ in variants] == [None, "-bad", "-t", "-t2"]
+    assert variants[3][1] == str(tmp_path / "input-t2")
+
+
+def test_run_batch(tmp_path):
+    results = {r.variant: r for r in run_batch(make_solution(tmp_path), 2)}
+    assert results[None].results == {1: "10", 2: "4"}
+    assert results[None].ok is None
+    assert results["-t"].ok is True
+    assert results["-t2"].ok is False
+    assert results["-bad"].error is not None and "ValueError" in results["-bad"].error
+    assert results["-bad"].ok is False
+
+
+def test_main(tmp_path, capsys):
+    assert main([make_solution(tmp_path)]) == 1
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert lines[0].split() == ["variant", "time", "part1", "part2", "check"]
+    assert lines[1].split()[0] == "(main)"
+    assert lines[3].split()[-1] == "ok"
+    assert lines[4].split()[-2:] == ["FAIL", "(2)"]
+    assert "ValueError" in captured.err
+    (tmp_path / "empty").mkdir()
+    assert main([str(tmp_path / "empty" / "day02.py")]) == 1
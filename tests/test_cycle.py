@@ -0,0 +1,41 @@
+import pytest
+
+from aochallenge.cycle import *
+
+
+def sequence(start, length):
+    """Step function of 0, 1, ..., start + length - 1, start, ..."""
+    return lambda n: n + 1 if n + 1 < start + length else start
+
+
+@pytest.mark.parametrize("detect", [find_cycle, brent, floyd])
+@pytest.mark.parametrize("start,length", [(0, 1), (0, 7), (5, 1), (3, 10), (100, 33)])
+def test_detect(detect, start, length):
+    assert detect(0, sequence(start, length)) == Cycle(start, length)
+
+
+@pytest.mark.parametrize("method", ["history", "brent", "floyd"])
+def test_state_at(method):
+    step = sequence(4, 6)
+    for n in (0, 3, 4, 9, 10, 1_000_000_000):
+        expected = n if n < 4 else 4 + (n - 4) % 6
+        assert state_at(0, step, n, method=method) == expected
+
+
+def test_key_and_in_place_step():
+    # A list modified in place, compared by a key
+    def step(state):
+        state[0] = (state[0] * 3 + 1) % 11
+        state[1] += 1
+        return state
+
+    cycle = find_cycle([2, 0], step, key=lambda s: s[0])
+    assert cycle == Cycle(0, 5)
+    assert state_at([2, 0], step, 12, key=lambda s: s[0]) == [((2 * 3 + 1) * 3 + 1) % 11, 7]
+    assert cycle.equivalent(12) == 2
+
+
+def test_key_on_immutable_states():
+    step = lambda s: ((s[0] * 3 + 1) % 11, s[1] + 1)
+    assert brent((2, 0), step, key=lambda s: s[0]) == Cycle(0, 5)
+    assert floyd((2, 0), step, key=lambda s: s[0]) == Cycle(0, 5)
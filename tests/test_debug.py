@@ -54,3 +54,62 @@ def test_print_solution(capsys):
     captured = capsys.readouterr()
     expected = "s: abc\nx: 42\ny: 13.7\narr: [1, 2, 3]\n"
     assert captured.out == expected
+
+
+def screen(output, height, width):
+    """Characters on a terminal after writing `output` (cursor moves and
+    clears only)"""
+    import re
+
+    cells = [[" "] * width for _ in range(height)]
+    y = x = 0
+    for move, clear, text in re.findall(r"\x1b\[(?:(\d+;\d+)H|(2J|2K|H|\?25[lh]))|([^\x1b])", output):
+        if move:
+            y, x = (int(v) - 1 for v in move.split(";"))
+        elif clear == "2J":
+            cells = [[" "] * width for _ in range(height)]
+        elif clear == "2K":
+            cells[y] = [" "] * width
+        elif clear == "H":
+            y = x = 0
+        elif text:
+            cells[y][x] = text
+            x += 1
+    return ["".join(row).rstrip() for row in cells]
+
+
+def test_live_renderer():
+    import io
+
+    stream = io.StringIO()
+    grid = [list("#...."), list("....."), list("....#")]
+    renderer = LiveRenderer(fps=None, stream=stream)
+    assert renderer.update(grid, "step 0")
+    assert screen(stream.getvalue(), 5, 8) == ["#....", ".....", "....#", "step 0", ""]
+
+    written = len(stream.getvalue())
+    grid[1][2] = "#"
+    renderer.update(grid, "step 0")
+    update = stream.getvalue()[written:]
+    assert update == "\x1b[2;3H#"
+    renderer.update(grid, "step 0")
+    assert len(stream.getvalue()) == written + len(update)
+
+    grid[0] = list(".#..#")
+    renderer.update(grid, "done")
+    renderer.close()
+    assert screen(stream.getvalue(), 5, 8) == [".#..#", "..#..", "....#", "done", ""]
+    assert stream.getvalue().endswith("\x1b[5;1H\x1b[?25h")
+
+
+def test_live_renderer_throttle_and_chars():
+    import io
+
+    stream = io.StringIO()
+    with LiveRenderer(fps=0.001, chars={0: ".", 1: "#"}, stream=stream) as renderer:
+        assert renderer.update([[0, 1], [1, 0]])
+        assert not renderer.update([[1, 1], [1, 0]])
+        assert not renderer.update([[1, 1], [1, 1]])
+    assert renderer.frames == 2
+    assert renderer.skipped == 2
+    assert screen(stream.getvalue(), 3, 2) == ["##", "##", ""]
@@ -10,6 +10,8 @@ from aochallenge.grid import *
         (Coord2D(2, 3), Coord2D(1, -1), Coord2D(3, 2), False),
         (Coord2D(2, 3), (4, 5), Coord2D(6, 8), False),
         (Coord2D(2, 3), 10, Coord2D(12, 13), False),
+        (Coord2D(2, 3), True, Coord2D(3, 4), False),
+        (Coord2D(2, 3), (1, 2, 3), None, True),
         (Coord2D(2, 3), "invalid", None, True),
         (Coord2D(2, 3), [1, 2], None, True),
         (Coord2D(2, 3), None, None, True),
@@ -41,6 +43,13 @@ def test_sub_2d(a, b, expected, should_fail):
     else:
         assert a - b == expected
 
+
+def test_coord_type_2d():
+    result = Coord2D(1, 2) + (3, 4) - 1
+    assert type(result) is Coord2D
+    assert result.x == 3 and result.y == 5
+    assert {(3, 5): "found"}[result] == "found"
+
 ########## Coord3D ####################
 
 @pytest.mark.parametrize(
@@ -49,6 +58,7 @@ def test_sub_2d(a, b, expected, should_fail):
         (Coord3D(1, 2, 3), Coord3D(4, 5, 6), Coord3D(5, 7, 9), False),
         (Coord3D(1, 2, 3), (4, 5, 6), Coord3D(5, 7, 9), False),
         (Coord3D(1, 2, 3), 10, Coord3D(11, 12, 13), False),
+        (Coord3D(1, 2, 3), False, Coord3D(1, 2, 3), False),
         (Coord3D(1, 2, 3), "invalid", None, True),
         (Coord3D(1, 2, 3), (1, 2), None, True),
         (Coord3D(1, 2, 3), None, None, True),
@@ -79,6 +89,13 @@ def test_sub_3d(a, b, expected, should_fail):
     else:
         assert a - b == expected
 
+
+def test_coord_type_3d():
+    result = Coord3D(1, 2, 3) - (1, 1, 1) + Coord3D(0, 0, 1)
+    assert type(result) is Coord3D
+    assert result.z == 3
+    assert hash(result) == hash((0, 1, 3))
+
 ########## distance ####################
 
 @pytest.mark.parametrize(
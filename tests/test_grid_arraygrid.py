@@ -0,0 +1,91 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aochallenge import print_condensed, save_image
+from aochallenge.grid import *
+from aochallenge.grid.arraygrid import *
+
+
+@pytest.fixture
+def agrid():
+    return ArrayGrid2D([[1, 2, 3], [4, 5, 6]])
+
+
+def test_grid_functions(agrid):
+    assert dimensions_2d(agrid) == Coord2D(3, 2)
+    assert boundaries_2d(agrid) == Coord2D(2, 1)
+    assert get_element_2d(agrid, (1, 1)) == 5
+    set_element_2d(agrid, (2, 0), 9)
+    assert agrid.data[0, 2] == 9
+    assert list(iter_grid_2d(agrid)) == [
+        (Coord2D(0, 0), 1), (Coord2D(1, 0), 2), (Coord2D(2, 0), 9),
+        (Coord2D(0, 1), 4), (Coord2D(1, 1), 5), (Coord2D(2, 1), 6),
+    ]
+
+
+def test_grid_functions_3d():
+    agrid = create_array_grid_3d((2, 3, 4), 0)
+    assert dimensions_3d(agrid) == Coord3D(2, 3, 4)
+    set_element_3d(agrid, (1, 2, 3), 7)
+    assert get_element_3d(agrid, (1, 2, 3)) == 7
+    assert sum(v for _, v in iter_grid_3d(agrid)) == 7
+
+
+def test_create_array_grid():
+    assert create_array_grid_2d((3, 2), ".").tolist() == [[".", ".", "."]] * 2
+    assert create_array_grid_2d([[0, 0], [0, 0]], 5).tolist() == [[5, 5]] * 2
+    assert create_array_grid((1, 1), 0, dtype=np.int8).data.dtype == np.int8
+
+
+def test_invalid_dimensions():
+    with pytest.raises(ValueError):
+        ArrayGrid2D([1, 2, 3])
+    with pytest.raises(ValueError):
+        ArrayGrid3D([[1, 2, 3]])
+
+
+def test_print_condensed(capsys):
+    print_condensed(ArrayGrid2D([list("#."), list(".#")]))
+    assert capsys.readouterr().out == "#.\n.#\n"
+
+
+def test_save_image(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    output_path = tmp_path / "test.png"
+    save_image(output_path, ArrayGrid2D([[0, 1]]), {0: 0x000000, 1: 0xFFFFFF})
+    img = Image.open(output_path)
+    assert img.getpixel((1, 0)) == (255, 255, 255)
+
+
+def test_mask_count(agrid):
+    assert agrid.mask(5).tolist() == [[False, False, False], [False, True, False]]
+    assert ArrayGrid2D([list("#.#"), list("..#")]).count("#") == 3
+
+
+@pytest.mark.parametrize(
+    "connectivity, expected",
+    (
+        (4, [[6, 9, 8], [6, 12, 8]]),
+        (8, [[11, 19, 13], [8, 16, 10]]),
+    ),
+)
+def test_neighbor_sum(agrid, connectivity, expected):
+    assert agrid.neighbor_sum(connectivity).tolist() == expected
+
+
+def test_neighbor_count():
+    agrid = ArrayGrid2D([list("#.#"), list("..#")])
+    assert agrid.neighbor_count("#", 8).tolist() == [[0, 3, 1], [1, 3, 1]]
+
+
+@pytest.mark.parametrize("connectivity, center", ((6, 6), (18, 18), (26, 26)))
+def test_neighbor_sum_3d(connectivity, center):
+    agrid = create_array_grid_3d((3, 3, 3), True)
+    assert agrid.neighbor_sum(connectivity).data[1, 1, 1] == center
+    assert agrid.neighbor_count(True, connectivity).data[1, 1, 1] == center
+
+
+def test_invalid_connectivity(agrid):
+    with pytest.raises(ValueError):
+        agrid.neighbor_sum(6)
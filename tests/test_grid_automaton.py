@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.automaton import *
+
+
+def naive_step_2d(grid, birth, survival, directions):
+    corner = boundaries_2d(grid)
+    result = []
+    for y, row in enumerate(grid):
+        new = []
+        for x, alive in enumerate(row):
+            count = sum(
+                is_within_2d(n, (0, 0), corner) and get_element_2d(grid, n)
+                for n in (Coord2D(x, y) + d for d in directions)
+            )
+            new.append(count in (survival if alive else birth))
+        result.append(new)
+    return result
+
+
+def naive_step_3d(grid, birth, survival):
+    corner = boundaries_3d(grid)
+    result = create_grid_3d(grid, False)
+    for pos, alive in iter_grid_3d(grid):
+        count = sum(
+            is_within_3d(n, (0, 0, 0), corner) and get_element_3d(grid, n)
+            for n in neighbors_full_3d(pos)
+        )
+        set_element_3d(result, pos, count in (survival if alive else birth))
+    return result
+
+
+def test_parse_rule():
+    assert parse_rule("B3/S23") == Rule(frozenset({3}), frozenset({2, 3}))
+    assert parse_rule("s4,6,8-10/b5-7") == Rule(frozenset({5, 6, 7}), frozenset({4, 6, 8, 9, 10}))
+    assert parse_rule("B2") == Rule(frozenset({2}), frozenset())
+    with pytest.raises(ValueError):
+        parse_rule("X3/S23")
+
+
+@pytest.mark.parametrize("engine", (Automaton2D, FrontierAutomaton2D))
+@pytest.mark.parametrize("connectivity", (4, 8))
+def test_life_2d(engine, connectivity):
+    rnd = random.Random(7)
+    grid = [[rnd.random() < 0.4 for _ in range(17)] for _ in range(11)]
+    auto = engine(grid, "B2/S12", connectivity=connectivity)
+    expected = grid
+    for _ in range(5):
+        expected = naive_step_2d(
+            expected, {2}, {1, 2}, neighbors_2d((0, 0)) if connectivity == 4 else neighbors_full_2d((0, 0))
+        )
+    assert auto.step(5).to_grid() == expected
+    assert auto.generation == 5
+    assert auto.count() == sum(map(sum, expected))
+    assert all(get_element_2d(expected, pos) for pos in auto.iter_alive())
+
+
+@pytest.mark.parametrize("engine", (Automaton, FrontierAutomaton))
+def test_table_rule_and_alive(engine):
+    glider = [".#...", "..#..", "###..", ".....", "....."]
+    table = [[c == 3 for c in range(9)], [c in (2, 3) for c in range(9)]]
+    auto = engine(glider, table, alive="#").step(4)
+    assert ["".join(row) for row in auto.to_grid("#", ".")] == [
+        ".....", "..#..", "...#.", ".###.", ".....",
+    ]
+    assert auto.get_element((2, 1)) and not auto.get_element((1, 0))
+    with pytest.raises(ValueError):
+        engine(glider, [[0] * 9], alive="#")
+
+
+@pytest.mark.parametrize("engine", (Automaton3D, FrontierAutomaton3D))
+def test_automaton_3d(engine):
+    rnd = random.Random(3)
+    grid = [[[rnd.random() < 0.3 for _ in range(6)] for _ in range(5)] for _ in range(4)]
+    auto = engine(grid, "B5-7/S4-6")
+    expected = grid
+    for _ in range(3):
+        expected = naive_step_3d(expected, {5, 6, 7}, {4, 5, 6})
+    assert auto.step(3).to_grid() == expected
+    assert auto.count() == sum(v for _, v in iter_grid_3d(expected))
+    assert sorted(auto.iter_alive()) == sorted(p for p, v in iter_grid_3d(expected) if v)
+
+
+def test_frontier():
+    area = ["......", ".##...", ".##...", "......", "...###", "......"]
+    auto = FrontierAutomaton(area, alive="#")
+    assert len(auto.active) == 36
+    auto.step()
+    # Only the blinker changes: its 4 changed cells and their neighbors
+    assert auto.get_element((4, 3)) and not auto.get_element((3, 4))
+    assert len(auto.active) < 36
+    auto.step(2)
+    assert auto.to_grid("#", ".") == Automaton(area, alive="#").step(3).to_grid("#", ".")
+    still = FrontierAutomaton(area[:3], alive="#").step()
+    assert still.active == set()
+    assert still.step(10).count() == 4
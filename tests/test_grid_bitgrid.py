@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.bitgrid import *
+
+GLIDER = [
+    ".#....",
+    "..#...",
+    "###...",
+    "......",
+    "......",
+]
+
+
+def naive_count(grid, connectivity):
+    corner = boundaries_2d(grid)
+    neighbors = bounded_neighbors_2d if connectivity == 4 else bounded_neighbors_full_2d
+    return [
+        [
+            sum(get_element_2d(grid, n) for n in neighbors((x, y), (0, 0), corner))
+            for x in range(len(row))
+        ]
+        for y, row in enumerate(grid)
+    ]
+
+
+def test_from_grid_and_access():
+    bgrid = BitGrid2D.from_grid(GLIDER, "#")
+    assert (bgrid.width, bgrid.height) == (6, 5)
+    assert bgrid.rows[0] == 0b10
+    assert str(bgrid) == "\n".join(GLIDER)
+    assert bgrid.get_element((2, 1)) and not bgrid.get_element((0, 0))
+    bgrid.set_element((5, 4), True)
+    bgrid.set_element((1, 0), False)
+    assert bgrid.count() == 5
+    assert list(bgrid.iter_set())[0] == Coord2D(2, 1)
+    assert bgrid.to_grid("#", ".")[4] == list(".....#")
+    assert create_bit_grid((3, 2)).to_grid() == [[False] * 3] * 2
+
+
+def test_set_operations():
+    a = BitGrid2D([0b0011, 0b0101], 4)
+    b = BitGrid2D([0b0110, 0b0101], 4)
+    assert (a & b).rows == [0b0010, 0b0101]
+    assert (a | b).rows == [0b0111, 0b0101]
+    assert (a ^ b).rows == [0b0101, 0]
+    assert (a - b).rows == [0b0001, 0]
+    assert (~a).rows == [0b1100, 0b1010]
+    assert a.shift(1, 1).rows == [0, 0b0110]
+    assert a.shift(-1, -1).rows == [0b0010, 0]
+    assert a.shift(0, 5).rows == [0, 0]
+
+
+@pytest.mark.parametrize("connectivity", (4, 8))
+def test_neighbor_count(connectivity):
+    rnd = random.Random(1)
+    grid = [[rnd.random() < 0.5 for _ in range(13)] for _ in range(7)]
+    bgrid = BitGrid2D.from_grid(grid)
+    expected = naive_count(grid, connectivity)
+    assert bgrid.neighbor_count(connectivity) == expected
+    twos = bgrid.neighbor_mask({2}, connectivity)
+    assert [c for c, v in iter_grid_2d(expected) if v == 2] == list(twos.iter_set())
+
+
+def test_life_step():
+    bgrid = BitGrid2D.from_grid(GLIDER, "#")
+    for _ in range(4):
+        bgrid = bgrid.life_step()
+    # The glider moved one cell diagonally
+    assert bgrid == BitGrid2D.from_grid(GLIDER, "#").shift(1, 1)
+    with pytest.raises(ValueError):
+        bgrid.count_planes(6)
+
+
+def test_life_step_counts_once(monkeypatch):
+    grid = BitGrid2D.from_grid(["....", ".##.", ".##.", "...."], "#")
+    calls = []
+    count_planes = BitGrid2D.count_planes
+    monkeypatch.setattr(
+        BitGrid2D, "count_planes",
+        lambda self, *args: calls.append(1) or count_planes(self, *args),
+    )
+    assert grid.life_step() == grid
+    assert len(calls) == 1
+
+
+def test_neighbor_count_range():
+    grid = BitGrid2D.from_grid(["...", ".#.", "..."], "#")
+    with pytest.raises(ValueError):
+        grid.neighbor_mask([16])
+    with pytest.raises(ValueError):
+        grid.life_step(birth=(3,), survival=(-1,))
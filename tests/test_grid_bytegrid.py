@@ -0,0 +1,79 @@
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.bytegrid import *
+
+
+@pytest.mark.parametrize(
+    "text",
+    (b"#S.\n..E\n", b"#S.\n..E", b"#S.\r\n..E\r\n", b"#S.\n..E\n\n"),
+)
+def test_layout(text):
+    bgrid = ByteGrid(bytearray(text))
+    assert (bgrid.width, bgrid.height) == (3, 2)
+    assert len(bgrid) == 2
+    assert bytes(bgrid[1]) == b"..E"
+    assert bytes(bgrid[-1]) == b"..E"
+    assert str(bgrid) == "#S.\n..E"
+    assert [bytes(row) for row in bgrid] == [b"#S.", b"..E"]
+
+
+def test_empty_and_ragged():
+    assert len(ByteGrid(bytearray())) == 0
+    with pytest.raises(ValueError):
+        ByteGrid(bytearray(b"abc\nde\n"))
+    with pytest.raises(IndexError):
+        ByteGrid(bytearray(b"abc\n"))[1]
+
+
+def test_elements():
+    bgrid = ByteGrid(bytearray(b"#S.\r\n..E\r\n"))
+    assert get_element_2d(bgrid, (1, 0)) == ord("S")
+    assert bgrid.get_element((2, 1)) == ord("E")
+    set_element_2d(bgrid, (0, 1), ord("#"))
+    bgrid.set_element((1, 0), ord("."))
+    assert str(bgrid) == "#..\n#.E"
+    assert bgrid.find("E") == Coord2D(2, 1)
+    assert bgrid.find(b"S") is None
+    assert bgrid.coord(bgrid.index((2, 1))) == Coord2D(2, 1)
+    assert bgrid.count("#") == 2
+    for pos in ((3, 0), (-1, 1), (0, 2), (0, -1)):
+        with pytest.raises(IndexError):
+            bgrid.get_element(pos)
+        with pytest.raises(IndexError):
+            bgrid.set_element(pos, ord("#"))
+    assert bytes(bgrid.data) == b"#..\r\n#.E\r\n"
+
+
+def test_translate():
+    bgrid = ByteGrid(bytearray(b"12\n34\n"))
+    bgrid.translate(DIGITS)
+    assert bgrid.to_grid() == [[1, 2], [3, 4]]
+    assert byte_table({"#": 1, 46: 0})[ord("#")] == 1
+
+
+@pytest.mark.parametrize("text", (b"abc\ndef\n", b"abc\r\ndef\r\n"))
+def test_line_endings_are_not_cells(text):
+    bgrid = ByteGrid(bytearray(text))
+    bgrid.translate({chr(c): c - ord("a") for c in range(ord("a"), ord("z") + 1)})
+    assert bgrid.to_grid() == [[0, 1, 2], [3, 4, 5]]
+    assert bytes(bgrid.data).count(b"\n") == 2
+    assert bgrid.count(10) == 0
+    assert bgrid.find(10) is None
+    assert bgrid.count(2) == 1
+    bgrid.translate({10: 99, 13: 99})
+    assert bytes(bgrid.data).count(b"\n") == 2
+    assert bgrid.find(bytes((2, 3))) is None  # across rows
+    assert bgrid.find(bytes((4, 5))) == Coord2D(1, 1)
+
+
+def test_mmap_count(tmp_path):
+    import mmap
+
+    path = tmp_path / "grid.txt"
+    path.write_bytes(b"#.#\n..#\n")
+    with open(path, "rb") as f:
+        bgrid = ByteGrid(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+    assert bgrid.count("#") == 3
+    bgrid.translate({"#": 1, ".": 0})
+    assert bgrid.to_grid() == [[1, 0, 1], [0, 0, 1]]
@@ -0,0 +1,70 @@
+import sys
+
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.components import *
+
+GARDEN = [
+    "AAAA",
+    "BBCD",
+    "BBCC",
+    "EEEC",
+]
+
+
+def test_label_components():
+    labeling = label_components(GARDEN)
+    assert labeling.labels == [[1, 1, 1, 1], [2, 2, 3, 4], [2, 2, 3, 3], [5, 5, 5, 3]]
+    summary = [(c.value, c.size, c.perimeter) for c in labeling.components]
+    assert summary == [("A", 4, 10), ("B", 4, 8), ("C", 4, 10), ("D", 1, 4), ("E", 3, 8)]
+    assert labeling.components[2].bounds == (Coord2D(2, 1), Coord2D(3, 3))
+
+
+def test_label_connectivity_and_background():
+    area = ["#..#", ".#..", "...#"]
+    labeling = label_components(area, 8, background=".")
+    assert labeling.labels == [[1, 0, 0, 2], [0, 1, 0, 0], [0, 0, 0, 3]]
+    assert [c.size for c in labeling.components] == [2, 1, 1]
+    assert labeling.components[0].perimeter == 8
+    assert len(label_components(area, 4, ".").components) == 4
+    with pytest.raises(ValueError):
+        label_components(area, 6)
+
+
+def test_label_3d():
+    grid = [[[1, 1], [0, 0]], [[0, 1], [0, 1]]]
+    labeling = label_components_3d(grid, background=0)
+    assert labeling.labels == [[[1, 1], [0, 0]], [[0, 1], [0, 1]]]
+    component = labeling.components[0]
+    assert component.size == 4
+    assert component.bounds == (Coord3D(0, 0, 0), Coord3D(1, 1, 1))
+    assert component.perimeter == 4 * 6 - 2 * 3
+    assert len(label_components_3d([[[1, 0], [0, 1]]], 18, 0).components) == 1
+    assert len(label_components_3d([[[1, 0], [0, 0]], [[0, 0], [0, 1]]], 18, 0).components) == 2
+    assert len(label_components_3d([[[1, 0], [0, 0]], [[0, 0], [0, 1]]], 26, 0).components) == 1
+
+
+def test_flood_fill():
+    assert flood_fill(GARDEN, (2, 1)) == [(2, 1), (2, 2), (3, 2), (3, 3)]
+    assert flood_fill(GARDEN, (0, 0), match=lambda v: v in "AB") == [
+        (0, 0), (1, 0), (2, 0), (3, 0), (0, 1), (1, 1), (0, 2), (1, 2),
+    ]
+    assert flood_fill(GARDEN, (0, 0), match=lambda v: v == "Z") == []
+    grid = [[[0, 0], [1, 0]], [[1, 1], [0, 0]]]
+    assert flood_fill_3d(grid, (0, 0, 0)) == [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 1), (1, 1, 1)]
+    assert len(flood_fill_3d(grid, (0, 1, 0), 18)) == 3
+
+
+def test_large_region_no_recursion():
+    size = 300
+    grid = [[0] * size for _ in range(size)]
+    assert len(flood_fill(grid, (0, 0))) == size * size
+    assert sys.getrecursionlimit() < size * size
+    assert label_components(grid).components[0].perimeter == 4 * size
+
+
+def test_flood_fill_mixed_types():
+    grid = [[1, None, "#"], [1, 2, 1.5]]
+    assert flood_fill_2d(grid, (0, 0)) == [(0, 0), (0, 1)]
+    assert flood_fill_2d(grid, (1, 0)) == [(1, 0)]
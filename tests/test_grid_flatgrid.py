@@ -0,0 +1,95 @@
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.flatgrid import *
+
+GRID = [[1, 2, 3], [4, 5, 6]]
+GRID3D = [[[1, 2], [3, 4]], [[5, 6], [7, 8]], [[9, 10], [11, 12]]]
+
+
+@pytest.mark.parametrize("border", (None, 0))
+def test_index_coord(border):
+    fgrid = FlatGrid2D(GRID, border)
+    for coord, value in iter_grid_2d(GRID):
+        i = fgrid.index(coord)
+        assert fgrid[i] == value
+        assert fgrid.coord(i) == coord
+    assert [v for _, v in fgrid.iter_grid()] == [1, 2, 3, 4, 5, 6]
+    assert fgrid.to_grid() == GRID
+
+
+def test_border():
+    fgrid = FlatGrid2D(GRID, "#")
+    assert len(fgrid) == 5 * 4
+    assert fgrid.cells[:6] == ["#"] * 6
+    assert fgrid.coord(0) == Coord2D(-1, -1)
+    assert fgrid.get_element((2, 1)) == 6
+
+
+@pytest.mark.parametrize(
+    "border, connectivity, coord, expected",
+    (
+        (None, 4, (0, 0), [(1, 0), (0, 1)]),
+        (None, 8, (0, 0), [(1, 0), (0, 1), (1, 1)]),
+        (None, 4, (1, 1), [(0, 1), (2, 1), (1, 0)]),
+        (0, 4, (0, 0), [(1, 0), (0, 1), (-1, 0), (0, -1)]),
+        (0, 8, (2, 1), [
+            (1, 0), (2, 0), (3, 0), (1, 1), (3, 1), (1, 2), (2, 2), (3, 2),
+        ]),
+    ),
+)
+def test_neighbors_2d(border, connectivity, coord, expected):
+    fgrid = FlatGrid2D(GRID, border)
+    neighbors = fgrid.neighbors(fgrid.index(coord), connectivity)
+    assert sorted(fgrid.coord(i) for i in neighbors) == sorted(expected)
+
+
+def test_offsets():
+    fgrid = FlatGrid2D(GRID)
+    assert sorted(fgrid.offsets(4)) == [-3, -1, 1, 3]
+    assert sorted(fgrid.offsets(8)) == [-4, -3, -2, -1, 1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        fgrid.offsets(6)
+
+
+def test_set_element():
+    fgrid = create_flat_grid_2d((3, 2), ".", "#")
+    fgrid.set_element((1, 1), "x")
+    fgrid[fgrid.index((0, 0))] = "y"
+    assert fgrid.to_grid() == [["y", ".", "."], [".", "x", "."]]
+
+
+@pytest.mark.parametrize("border", (None, 0))
+def test_index_coord_3d(border):
+    fgrid = FlatGrid3D(GRID3D, border)
+    for coord, value in iter_grid_3d(GRID3D):
+        i = fgrid.index(coord)
+        assert fgrid[i] == value
+        assert fgrid.coord(i) == coord
+    assert [v for _, v in fgrid.iter_grid()] == list(range(1, 13))
+    assert fgrid.to_grid() == GRID3D
+
+
+@pytest.mark.parametrize(
+    "border, connectivity, expected",
+    (
+        (None, 6, 3),
+        (None, 18, 6),
+        (None, 26, 7),
+        (0, 6, 6),
+        (0, 18, 18),
+        (0, 26, 26),
+    ),
+)
+def test_neighbors_3d(border, connectivity, expected):
+    fgrid = FlatGrid3D(GRID3D, border)
+    neighbors = fgrid.neighbors(fgrid.index((0, 0, 0)), connectivity)
+    assert len(neighbors) == expected
+    for i in neighbors:
+        assert manhattan_3d(fgrid.coord(i), (0, 0, 0)) in (1, 2, 3)
+
+
+def test_create_flat_grid_3d():
+    fgrid = create_flat_grid_3d((2, 1, 3), 0)
+    assert (fgrid.width, fgrid.height, fgrid.depth) == (2, 1, 3)
+    assert fgrid.to_grid() == [[[0, 0]], [[0, 0]], [[0, 0]]]
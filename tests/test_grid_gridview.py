@@ -0,0 +1,87 @@
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.gridview import *
+
+GRID = [
+    [1, 2, 3],
+    [4, 5, 6],
+]
+
+
+def rotate_naive(grid):
+    return [list(row) for row in zip(*grid[::-1])]
+
+
+def test_transforms():
+    v = view(GRID)
+    assert v.materialize() == GRID
+    assert v.transpose().materialize() == [[1, 4], [2, 5], [3, 6]]
+    assert v.rot90().materialize() == rotate_naive(GRID)
+    assert v.rot180().materialize() == [[6, 5, 4], [3, 2, 1]]
+    assert v.rot270().materialize() == [[3, 6], [2, 5], [1, 4]]
+    assert v.flip_x().materialize() == [[3, 2, 1], [6, 5, 4]]
+    assert v.flip_y().materialize() == [[4, 5, 6], [1, 2, 3]]
+    assert v.rotate(-1) == v.rot270()
+    assert v.rotate(4) == GRID
+
+
+def test_composition():
+    grid = [[x + 10 * y for x in range(5)] for y in range(4)]
+    expected = grid
+    v = view(grid)
+    for _ in range(4):
+        v = v.rot90()
+        expected = rotate_naive(expected)
+        assert v.materialize() == expected
+    assert v.transform == (1, 0, 0, 0, 1, 0)
+    assert v.transpose().flip_x() == v.rot90()
+    assert v.flip_x().flip_y() == v.rot180()
+    assert v.transpose().flip_x().rot270().materialize() == grid
+
+
+def test_window():
+    grid = [[x + 10 * y for x in range(5)] for y in range(4)]
+    w = view(grid).window((1, 1), (3, 2))
+    assert w.materialize() == [[11, 12, 13], [21, 22, 23]]
+    assert w.rot90().materialize() == [[21, 11], [22, 12], [23, 13]]
+    assert w.rot90().window((0, 1), (2, 1)).materialize() == [[22, 12]]
+    assert w.grid_coord((0, 0)) == (1, 1)
+    with pytest.raises(IndexError):
+        w.window((2, 0), (2, 2))
+
+
+def test_grid_functions():
+    grid = [list(row) for row in GRID]
+    v = view(grid).rot90()
+    assert dimensions(v) == (2, 3)
+    assert get_element(v, (0, 2)) == 6
+    assert list(iter_grid(v))[:3] == [((0, 0), 4), ((1, 0), 1), ((0, 1), 5)]
+    assert list(v.iter_grid()) == list(iter_grid(v))
+    set_element(v, (1, 2), 0)
+    assert grid == [[1, 2, 0], [4, 5, 6]]
+    v.set_element((0, 0), 9)
+    assert grid[1][0] == 9
+    with pytest.raises(IndexError):
+        v.get_element((2, 0))
+    with pytest.raises(IndexError):
+        v[3]
+
+
+def test_string_rows():
+    v = view(["ab", "cd"]).rot90()
+    assert ["".join(row) for row in v] == ["ca", "db"]
+    assert v[1][0] == "d"
+
+
+def test_non_list_grids():
+    from aochallenge.grid.bytegrid import ByteGrid
+    from aochallenge.grid.zobrist import ZobristGrid2D
+
+    expected = [list(row) for row in zip(*GRID[::-1])]
+    for grid in (ByteGrid(bytes([1, 2, 3, 10, 4, 5, 6, 10])), ZobristGrid2D(GRID)):
+        v = view(grid)
+        assert v.rot90().materialize() == expected
+        assert v.rot270().materialize() == [[3, 6], [2, 5], [1, 4]]
+        assert [list(row) for row in v.transpose()] == [[1, 4], [2, 5], [3, 6]]
+        assert dict(v.transpose().iter_grid())[Coord2D(1, 2)] == 6
@@ -0,0 +1,100 @@
+import pytest
+
+from aochallenge.grid import Coord2D, Coord3D
+from aochallenge.grid.search import *
+
+MAZE = [
+    "#######",
+    "#S..#.#",
+    "#.#.#.#",
+    "#.#...#",
+    "#...#E#",
+    "#######",
+]
+WALL = lambda a, b: b != "#"
+
+WEIGHTS = [
+    [1, 1, 9, 1],
+    [9, 1, 9, 1],
+    [1, 1, 1, 1],
+]
+ENTER = lambda a, b: b
+
+
+@pytest.mark.parametrize("search", (bfs, dijkstra))
+def test_shortest_path(search):
+    result = search(MAZE, (1, 1), (5, 4), passable=WALL)
+    assert result.goal == Coord2D(5, 4)
+    assert result.distance() == 7
+    path = result.path()
+    assert len(path) == 8
+    assert path[0] == Coord2D(1, 1) and path[-1] == Coord2D(5, 4)
+    for a, b in zip(path, path[1:]):
+        assert abs(a.x - b.x) + abs(a.y - b.y) == 1
+        assert MAZE[b.y][b.x] != "#"
+
+
+def test_astar():
+    result = astar(MAZE, (1, 1), (5, 4), passable=WALL)
+    assert result.distance() == 7
+    assert result.path()[-1] == (5, 4)
+
+
+def test_full_search():
+    result = bfs(MAZE, (1, 1), passable=WALL)
+    assert result.goal is None
+    assert result.distance((3, 3)) == 4
+    assert result.distance((0, 0)) is None
+    assert not result.reached((0, 0))
+    assert result.path((0, 0)) == []
+    assert result.distance_grid(-1)[1] == [-1, 0, 1, 2, -1, 8, -1]
+
+
+def test_goal_callable_and_multi_source():
+    result = bfs(MAZE, [(1, 1), (5, 1)], lambda v: v == "E", passable=WALL)
+    assert result.goal == Coord2D(5, 4)
+    assert result.distance() == 3
+    assert result.path()[0] == Coord2D(5, 1)
+
+
+def test_unreachable():
+    result = bfs(MAZE, (1, 1), (5, 4), passable=lambda a, b: b == ".")
+    assert result.goal is None
+    assert result.distance() is None
+    assert result.path() == []
+
+
+@pytest.mark.parametrize("connectivity, expected", ((4, 6), (8, 3)))
+def test_connectivity(connectivity, expected):
+    grid = [[0] * 4 for _ in range(4)]
+    result = bfs(grid, (0, 0), (3, 3), connectivity=connectivity)
+    assert result.distance() == expected
+
+
+@pytest.mark.parametrize("search", (dijkstra, astar))
+def test_weighted(search):
+    result = search(WEIGHTS, (0, 0), (3, 0), cost=ENTER)
+    assert result.distance() == 7
+    assert result.path() == [
+        (0, 0), (1, 0), (1, 1), (1, 2), (2, 2), (3, 2), (3, 1), (3, 0),
+    ]
+
+
+def test_bfs_01():
+    cost = lambda a, b: 1 if b == "#" else 0
+    result = bfs_01(["..#..", "..#..", "..#.."], (0, 0), (4, 0), cost=cost)
+    assert result.distance() == 1
+    grid = ["..#..", "..#..", "....."]
+    result = bfs_01(grid, (0, 0), (4, 0), cost=lambda a, b: 1, passable=WALL)
+    assert result.distance() == 8
+
+
+def test_3d():
+    grid = [[[0] * 3 for _ in range(3)] for _ in range(3)]
+    grid[1][1][1] = 1
+    passable = lambda a, b: b == 0
+    assert bfs_3d(grid, (0, 0, 0), (2, 2, 2), passable=passable).distance() == 6
+    assert bfs_3d(grid, (0, 0, 0), (2, 2, 2), connectivity=26).distance() == 2
+    assert dijkstra_3d(grid, (0, 0, 0), (2, 2, 2), cost=lambda a, b: 2).distance() == 12
+    assert astar_3d(grid, (0, 0, 0), (2, 2, 2), passable=passable).path()[-1] == Coord3D(2, 2, 2)
+    assert bfs_01_3d(grid, (0, 0, 0), (2, 0, 0), cost=lambda a, b: 0).distance() == 0
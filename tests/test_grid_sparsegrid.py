@@ -0,0 +1,79 @@
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.sparsegrid import *
+
+
+def test_get_set_2d():
+    sgrid = SparseGrid2D(".", tile=4)
+    assert sgrid.get_element((1000, -1000)) == "."
+    assert sgrid.bounds is None and sgrid.to_grid() == []
+    sgrid.set_element((-1, -1), "#")
+    sgrid[(5, 2)] = "o"
+    sgrid.set_element((100, 100), ".")  # default: nothing is allocated
+    assert sgrid[(-1, -1)] == "#" and sgrid.get_element((5, 2)) == "o"
+    assert len(sgrid.tiles) == 2
+    assert sgrid.bounds == (Coord2D(-1, -1), Coord2D(5, 2))
+    assert list(sgrid.iter_grid()) == [(Coord2D(-1, -1), "#"), (Coord2D(5, 2), "o")]
+    grid = sgrid.to_grid()
+    assert dimensions_2d(grid) == (7, 4)
+    assert grid[0][0] == "#" and grid[3][6] == "o"
+
+
+def test_from_grid_2d():
+    area = ["#..", ".#.", "..#"]
+    sgrid = SparseGrid2D.from_grid(area, ".", origin=(-1, 10))
+    assert sgrid.get_element((0, 11)) == "#"
+    assert ["".join(row) for row in sgrid.to_grid()] == area
+    assert sgrid.neighbors((0, 0)) == neighbors_2d((0, 0))
+    assert len(sgrid.neighbors((0, 0), 8)) == 8
+
+
+def test_tile_size():
+    with pytest.raises(ValueError):
+        SparseGrid2D(0, tile=10)
+
+
+def test_sparse_3d():
+    sgrid = SparseGrid3D(0, tile=2)
+    cells = {(0, 0, 0): 1, (-3, 2, 5): 2, (1, -1, 1): 3}
+    for pos, value in cells.items():
+        sgrid[pos] = value
+    assert all(sgrid.get_element(pos) == value for pos, value in cells.items())
+    assert dict(sgrid.iter_grid()) == cells
+    assert sgrid.bounds == (Coord3D(-3, -1, 0), Coord3D(1, 2, 5))
+    grid = sgrid.to_grid()
+    assert dimensions_3d(grid) == (5, 4, 6)
+    assert get_element_3d(grid, (0, 3, 5)) == 2
+    assert SparseGrid3D.from_grid(grid, 0, (-3, -1, 0)).to_grid() == grid
+    assert len(sgrid.neighbors((0, 0, 0), 26)) == 26
+
+
+def test_live_bounds_2d():
+    sgrid = SparseGrid2D(".", tile=4)
+    for pos in [(0, 0), (1, 0), (9, 5), (-6, 2)]:
+        sgrid[pos] = "#"
+    sgrid[(1, 0)] = "o"  # non-default to non-default
+    assert len(sgrid.tiles) == 3
+    sgrid[(9, 5)] = "."
+    assert len(sgrid.tiles) == 2  # the emptied tile is freed
+    assert sgrid.bounds == (Coord2D(-6, 0), Coord2D(1, 2))
+    sgrid[(-6, 2)] = "."
+    assert sgrid.bounds == (Coord2D(0, 0), Coord2D(1, 0))
+    assert sgrid.to_grid() == [["#", "o"]]
+    sgrid[(1, 0)] = "."
+    sgrid[(0, 0)] = "."
+    assert sgrid.tiles == {} and sgrid.bounds is None and sgrid.to_grid() == []
+    sgrid[(3, 3)] = "#"
+    assert sgrid.bounds == (Coord2D(3, 3), Coord2D(3, 3))
+
+
+def test_live_bounds_3d():
+    sgrid = SparseGrid3D(0, tile=2)
+    cells = [(0, 0, 0), (-3, 2, 5), (1, -1, 1), (1, 1, 1)]
+    for pos in cells:
+        sgrid[pos] = 1
+    sgrid[(-3, 2, 5)] = 0
+    assert len(sgrid.tiles) == 2
+    assert sgrid.bounds == (Coord3D(0, -1, 0), Coord3D(1, 1, 1))
+    assert dimensions_3d(sgrid.to_grid()) == (2, 3, 2)
@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from aochallenge.grid import *
+from aochallenge.grid.zobrist import *
+
+PLATFORM = [
+    "O....#....",
+    "O.OO#....#",
+    ".....##...",
+    "OO.#O....O",
+    ".O.....O#.",
+    "O.#..O.#.#",
+    "..O..#O..O",
+    ".......O..",
+    "#....###..",
+    "#OO..#....",
+]
+
+
+def test_incremental_fingerprint():
+    grid = ZobristGrid(PLATFORM)
+    start = grid.fingerprint
+    assert start == grid.rehash()
+    grid.set_element((1, 0), "O")
+    assert grid.fingerprint != start
+    assert grid.fingerprint == grid.rehash()
+    grid.set_element((1, 0), ".")
+    assert grid.fingerprint == start
+    grid.set_element((0, 0), "O")  # unchanged
+    assert grid.fingerprint == start
+
+
+def test_same_content_same_fingerprint():
+    rng = random.Random(1)
+    a = ZobristGrid(PLATFORM)
+    b = ZobristGrid([[c for c in row] for row in PLATFORM])
+    for _ in range(200):
+        pos = (rng.randrange(10), rng.randrange(10))
+        value = rng.choice("O.#")
+        a.set_element(pos, value)
+    for pos, value in a.iter_grid():
+        b.set_element(pos, value)
+    assert a.fingerprint == b.fingerprint == b.rehash()
+    assert a.snapshot() == b.snapshot()
+    assert ZobristGrid(PLATFORM, seed=1).fingerprint != ZobristGrid(PLATFORM).fingerprint
+
+
+def test_grid_functions():
+    grid = ZobristGrid(PLATFORM)
+    assert dimensions(grid) == (10, 10)
+    assert get_element(grid, (4, 1)) == "#"
+    assert grid.to_grid() == [list(row) for row in PLATFORM]
+    assert sum(1 for _, v in iter_grid(grid) if v == "O") == 18
+
+
+def test_3d():
+    cube = [[[0, 1], [1, 0]], [[1, 1], [0, 0]]]
+    grid = ZobristGrid3D(cube)
+    start = grid.fingerprint
+    grid.set_element((1, 1, 1), 2)
+    assert grid.get_element((1, 1, 1)) == 2
+    assert grid.fingerprint == grid.rehash() != start
+    grid.set_element((1, 1, 1), 0)
+    assert grid.fingerprint == start
+    assert grid.to_grid() == cube
+    assert dimensions_3d(grid) == (2, 2, 2)
+
+
+def test_writes_through_rows():
+    grid = ZobristGrid(PLATFORM)
+    set_element(grid, (1, 0), "O")
+    grid[2][-1] = "#"
+    assert grid.get_element((9, 2)) == "#"
+    assert grid.fingerprint == grid.rehash()
+    with pytest.raises(TypeError):
+        grid[0][0:2] = "##"
+    with pytest.raises(IndexError):
+        grid[0][10] = "#"
+    assert grid.fingerprint == grid.rehash()
+
+    cube = ZobristGrid3D([[[0, 1], [1, 0]], [[1, 1], [0, 0]]])
+    set_element_3d(cube, (1, 1, 1), 2)
+    cube[0][1][0] = 5
+    assert cube.get_element((0, 1, 0)) == 5
+    assert cube.fingerprint == cube.rehash()
+    assert [list(row) for row in cube[1]] == [[1, 1], [0, 2]]
@@ -28,3 +28,88 @@ def test_create_test_image(grid, lut, image, tmp_path):
             color = image[y][x]
             expected = (color >> 16, (color >> 8) & 0xff, color & 0xff)
             assert img.getpixel((x, y)) == expected
+
+
+def test_scale(tmp_path):
+    output_path = tmp_path / "scaled.png"
+    save_image(output_path, ["#.", ".#"], {".": 0x000000, "#": 0xffffff}, scale=3)
+    img = Image.open(output_path)
+    assert img.size == (6, 6)
+    assert img.getpixel((2, 2)) == (255, 255, 255)
+    assert img.getpixel((3, 2)) == (0, 0, 0)
+    assert img.getpixel((5, 5)) == (255, 255, 255)
+
+
+def test_many_colors(tmp_path):
+    output_path = tmp_path / "rgb.png"
+    colors = {i: i * 0x010203 % 0x1000000 for i in range(300)}
+    grid = [[x + 20 * y for x in range(20)] for y in range(15)]
+    save_image(output_path, grid, colors)
+    img = Image.open(output_path)
+    assert img.mode == "RGB"
+    color = colors[grid[14][19]]
+    assert img.getpixel((19, 14)) == (color >> 16, (color >> 8) & 0xff, color & 0xff)
+
+
+def rgb(color):
+    return (color >> 16, (color >> 8) & 0xff, color & 0xff)
+
+
+@pytest.mark.parametrize("deltas", [True, False])
+def test_animation(deltas, tmp_path):
+    from PIL import ImageSequence
+    from aochallenge import AnimationWriter
+
+    colors = {".": 0x000000, "#": 0xff0000, "o": 0x00ff00}
+    grid = [list("....."), list("....."), list("....."), list(".....")]
+    frames = []
+    output_path = str(tmp_path / "test.gif")
+    with AnimationWriter(output_path, colors, scale=2, deltas=deltas, maxqueue=2) as animation:
+        for i in range(12):
+            grid[i % 4][i % 5] = "#" if i % 2 else "o"
+            frames.append([row.copy() for row in grid])
+            animation.add(grid)
+    assert animation.frames == 12
+
+    img = Image.open(output_path)
+    assert img.n_frames == 12
+    assert img.size == (10, 8)
+    for frame, expected in zip(ImageSequence.Iterator(img), frames):
+        frame = frame.convert("RGB")
+        for y, row in enumerate(expected):
+            for x, value in enumerate(row):
+                assert frame.getpixel((2 * x + 1, 2 * y)) == rgb(colors[value])
+
+
+def test_animation_sequence(tmp_path):
+    from aochallenge import AnimationWriter
+
+    colors = {0: 0x123456, 1: 0xabcdef}
+    with AnimationWriter(str(tmp_path / "frame{:02}.png"), colors) as animation:
+        for i in range(3):
+            animation.add([[i == 0, i == 1, i == 2]])
+    for i in range(3):
+        img = Image.open(tmp_path / f"frame{i:02}.png")
+        assert img.getpixel((i, 0)) == rgb(0xabcdef)
+        assert img.getpixel(((i + 1) % 3, 0)) == rgb(0x123456)
+
+
+def test_animation_errors(tmp_path):
+    from aochallenge import AnimationWriter
+
+    with pytest.raises(ValueError):
+        AnimationWriter(str(tmp_path / "a.gif"), {i: i for i in range(300)})
+    with pytest.raises(ValueError):
+        AnimationWriter(str(tmp_path / "a.png"), {0: 0})
+    animation = AnimationWriter(str(tmp_path / "a.gif"), {0: 0})
+    with pytest.raises(KeyError):
+        animation.add([[1]])
+    animation.close()
+    animation = AnimationWriter(str(tmp_path / "missing" / "a.gif"), {0: 0}, maxqueue=1)
+    for _ in range(5):
+        try:
+            animation.add([[0]])
+        except OSError:
+            break
+    with pytest.raises(OSError):
+        animation.close()
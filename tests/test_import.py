@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget of the package facade in microseconds
+IMPORT_BUDGET_US = 150_000
+
+
+def import_times(statement):
+    """Run statement in a fresh interpreter with `-X importtime` and return
+    the cumulative import time (us) of each module imported, and the total
+    time spent on top-level imports of the package"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        times[module.strip()] = int(cumulative)
+        # nested imports are indented and already included by their parent
+        if module.startswith(" aochallenge"):
+            total += int(cumulative)
+    return times, total
+
+
+def test_star_import_does_not_load_pil():
+    times, _ = import_times("from aochallenge import *")
+    assert "PIL" not in times
+    assert "aochallenge.image" in times
+
+
+def test_import_is_lazy():
+    times, _ = import_times("import aochallenge")
+    assert "aochallenge" in times
+    assert "aochallenge.grid" not in times
+    assert "aochallenge.image" not in times
+
+
+def test_star_import_names():
+    namespace = {}
+    exec("from aochallenge import *", namespace)
+    for name in (
+        "Solver", "Solution", "load", "variant", "print_condensed",
+        "print_csv", "print_arranged", "print_solution", "save_image",
+        "grid", "sys", "re", "cache", "lru_cache", "combinations", "count",
+        "product", "Callable", "cast", "NamedTuple", "Generator",
+        "dataclass", "field", "copy", "deepcopy",
+    ):
+        assert name in namespace
+
+
+def test_unknown_attribute():
+    import aochallenge
+
+    with pytest.raises(AttributeError):
+        aochallenge.nonexistent
+
+
+def test_import_time_budget():
+    # Best of a few runs to smooth out noise of a cold interpreter
+    best = min(
+        import_times("from aochallenge import *")[1]
+        for _ in range(3)
+    )
+    assert best < IMPORT_BUDGET_US
@@ -3,7 +3,7 @@ import pathlib
 import pytest
 import sys
 
-from aochallenge import load, variant
+from aochallenge import load, load_grid, load_iter, variant
 
 
 @pytest.fixture
@@ -24,6 +24,7 @@ INPUTS = {
     "float": "1.2::2.3::3.4\n4.5::5.6::6.7\n",
     "mixed": "row1,45,6.9,3.4\nrow2,78,7.9,4.2\n",
     "inttype": 123456,
+    "pairs": "1,a\n2,b,c\n3\n",
 }
 
 
@@ -36,6 +37,9 @@ INPUTS = {
         ([], (True, ",", int), [[1, 2, 3, 4]]),
         (["col"], (True,), ["1", "2", "3", "4"]),
         (["col"], (True, None, int), [1, 2, 3, 4]),
+        (["col"], (True, None, (str, int)), ["1", 2, 3, 4]),
+        (["int"], (True, " ", [float]), [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]),
+        (["int"], (True, " ", ()), [["1", "2", "3"], ["4", "5", "6"]]),
         (["int"], (False,), "1 2 3\n4 5 6\n"),
         (["int"], (True, " "), [["1", "2", "3"], ["4", "5", "6"]]),
         (["int"], (True, " ", int), [[1, 2, 3], [4, 5, 6]]),
@@ -51,6 +55,17 @@ INPUTS = {
             (True, ",", (str, int, float)),
             [["row1", 45, 6.9, 3.4], ["row2", 78, 7.9, 4.2]],
         ),
+        (
+            ["pairs"],
+            (True, ",", (int, str)),
+            [[1, "a"], [2, "b", "c"], [3, "None"]],
+        ),
+        (
+            ["mixed"],
+            (True, ",", (str, int, float, float)),
+            [["row1", 45, 6.9, 3.4], ["row2", 78, 7.9, 4.2]],
+        ),
+        (["pairs"], (True, ",", (int, str, str)), [[1, "a", "None"], [2, "b", "c"], [3, "None", "None"]]),
         (["inttype"], tuple(), 123456),
     ),
 )
@@ -93,12 +108,141 @@ def test_load_file_not_found(argv):
         load(True, ",", int, filename=filename)
 
 
+def test_load_empty_record(argv):
+    def records():
+        yield load(False, ",", int, lut={None: ""})
+
+    with pytest.raises(IndexError):
+        next(records())
+
+
+INTS = {
+    None: "move 3 from -1 to 2\nskip\nx=10,y=-20",
+    "grid": "1 2\n3 -4\n",
+}
+
+
+@pytest.mark.parametrize(
+    "args, splitlines, expected",
+    (
+        ([], False, [3, -1, 2, 10, -20]),
+        ([], True, [[3, -1, 2], [], [10, -20]]),
+        (["grid"], True, [[1, 2], [3, -4]]),
+    ),
+)
+def test_load_ints(args, splitlines, expected, argv):
+    sys.argv.extend(args)
+    assert load(splitlines, ints=True, lut=INTS) == expected
+
+
+def test_load_ints_array(argv):
+    values = load(ints="array", lut=INTS)
+    assert values.typecode == "q"
+    assert values.tolist() == [3, -1, 2, 10, -20]
+    values, offsets = load(True, ints="array", lut=INTS)
+    assert values.tolist() == [3, -1, 2, 10, -20]
+    assert offsets.tolist() == [0, 3, 3, 5]
+
+
+def test_load_ints_numpy(argv):
+    pytest.importorskip("numpy")
+    assert load(ints="numpy", lut=INTS).tolist() == [3, -1, 2, 10, -20]
+    with pytest.raises(ValueError):
+        load(True, ints="numpy", lut=INTS)
+    sys.argv.append("grid")
+    assert load(True, ints="numpy", lut=INTS).tolist() == [[1, 2], [3, -4]]
+
+
+def test_load_ints_invalid(argv):
+    with pytest.raises(ValueError):
+        load(True, ",", ints=True, lut=INTS)
+    with pytest.raises(ValueError):
+        load(ints="tuple", lut=INTS)
+
+
+@pytest.mark.parametrize(
+    "args, params, data",
+    (
+        ([], (","), [["1", "2", "3", "4"]]),
+        ([], (",", int), [[1, 2, 3, 4]]),
+        (["col"], (), ["1", "2", "3", "4"]),
+        (["col"], (None, int), [1, 2, 3, 4]),
+        (["col"], (None, (str, int)), ["1", 2, 3, 4]),
+        (["int"], (" ", int), [[1, 2, 3], [4, 5, 6]]),
+        (["char"], ("", int), [[1, 2, 3], [4, 5, 6]]),
+        (["float"], ("::", float), [[1.2, 2.3, 3.4], [4.5, 5.6, 6.7]]),
+        (
+            ["mixed"],
+            (",", (str, int, float)),
+            [["row1", 45, 6.9, 3.4], ["row2", 78, 7.9, 4.2]],
+        ),
+        (["inttype"], tuple(), [123456]),
+    ),
+)
+def test_load_iter(args, params, data, argv):
+    sys.argv.extend(args)
+    records = load_iter(*params, lut=INPUTS)
+    assert not isinstance(records, list)
+    assert list(records) == data
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+@pytest.mark.parametrize(
+    "args, expected",
+    (
+        ([], [[11, 12, 13], [14, 15, 16]]),
+        (["-t"], [[21, 22, 23], [24, 25, 26]]),
+    ),
+)
+def test_load_iter_file(args, expected, use_mmap, argv):
+    sys.argv.extend(args)
+    assert list(load_iter(",", int, use_mmap=use_mmap)) == expected
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+def test_load_iter_line_endings(use_mmap, tmp_path):
+    filename = tmp_path / "input.txt"
+    filename.write_bytes(b"ab\r\ncd\n\nef")
+    assert list(load_iter(filename=str(filename), use_mmap=use_mmap)) == [
+        "ab", "cd", "", "ef"
+    ]
+    filename.write_bytes(b"")
+    assert list(load_iter(filename=str(filename), use_mmap=use_mmap)) == []
+
+
+def test_load_iter_file_not_found(argv):
+    with pytest.raises(FileNotFoundError):
+        list(load_iter(",", int, filename="nonexistent_file.txt"))
+
+
+def test_load_grid(argv):
+    bgrid = load_grid(lut=INPUTS | {"-t": "12\n34"}, translate={"1": 0})
+    assert str(bgrid) == "\x00,2,3,4"
+    sys.argv.append("-t")
+    bgrid = load_grid(lut=INPUTS | {"-t": "12\n34"}, translate={"1": 0})
+    assert bgrid.to_grid() == [[0, ord("2")], [ord("3"), ord("4")]]
+
+
+@pytest.mark.parametrize("use_mmap", (False, True))
+def test_load_grid_file(use_mmap, tmp_path):
+    filename = tmp_path / "input.txt"
+    filename.write_bytes(b"#S\r\n.E\r\n")
+    bgrid = load_grid(filename=str(filename), use_mmap=use_mmap)
+    assert bgrid.find("E") == (1, 1)
+    bgrid.set_element((1, 0), ord("."))
+    assert str(bgrid) == "#.\n.E"
+    assert filename.read_bytes() == b"#S\r\n.E\r\n"
+    filename.write_bytes(b"")
+    assert len(load_grid(filename=str(filename), use_mmap=use_mmap)) == 0
+
+
 @pytest.mark.parametrize(
     "args, expected",
     (
         ([], None),
         (["-t"], "-t"),
         (["--test"], "--test"),
+        (["--no-cache", "-t"], "-t"),
     ),
 )
 def test_variant(args, expected, argv):
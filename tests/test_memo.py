@@ -0,0 +1,159 @@
+import pytest
+
+from aochallenge import Solver, memoize
+from aochallenge.grid import Coord2D
+from aochallenge.memo import memo_stats, normalize_key
+
+
+def test_memoize_unbounded():
+    @memoize
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    assert fib(80) == 23416728348467685
+    info = fib.cache_info()
+    assert (info.misses, info.hits, info.evictions, info.size) == (81, 78, 0, 81)
+    assert fib.__name__ == "fib"
+    fib.cache_clear()
+    assert fib.cache_info().size == 0
+
+
+def test_memoize_lru():
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    for x in (1, 2, 1, 3, 2, 1):
+        square(x)
+    # 3 evicts 2 (1 was used more recently), then 2 evicts 1
+    assert calls == [1, 2, 3, 2, 1]
+    assert square.cache_info().evictions == 3
+
+
+def test_memoize_lfu():
+    calls = []
+
+    @memoize(maxsize=2, policy="lfu")
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    for x in (1, 1, 2, 3, 1, 2):
+        square(x)
+    # 3 evicts 2 (used once), 2 evicts 3
+    assert calls == [1, 2, 3, 2]
+    with pytest.raises(ValueError):
+        memoize(policy="fifo")(abs)
+
+
+def test_memoize_maxmemory():
+    @memoize(maxmemory=10_000)
+    def block(n):
+        return bytes(1000 + n)
+
+    for n in range(20):
+        block(n)
+    info = block.cache_info()
+    assert info.memory <= 10_000
+    assert 0 < info.size < 20
+    assert info.evictions == 20 - info.size
+
+
+def test_memoize_normalize():
+    @memoize(normalize=True)
+    def total(grid, start, **kwargs):
+        return sum(map(sum, grid)) + start[0] + len(kwargs)
+
+    assert total([[1, 2], [3, 4]], Coord2D(1, 0)) == 11
+    assert total(((1, 2), (3, 4)), (1, 0)) == 11
+    assert total([[1, 2], [3, 4]], (1, 0), x={1, 2}) == 12
+    assert total.cache_info().hits == 1
+    assert normalize_key({"a": [1, {2}]}) == frozenset({("a", (1, frozenset({2})))})
+
+
+def test_memoize_disk(tmp_path):
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    memoized = memoize(maxsize=1, disk=str(tmp_path / "memo"))(square)
+    assert [memoized(x) for x in (1, 2, 1, 2)] == [1, 4, 1, 4]
+    assert calls == [1, 2]
+    assert memoized.cache_info().disk_hits == 2
+    memoized.close()
+
+
+def test_memoize_method():
+    class Counter:
+        def __init__(self, base):
+            self.base = base
+
+        @memoize
+        def add(self, x):
+            return self.base + x
+
+    a, b = Counter(10), Counter(20)
+    assert (a.add(1), b.add(1), a.add(1)) == (11, 21, 11)
+    assert Counter.add.cache_info().hits == 1
+
+
+def test_memo_stats_in_main(capsys):
+    @memoize
+    def reported(n):
+        return n
+
+    class MySolution(Solver):
+        def part1(self):
+            return reported(1) + reported(1)
+
+    MySolution().main(stats="time")
+    captured = capsys.readouterr()
+    assert captured.out == "1: 2\n"
+    assert "memoize test_memo_stats_in_main.<locals>.reported: 1 hits, 1 misses" in captured.err
+    assert any(stats.name.endswith("reported") for stats in memo_stats())
+
+
+def test_memoize_disk_scope(tmp_path):
+    base = [10]
+
+    def add(x):
+        return base[0] + x
+
+    filename = str(tmp_path / "memo")
+    memoized = memoize(maxsize=1, disk=filename)(add)
+    assert [memoized(x) for x in (1, 2)] == [11, 12]
+    memoized.close()
+    # A new run (or a cleared cache) does not see the old entries
+    base[0] = 20
+    memoized = memoize(maxsize=1, disk=filename)(add)
+    assert [memoized(x) for x in (1, 2, 1)] == [21, 22, 21]
+    base[0] = 30
+    memoized.cache_clear()
+    assert [memoized(x) for x in (1, 2, 1)] == [31, 32, 31]
+    assert memoized.cache_info().disk_hits == 1
+    memoized.close()
+
+
+def test_memoize_disk_unstable_keys(tmp_path):
+    class Point:
+        def __init__(self, x):
+            self.x = x
+
+    calls = []
+
+    def value(point, scale=1):
+        calls.append(point)
+        return point.x * scale if isinstance(point, Point) else point * scale
+
+    memoized = memoize(maxsize=1, disk=str(tmp_path / "memo"))(value)
+    p, q = Point(1), Point(2)
+    assert [memoized(p), memoized(q), memoized(p)] == [1, 2, 1]
+    assert memoized.cache_info().disk_hits == 0
+    assert [memoized(3, scale=2), memoized(4, scale=2), memoized(3, scale=2)] == [6, 8, 6]
+    assert memoized.cache_info().disk_hits == 1
+    memoized.close()
@@ -0,0 +1,133 @@
+import os
+import pathlib
+import pytest
+import sys
+
+from aochallenge import Solver, load
+from aochallenge.input import loaded_inputs
+from aochallenge.resultcache import ResultCache
+
+INPUTS = {None: "1,2,3", "-t": "4,5,6"}
+calls = []
+
+
+class CachedSolution(Solver):
+    cache_results = True
+
+    def __init__(self):
+        self.data = load(False, ",", int, lut=INPUTS)
+
+    def part1(self):
+        calls.append(1)
+        return sum(self.data)
+
+    def part2(self):
+        calls.append(2)
+        return max(self.data)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("AOC_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(sys, "argv", [str(pathlib.Path(__file__))])
+    calls.clear()
+    return tmp_path
+
+
+def test_cached_parts(cache_dir, capsys):
+    CachedSolution().main()
+    CachedSolution().main()
+    assert capsys.readouterr().out == "1: 6\n2: 3\n" * 2
+    assert calls == [1, 2]
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+
+def test_cache_key(cache_dir, capsys):
+    CachedSolution().main()
+    sys.argv.append("-t")
+    CachedSolution().main()
+    sys.argv.append("--no-cache")
+    CachedSolution().main()
+    assert capsys.readouterr().out == "1: 6\n2: 3\n" + "1: 15\n2: 6\n" * 2
+    assert calls == [1, 2] * 3
+
+
+def test_cache_disabled(cache_dir, monkeypatch, capsys):
+    monkeypatch.setattr(CachedSolution, "cache_results", False)
+    CachedSolution().main()
+    assert not list(cache_dir.glob("*.pickle"))
+    monkeypatch.setenv("AOC_CACHE", "1")
+    CachedSolution().main()
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+
+
+def test_eviction(tmp_path):
+    cache = ResultCache(str(tmp_path), maxsize=2500)
+    for i in range(4):
+        cache.put(f"key{i}", bytes(1000))
+        os.utime(tmp_path / f"key{i}.pickle", (i, i))
+    assert cache.get("key0") is None
+    assert cache.get("key2") == bytes(1000)
+    cache.put("key4", bytes(1000))
+    assert sorted(p.stem for p in tmp_path.glob("*.pickle")) == ["key2", "key4"]
+    cache.put("unpicklable", lambda: None)
+    assert cache.get("unpicklable", 42) == 42
+    cache.clear()
+    assert not list(tmp_path.glob("*.pickle"))
+
+
+SOLUTION = """
+from aochallenge import Solver
+
+class Solution(Solver):
+    def part1(self):
+        return {value}
+
+    def part2(self):
+        return self.part1() * 2
+"""
+
+
+def test_cache_key_depends_on_earlier_parts(tmp_path, monkeypatch):
+    import importlib
+    import linecache
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = tmp_path / "cached_solution.py"
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    def keys(value, factor="2"):
+        module.write_text(SOLUTION.format(value=value).replace("* 2", f"* {factor}"))
+        sys.modules.pop("cached_solution", None)
+        linecache.clearcache()
+        solution = importlib.import_module("cached_solution").Solution
+        return cache.key(solution(), "part1"), cache.key(solution(), "part2")
+
+    key1, key2 = keys(10)
+    edited1, edited2 = keys(11)
+    assert key1 != edited1 and key2 != edited2
+    later1, later2 = keys(11, factor="3")
+    assert later1 == edited1 and later2 != edited2
+
+
+class SelfLoadingSolution(Solver):
+    cache_results = True
+
+    def part1(self):
+        calls.append(1)
+        return load(False, ",", int)[0]
+
+
+def test_cache_key_of_parts_loading_input(cache_dir, capsys):
+    SelfLoadingSolution().main()
+    sys.argv.append("-t")
+    SelfLoadingSolution().main()
+    SelfLoadingSolution().main()
+    assert capsys.readouterr().out == "1: 11\n" + "1: 21\n" * 2
+    assert calls == [1, 1]
+
+
+def test_inputs_of_earlier_solvers(cache_dir):
+    load(lut=INPUTS)
+    SelfLoadingSolution()
+    assert loaded_inputs() == []
@@ -1,8 +1,11 @@
+import json
+import os
 import pathlib
 import pytest
 import sys
+import time
 
-from aochallenge import Solver, Solution
+from aochallenge import Solver, Solution, independent
 
 
 # TEST SOLVER
@@ -35,6 +38,94 @@ def test_solver_more(capsys):
     assert captured.out == expected
 
 
+class Parts(Solver):
+    def part1(self):
+        return 42
+
+    def part2(self):
+        return [0] * 100_000
+
+
+def test_solver_instrumentation(capsys, tmp_path, monkeypatch):
+    monkeypatch.delenv("AOC_STATS", raising=False)
+    report = tmp_path / "report.json"
+    Parts().main(stats="time,memory", profile=str(tmp_path / "prof"), report=str(report))
+    captured = capsys.readouterr()
+    assert captured.out.startswith("1: 42\n2: [0, 0")
+    assert captured.err.count("wall") == 2
+    assert "peak memory" in captured.err
+    assert (tmp_path / "prof" / "part1.prof").is_file()
+    assert (tmp_path / "prof" / "part2.prof").is_file()
+    Parts().main(report=str(report))
+    runs = [json.loads(line) for line in report.read_text().splitlines()]
+    assert len(runs) == 2
+    assert [part["result"] for part in runs[0]["parts"]][0] == "42"
+    assert runs[0]["parts"][1]["peak_memory"] >= 800_000
+    assert runs[1]["parts"][1]["peak_memory"] is None
+    assert runs[1]["parts"][0]["cpu"] >= 0
+
+
+def test_solver_instrumentation_env(capsys, monkeypatch):
+    monkeypatch.setenv("AOC_STATS", "time")
+    Parts().main()
+    captured = capsys.readouterr()
+    assert captured.err.count("wall") == 2
+    assert "peak memory" not in captured.err
+    monkeypatch.setenv("AOC_STATS", "speed")
+    with pytest.raises(ValueError):
+        Parts().main()
+
+
+class ParallelParts(Solver):
+    parallel = True
+
+    def __init__(self):
+        self.data = [1, 2, 3]
+
+    @independent
+    def part1(self):
+        start = time.time()
+        time.sleep(0.5)
+        return sum(self.data), os.getpid(), start, time.time()
+
+    @independent
+    def part2(self):
+        start = time.time()
+        time.sleep(0.5)
+        return max(self.data), os.getpid(), start, time.time()
+
+    def part3(self):
+        start = time.time()
+        time.sleep(0.5)
+        return 0, os.getpid(), start, time.time()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+def test_solver_parallel(capsys, monkeypatch):
+    monkeypatch.delenv("AOC_STATS", raising=False)
+    ParallelParts().main()
+    results = capsys.readouterr().out.splitlines()
+    assert [line[:3] for line in results] == ["1: ", "2: ", "3: "]
+    parts = [eval(line[3:]) for line in results]
+    assert [value for value, *_ in parts] == [6, 3, 0]
+    pids = [pid for _, pid, *_ in parts]
+    assert pids[2] == os.getpid() and os.getpid() not in pids[:2]
+    # All the parts overlap, part3 does not wait for the others
+    latest_start = max(start for *_, start, _ in parts)
+    earliest_end = min(end for *_, end in parts)
+    assert latest_start < earliest_end
+
+
+def test_solver_parallel_stats(capsys, monkeypatch):
+    monkeypatch.setenv("AOC_PARALLEL", "1")
+    Parts().main(stats="time")
+    captured = capsys.readouterr()
+    assert captured.out.startswith("1: 42\n")
+    assert captured.err.count("wall") == 2
+    ParallelParts().main(stats="time", parallel=False)
+    assert capsys.readouterr().err.count("wall") == 3
+
+
 # TEST (DEPRECATED) SOLUTION
 
 @pytest.fixture